@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Compact data/daily_filings.csv by removing duplicate businesses.
+
+scrape_daily.py only appends to the file (it skips GUIDs it has already
+saved), so duplicates only appear if two runs overlap or the file was
+edited by hand. Run this occasionally (e.g. weekly) to clean it up.
+"""
+
+import os
+import sys
+import pandas as pd
+from pathlib import Path
+
+sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+
+def compact_daily_filings(input_file='data/daily_filings.csv'):
+    """Drop duplicate file_numbers (keeping the latest row) in place."""
+
+    input_path = Path(input_file)
+    if not input_path.exists():
+        print(f"{input_path} not found.")
+        return
+
+    df = pd.read_csv(input_path, dtype=str, keep_default_na=False)
+    original_count = len(df)
+    df = df.drop_duplicates(subset=['file_number'], keep='last')
+
+    if len(df) == original_count:
+        print(f"No duplicates in {input_path} ({original_count:,} records)")
+        return
+
+    # Write to a temporary file and rename it over the original, so an
+    # interrupted run can't leave a half-written CSV behind
+    tmp_path = input_path.with_name(input_path.name + '.tmp')
+    df.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, input_path)
+
+    print(f"Removed {original_count - len(df):,} duplicate records "
+          f"({len(df):,} left) from {input_path}")
+
+
+if __name__ == '__main__':
+    compact_daily_filings(*sys.argv[1:2])
@@ -4,22 +4,95 @@
 START_FILE_NUMBER = 1
 MAX_CONSECUTIVE_MISSES = 100  # Stop after this many not-found in a row
 
+# Gap jumping for sparse ranges: after GAP_JUMP_AFTER misses in a row, skip
+# ahead, doubling the step (up to GAP_JUMP_MAX) after every further miss. When
+# a jump lands on a business, the skipped gap is bisected for the first
+# filing and scanning continues one by one from there. Numbers skipped before
+# that first filing are assumed empty, and MAX_CONSECUTIVE_MISSES counts
+# probes rather than file numbers. (0 = always scan one by one)
+GAP_JUMP_AFTER = 0
+GAP_JUMP_MAX = 1024
+
 # Rate limiting
 REQUEST_DELAY = 1.5  # Base delay between requests (seconds)
 DELAY_JITTER = 0.5   # Random jitter added to delay (0 to this value)
+MISS_DELAY_FACTOR = 0.2  # Misses only wait this fraction of REQUEST_DELAY
+
+# Concurrency
+# run() keeps scrapes for the next SCRAPE_AHEAD file numbers going, at most
+# MAX_CONCURRENCY at a time. Each concurrent scrape gets its own page (and
+# browser context) from a pool of MAX_CONCURRENCY pages.
+MAX_CONCURRENCY = 4
+SCRAPE_AHEAD = 10
+
+# Name searches each search_by_name_parallel.py worker runs at once, each on
+# its own page (the business details still go through the scraper's pool)
+NAME_SEARCH_CONCURRENCY = 4
+
+# Pin each mn_scraper_parallel worker process to its own CPU (Linux only).
+# The worker's browser is started from the worker, so it is pinned to the
+# same CPU - only worth trying with at least as many cores as workers.
+PIN_WORKERS = False
 
 # Browser settings
 HEADLESS = True  # Run browser invisibly
 TIMEOUT = 30000  # Page timeout in milliseconds
+RESULTS_TIMEOUT = 10000  # ms to wait for search results / details to appear
+BLOCK_RESOURCES = True  # Don't download images/fonts/CSS/media/beacons/analytics (used by all browser scripts)
+CONTEXT_ROTATE_EVERY = 500  # Replace a page's browser context after this many uses (0 = never)
+
+# Cookies/session saved when the browser closes and loaded into every new
+# context, so the next run starts with the portal session already set up.
+# mn_scraper_parallel.py workers each use their own copy
+# (storage_state_worker_N.json). (None = start every run with an empty session)
+STORAGE_STATE_FILE = "storage_state.json"
+
+# Connect to an already running Chromium instead of launching one, e.g.
+# "http://localhost:9222" for a browser started with --remote-debugging-port=9222
+# (None = launch a new browser each run)
+BROWSER_CDP_URL = None
+
+# Business details fetched per second by name searches (GUID lookups), shared
+# by all their concurrent lookups (0 = no limit)
+DETAIL_RATE = 4
 
 # Retry settings
 MAX_RETRIES = 3
-RETRY_DELAY = 5  # Seconds to wait before retry
+RETRY_DELAY = 5  # Seconds to wait before the first retry (doubles after each)
+RETRY_MAX_DELAY = 30  # Longest wait between retries
 
 # Output settings
 OUTPUT_DIR = "output"
 OUTPUT_FILE = "businesses.csv"
 PROGRESS_FILE = "progress.json"
+PROGRESS_EVERY = 100     # Save progress every this many file numbers
+PROGRESS_SAVE_SECONDS = 5  # Parallel workers save progress at most this often
+COMPRESS_OUTPUT = False  # Write OUTPUT_FILE as gzip (businesses.csv.gz)
+CSV_FLUSH_EVERY = 50     # Buffer this many rows before writing them out
+CSV_FLUSH_SECONDS = 10   # ...or write them once the oldest has waited this long
 
 # URL
 BASE_URL = "https://mblsportal.sos.mn.gov/Business/Search"
+DETAILS_URL = "https://mblsportal.sos.mn.gov/Business/SearchDetails"
+
+# Fetch details pages by GUID over plain HTTP and parse the HTML directly,
+# using the browser only as a fallback
+HTTP_DETAILS = True
+
+# Direct details lookup: try DETAILS_URL?fileNumber=N before the search form.
+# Saves 2-3 page loads per business, but the query parameter is not yet
+# confirmed on the live portal - turn on once a few lookups are verified.
+DIRECT_DETAILS_LOOKUP = False
+DIRECT_DETAILS_TIMEOUT = 3000  # ms to wait for the details page markup
+
+# HTTP search: capture the search form (including its anti-forgery token) once
+# per page, then submit every file number search as a plain HTTP request and
+# fetch the details page the same way. The name searches (search_by_name*.py,
+# scrape_daily.py) do the same with the business name form. Falls back to the
+# browser whenever a response isn't recognized. Not yet verified against the
+# live portal.
+HTTP_SEARCH = False
+
+# Daemon mode (python mn_scraper.py --daemon): keep the browser running and
+# take scrape requests over this Unix socket
+DAEMON_SOCKET = "scraper.sock"
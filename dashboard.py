@@ -416,7 +416,9 @@ def load_progress_files():
     """
     Load progress information from worker progress files.
 
-    Looks for files matching pattern: progress_alpha_worker_*.json
+    Looks for files matching pattern: progress_alpha_worker_*.json (the
+    summary each worker writes when it stops) and progress_alpha_worker_*.jsonl
+    (the log it appends to after every pattern, for a running worker).
 
     RETURNS:
     --------
@@ -429,20 +431,43 @@ def load_progress_files():
     # Find all progress files
     for i in range(20):  # Check workers 0-19
         progress_file = PROGRESS_DIR / f'progress_alpha_worker_{i}.json'
-        if progress_file.exists():
-            try:
+        progress_log = PROGRESS_DIR / f'progress_alpha_worker_{i}.jsonl'
+        if not progress_file.exists() and not progress_log.exists():
+            continue
+        try:
+            data = {}
+            if progress_file.exists():
                 with open(progress_file, 'r') as f:
                     data = json.load(f)
-                    workers.append({
-                        'id': i,
-                        'pattern': data.get('last_pattern', 'N/A'),
-                        'completed': data.get('completed_patterns', []),
-                        'records': 0,  # Would need to count from worker CSV
-                        'status': 'idle' if data.get('completed', False) else 'active',
-                        'updated_at': data.get('updated_at', '')
-                    })
-            except Exception as e:
-                print(f"Error loading progress file {i}: {e}")
+            completed = data.get('completed_patterns', [])
+            last_pattern = data.get('last_pattern', 'N/A')
+            updated_at = data.get('updated_at', '')
+
+            # Add the patterns logged since the summary was written
+            if progress_log.exists():
+                completed = set(completed)
+                with open(progress_log, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            continue  # e.g. a line being written right now
+                        completed.add(entry['pattern'])
+                        if entry.get('ts', '') > updated_at:
+                            last_pattern = entry['pattern']
+                            updated_at = entry['ts']
+                completed = sorted(completed)
+
+            workers.append({
+                'id': i,
+                'pattern': last_pattern,
+                'completed': completed,
+                'records': 0,  # Would need to count from worker CSV
+                'status': 'idle' if data.get('completed', False) else 'active',
+                'updated_at': updated_at
+            })
+        except Exception as e:
+            print(f"Error loading progress file {i}: {e}")
 
     return workers
 
@@ -7,6 +7,7 @@ Runs automatically every 4 hours when used with --auto flag.
 
 import argparse
 import json
+import os
 import subprocess
 import sys
 import time
@@ -197,7 +198,6 @@ def export_sql(df: pd.DataFrame, output_path: Path):
 
 def git_commit_and_push(repo_dir: Path, message: str):
     """Commit data files and push to GitHub."""
-    import os
     original_dir = os.getcwd()
 
     try:
@@ -11,8 +11,24 @@ from datetime import datetime
 sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
 
-def merge_worker_outputs(output_dir='output', output_file='businesses_merged.csv'):
-    """Merge all worker CSV files into one."""
+def save_parquet(df, csv_path):
+    """
+    Save a merged DataFrame as Parquet next to its CSV (same name, .parquet).
+
+    Parquet keeps typed columns and compresses well, so later analysis can
+    load it much faster than re-parsing the CSV. Needs pyarrow installed.
+    """
+    parquet_path = csv_path.with_suffix('.parquet')
+    try:
+        df.to_parquet(parquet_path, index=False)
+    except ImportError:
+        print("Skipping Parquet output: pip install pyarrow")
+        return
+    print(f"Parquet copy: {parquet_path}")
+
+
+def merge_worker_outputs(output_dir='output', output_file='businesses_merged.csv', parquet=False):
+    """Merge all worker CSV files into one (plus a Parquet copy if parquet=True)."""
 
     output_path = Path(output_dir)
     worker_files = sorted(output_path.glob('businesses_worker_*.csv'))
@@ -56,6 +72,8 @@ def merge_worker_outputs(output_dir='output', output_file='businesses_merged.csv
     # Save merged file
     merged_path = output_path / output_file
     combined.to_csv(merged_path, index=False)
+    if parquet:
+        save_parquet(combined, merged_path)
 
     print(f"\n{'=' * 60}")
     print(f"MERGED OUTPUT")
@@ -71,7 +89,7 @@ def merge_worker_outputs(output_dir='output', output_file='businesses_merged.csv
         print("To merge with original, run: python merge_results.py --include-original")
 
 
-def merge_all(output_dir='output'):
+def merge_all(output_dir='output', parquet=False):
     """Merge worker outputs AND original scraper output."""
 
     output_path = Path(output_dir)
@@ -105,6 +123,8 @@ def merge_all(output_dir='output'):
 
     merged_path = output_path / 'businesses_all.csv'
     combined.to_csv(merged_path, index=False)
+    if parquet:
+        save_parquet(combined, merged_path)
 
     print(f"\n{'=' * 60}")
     print(f"COMPLETE MERGE")
@@ -115,7 +135,8 @@ def merge_all(output_dir='output'):
 
 
 if __name__ == '__main__':
+    parquet = '--parquet' in sys.argv
     if '--include-original' in sys.argv or '--all' in sys.argv:
-        merge_all()
+        merge_all(parquet=parquet)
     else:
-        merge_worker_outputs()
+        merge_worker_outputs(parquet=parquet)
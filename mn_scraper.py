@@ -28,7 +28,7 @@ For each business, the scraper extracts:
 DEPENDENCIES:
 -------------
 - playwright: Browser automation library (async)
-- pandas: Data manipulation and CSV handling
+- selectolax: Fast HTML parser for pages fetched without the browser
 - asyncio: Async/await support for concurrent operations
 
 USAGE:
@@ -60,7 +60,8 @@ Key concepts used in this code:
 3. PLAYWRIGHT: A browser automation library that controls a real Chrome browser.
    This is needed because the website uses JavaScript to render content.
 
-4. PANDAS: A data analysis library. Here we use it for CSV file operations.
+4. CSV: Python's built-in csv module writes the output file, a batch of
+   rows at a time.
 
 5. REGULAR EXPRESSIONS (regex): Used for parsing addresses and dates.
    The 're' module provides pattern matching capabilities.
@@ -77,16 +78,31 @@ Last Updated: 2026-02-02
 
 import argparse          # For parsing command-line arguments
 import asyncio           # For async/await functionality
+import csv               # For appending rows to the output CSV
+import functools         # For caching parsed addresses and dates
+import gzip              # For compressed CSV output
 import json              # For reading/writing JSON files (progress tracking)
 import logging           # For logging messages to console and file
+import os                # For environment variables and atomic file renames
 import re                # For regular expressions (pattern matching)
 import random            # For adding random delays (to be polite to server)
-from datetime import datetime  # For date/time operations
+import subprocess        # For re-launching under the profiler (--profile)
+import sys               # For the Python executable and CLI arguments
+import time              # For cheap timestamps (date cache expiry)
+import traceback         # For the Playwright stack-capture switch
+import types             # For the Playwright stack-capture switch
+import weakref           # For per-page caches that don't keep pages alive
+from collections import deque  # For run()'s sliding window of scrapes
+from datetime import date, datetime, timedelta  # For date/time operations
 from pathlib import Path       # For cross-platform file path handling
+from typing import NamedTuple  # For the parsed address tuple
+from urllib.parse import urljoin, urlsplit  # For links found in fetched HTML
 
 # Third-party libraries (must be installed via pip)
-import pandas as pd      # Data manipulation library
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+from playwright.async_api import (
+    async_playwright, Error as PlaywrightError, TimeoutError as PlaywrightTimeout
+)
+from selectolax.lexbor import LexborHTMLParser  # Fast C-based HTML parser
 
 # Local module imports
 import config  # Configuration settings (BASE_URL, timeouts, etc.)
@@ -110,6 +126,48 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)  # Get a logger for this module
 
 
+# =============================================================================
+# PLAYWRIGHT STACK CAPTURE SWITCH
+# =============================================================================
+# Playwright records a Python stack trace on every API call (page.goto,
+# query_selector, inner_text, ...) so that its errors can point at our code.
+# With many pages in flight that bookkeeping is a real share of CPU time.
+# Set PW_INSPECT_STACK=0 to turn it off; errors still carry Playwright's own
+# message, just without our Python call site attached.
+
+def disable_playwright_stack_capture() -> bool:
+    """
+    Stop Playwright from capturing a stack trace on every API call.
+
+    Playwright's connection module calls traceback.extract_stack() for each
+    protocol message. This swaps that module's view of `traceback` for a copy
+    whose extract_stack() returns an empty trace. Nothing else is affected.
+
+    RETURNS:
+    --------
+    bool
+        True if the patch was applied, False if this Playwright version
+        doesn't have the expected internals.
+    """
+    try:
+        from playwright._impl import _connection
+    except ImportError:
+        return False
+
+    if getattr(_connection, 'traceback', None) is not traceback:
+        return False
+
+    shim = types.ModuleType('traceback')
+    shim.__dict__.update(traceback.__dict__)
+    shim.extract_stack = lambda *args, **kwargs: traceback.StackSummary()
+    _connection.traceback = shim
+    return True
+
+
+if os.environ.get('PW_INSPECT_STACK') == '0':
+    disable_playwright_stack_capture()
+
+
 # =============================================================================
 # CONSTANTS - Address Parsing Reference Data
 # =============================================================================
@@ -118,7 +176,7 @@ logger = logging.getLogger(__name__)  # Get a logger for this module
 
 # Common street types and their abbreviations
 # Used to identify the type of street in an address (e.g., "Street", "Ave")
-STREET_TYPES = {
+STREET_TYPES = frozenset({
     'street', 'st', 'str',           # Street variations
     'avenue', 'ave', 'av',            # Avenue variations
     'road', 'rd',                     # Road
@@ -137,21 +195,149 @@ STREET_TYPES = {
     'loop',                           # Loop
     'square', 'sq',                   # Square
     'crossing', 'xing'                # Crossing
-}
+})
 
 # Directional suffixes/prefixes (e.g., "123 Main St NE")
 # These indicate which part of the city the address is in
-DIRECTIONS = {
+DIRECTIONS = frozenset({
     'n', 's', 'e', 'w',               # Single letter: North, South, East, West
     'ne', 'nw', 'se', 'sw',           # Combined: Northeast, Northwest, etc.
     'north', 'south', 'east', 'west'  # Full words
+})
+
+# Country lines dropped from addresses (we only handle US addresses)
+COUNTRY_LINES = frozenset({'USA', 'US', 'UNITED STATES'})
+
+
+# Regular expressions used for every address and date, compiled once here
+# instead of on each call.
+# Classifies an address line in one match (check m.lastgroup):
+# - 'csz':  "City, ST 12345..." or just "City, ST"
+# - 'unit': starts with STE, SUITE, APT, UNIT, #, FL, FLOOR, RM, ROOM, BLDG,
+#           BUILDING (a unit/suite line)
+# No match means it's a street line.
+_LINE_CLASSIFIER_RE = re.compile(
+    r'^(?:(?P<csz>.+,\s*[A-Z]{2}(?:\s+\d{5}|\s*$))'
+    r'|(?P<unit>STE|SUITE|APT|APARTMENT|UNIT|#|FL|FLOOR|RM|ROOM|BLDG|BUILDING))',
+    re.IGNORECASE
+)
+# Leading street number, possibly with a hyphen like "123-125"
+_STREET_NUM_RE = re.compile(r'^(\d+[-\d]*)\s+(.+)$')
+# Split "City Name, ST 12345(-6789)" / "City Name, ST" into parts
+# (the – is an en-dash that sometimes appears in ZIP codes)
+_CITY_ST_ZIP_RE = re.compile(r'^(.+?),\s*([A-Z]{2})\s+([\d\-–]+)$', re.IGNORECASE)
+_CITY_ST_RE = re.compile(r'^(.+?),\s*([A-Z]{2})$', re.IGNORECASE)
+# Already-ISO dates: YYYY-MM-DD at the start of the string
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}')
+
+
+# Errors worth retrying: network/browser hiccups. Anything else (KeyError,
+# AttributeError, ...) is a bug that would fail the same way every time, so it
+# is raised immediately instead of burning MAX_RETRIES x RETRY_DELAY.
+RETRYABLE_ERRORS = (PlaywrightError, asyncio.TimeoutError)
+
+# Playwright selector for the "no results" message on the search results page
+NO_RESULTS_SELECTOR = 'text=/no results|no businesses found/i'
+# The same check for HTML parsed outside the browser
+_NO_RESULTS_RE = re.compile(r'no results|no businesses found', re.IGNORECASE)
+
+# JavaScript run with page.evaluate() once the search results have loaded.
+# In one call to the browser it tells us which outcome we got: a details
+# link (plus the first result's name), or the "no results" message. The text
+# match runs inside the page, so only a true/false comes back instead of the
+# whole body text, and it is skipped entirely when there is a link.
+SEARCH_OUTCOME_JS = """
+() => {
+    const link = document.querySelector('a[href*="SearchDetails"]');
+    if (link) {
+        const name = document.querySelector('table tbody tr td strong');
+        return {details: true, name: name ? name.innerText.trim() : '', noResults: false};
+    }
+    const text = document.body ? document.body.innerText : '';
+    return {details: false, name: '', noResults: /no results|no businesses found/i.test(text)};
+}
+"""
+
+# Link from a search result to its details page
+DETAILS_LINK_SELECTOR = 'a[href*="SearchDetails"]'
+
+# JavaScript for the (absolute) URL of the first details link, or ''
+DETAILS_HREF_JS = (
+    "() => document.querySelector('a[href*=\"SearchDetails\"]')?.href || ''"
+)
+
+# Anything that shows a file number search has finished and found something:
+# a results row, a link to a details page, or a details page itself (<dt>)
+RESULTS_READY_SELECTOR = 'table tbody tr, a[href*="SearchDetails"], dt'
+
+# A row in a business name search results table (see read_search_results)
+NAME_RESULTS_ROW_SELECTOR = 'table.table tbody tr'
+
+# JavaScript that captures the file number search form: where it posts to,
+# and every field it would send (including hidden ones like the
+# __RequestVerificationToken anti-forgery token)
+SEARCH_FORM_JS = """
+() => {
+    const form = document.querySelector('#FileNumber')?.form;
+    if (!form) return null;
+    return {
+        action: form.action,
+        method: (form.method || 'get').toLowerCase(),
+        fields: Object.fromEntries(new FormData(form)),
+    };
+}
+"""
+
+# The same for the business name search form, with "Contains" selected first
+# (the radio button is only sent when it's checked)
+NAME_SEARCH_FORM_JS = """
+() => {
+    const form = document.querySelector('#BusinessName')?.form;
+    if (!form) return null;
+    const contains = document.getElementById('containsz');
+    if (contains) contains.checked = true;
+    return {
+        action: form.action,
+        method: (form.method || 'get').toLowerCase(),
+        fields: Object.fromEntries(new FormData(form)),
+    };
 }
+"""
+
+# JavaScript for extract_text(): the innerText of the first element matching
+# a selector, or null if there is none
+EXTRACT_TEXT_JS = "selector => document.querySelector(selector)?.innerText ?? null"
+
+# Playwright selector for a cookie/consent banner's accept button (if any)
+CONSENT_SELECTOR = '#consent-accept'
+
+# Resource types the scraper never needs: we only read text from the HTML,
+# so these are aborted before they are downloaded (see config.BLOCK_RESOURCES).
+# 'other' covers analytics beacons, CSP reports and similar pings. Documents,
+# scripts and xhr/fetch are kept - the search form needs its JavaScript.
+BLOCKED_RESOURCE_TYPES = frozenset({
+    'image', 'font', 'stylesheet', 'media',
+    'texttrack', 'websocket', 'eventsource', 'manifest', 'other',
+})
+
+# Third-party analytics/ad hosts, blocked whatever the resource type (their
+# scripts would otherwise load and then send beacons of their own).
+# Subdomains are blocked too.
+BLOCKED_HOSTS = frozenset({
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+})
+
+# Scalene options used by --profile. --async makes Scalene attribute the time
+# spent waiting in 'await' (page.goto, asyncio.sleep, ...) to the awaiting line,
+# which plain cProfile does not show.
+SCALENE_OPTIONS = ['--async', '--cpu', '--json']
 
 
 # =============================================================================
 # HELPER FUNCTIONS - Date and Address Parsing
 # =============================================================================
 
+@functools.lru_cache(maxsize=4096)
 def convert_date_to_iso(date_str: str) -> str:
     """
     Convert a date from MM/DD/YYYY format to YYYY-MM-DD format.
@@ -189,6 +375,9 @@ def convert_date_to_iso(date_str: str) -> str:
     str
         The date in ISO format (YYYY-MM-DD) or empty string if invalid.
         If already in ISO format, returns as-is (first 10 characters).
+
+    Results are cached, since the same filing dates repeat across many
+    businesses.
     """
     # Handle empty or whitespace-only input
     if not date_str or not date_str.strip():
@@ -197,23 +386,30 @@ def convert_date_to_iso(date_str: str) -> str:
     # Remove leading/trailing whitespace
     date_str = date_str.strip()
 
-    # Try parsing as MM/DD/YYYY format
-    # strptime = "string parse time" - converts string to datetime object
-    try:
-        dt = datetime.strptime(date_str, '%m/%d/%Y')
-        # strftime = "string format time" - converts datetime to string
-        return dt.strftime('%Y-%m-%d')
-    except ValueError:
-        # ValueError means the string didn't match the expected format
-        pass
-
-    # Try M/D/YYYY format (single digit month/day like "1/5/2024")
-    # Note: This is actually the same as above - Python's %m/%d handles both
-    try:
-        dt = datetime.strptime(date_str, '%m/%d/%Y')
-        return dt.strftime('%Y-%m-%d')
-    except ValueError:
-        pass
+    # Fast path: the portal almost always shows zero-padded MM/DD/YYYY, which
+    # can be rearranged by slicing. strptime is slow (it goes through locale
+    # handling on every call) and this runs for every date of every business.
+    if (len(date_str) == 10 and date_str[2] == '/' and date_str[5] == '/'
+            and date_str[:2].isdigit() and date_str[3:5].isdigit()
+            and date_str[6:].isdigit()):
+        try:
+            # Building a date checks the month/day are real (no 02/30)
+            date(int(date_str[6:]), int(date_str[:2]), int(date_str[3:5]))
+            return f'{date_str[6:]}-{date_str[:2]}-{date_str[3:5]}'
+        except ValueError:
+            return date_str
+
+    # Single digit month/day like "1/5/2024": split on the slashes instead
+    # of calling strptime
+    parts = date_str.split('/')
+    if len(parts) == 3:
+        month, day, year = parts
+        if (len(year) == 4 and 1 <= len(month) <= 2 and 1 <= len(day) <= 2
+                and year.isdigit() and month.isdigit() and day.isdigit()):
+            try:
+                return date(int(year), int(month), int(day)).isoformat()
+            except ValueError:
+                return date_str
 
     # Check if already in YYYY-MM-DD format (ISO format)
     # Regular expression explanation:
@@ -223,7 +419,7 @@ def convert_date_to_iso(date_str: str) -> str:
     # \d{2}   = exactly 2 digits (month)
     # -       = literal hyphen
     # \d{2}   = exactly 2 digits (day)
-    if re.match(r'^\d{4}-\d{2}-\d{2}', date_str):
+    if _ISO_DATE_RE.match(date_str):
         return date_str[:10]  # Return first 10 chars (in case there's extra)
 
     # If we couldn't parse it, return the original string
@@ -231,44 +427,36 @@ def convert_date_to_iso(date_str: str) -> str:
     return date_str
 
 
-def parse_address(address_str: str) -> dict:
+class AddressParts(NamedTuple):
     """
-    Parse a full address string into its component parts.
+    The components of a parsed address (see parse_address()).
 
-    WHY PARSE ADDRESSES?
-    --------------------
-    Raw addresses like "123 Main St NE\nSte 200\nMinneapolis, MN 55401" are
-    hard to search, filter, and analyze. Breaking them into components allows:
-    1. Search by city, state, or zip
-    2. Filter by street name
-    3. Standardize address formats
-    4. Detect duplicates with slightly different formatting
+    This is a NamedTuple so the parts can be zipped straight into a record's
+    prefixed columns (e.g. 'principal_city') instead of copied one by one.
+    """
+    street_number: str = ''
+    street_name: str = ''
+    street_type: str = ''
+    street_direction: str = ''
+    unit: str = ''
+    city: str = ''
+    state: str = ''
+    zip: str = ''
+
+
+@functools.lru_cache(maxsize=16384)
+def parse_address_parts(address_str: str) -> AddressParts:
+    """
+    Parse a full address string into an AddressParts tuple.
 
-    EXAMPLES:
-    ---------
-    >>> parse_address("123 Main Street NE\\nMinneapolis, MN 55401")
-    {
-        'street_number': '123',
-        'street_name': 'Main',
-        'street_type': 'Street',
-        'street_direction': 'NE',
-        'unit': '',
-        'city': 'Minneapolis',
-        'state': 'MN',
-        'zip': '55401'
-    }
+    This does the actual work for parse_address(); see that function for
+    examples and a description of each field.
 
-    >>> parse_address("456 Oak Ave\\nSte 100\\nSt Paul, MN 55102")
-    {
-        'street_number': '456',
-        'street_name': 'Oak',
-        'street_type': 'Ave',
-        'street_direction': '',
-        'unit': 'Ste 100',
-        'city': 'St Paul',
-        'state': 'MN',
-        'zip': '55102'
-    }
+    Results are cached: big registered agents and corporate offices show up
+    on thousands of filings with the exact same address text, and the
+    returned tuple can't be changed by the caller, so sharing it is safe.
+    The cache is large enough to keep those repeat addresses for a whole
+    run; the hit rate is logged at DEBUG level when a run finishes.
 
     PARAMETERS:
     -----------
@@ -278,16 +466,8 @@ def parse_address(address_str: str) -> dict:
 
     RETURNS:
     --------
-    dict
-        Dictionary with keys:
-        - street_number: The house/building number (e.g., "123")
-        - street_name: The street name without type/direction (e.g., "Main")
-        - street_type: The street type (e.g., "Street", "Ave")
-        - street_direction: Directional suffix (e.g., "NE", "SW")
-        - unit: Suite/apartment/floor (e.g., "Ste 200")
-        - city: City name (e.g., "Minneapolis")
-        - state: Two-letter state code (e.g., "MN")
-        - zip: ZIP code (e.g., "55401" or "55401-1234")
+    AddressParts
+        The parsed components (empty strings for anything not found).
     """
     # Initialize result dictionary with empty values
     # This ensures all keys exist even if we can't parse some parts
@@ -304,7 +484,7 @@ def parse_address(address_str: str) -> dict:
 
     # Handle empty input
     if not address_str:
-        return result
+        return AddressParts()
 
     # Remove leading/trailing whitespace
     address_str = address_str.strip()
@@ -321,7 +501,7 @@ def parse_address(address_str: str) -> dict:
     lines = [line.strip() for line in address_str.split('\n') if line.strip()]
 
     # Remove country line (we only care about US addresses)
-    lines = [l for l in lines if l.upper() not in ['USA', 'US', 'UNITED STATES']]
+    lines = [l for l in lines if l.upper() not in COUNTRY_LINES]
 
     # =======================================================================
     # STEP 2: Handle comma-separated single-line format
@@ -346,23 +526,16 @@ def parse_address(address_str: str) -> dict:
     unit_line = ''         # Suite/apartment (e.g., "Ste 200")
     city_state_zip_line = ''  # City, state, zip (e.g., "Minneapolis, MN 55401")
 
-    # Pattern to match unit/suite lines
-    # Matches: STE, SUITE, APT, UNIT, #, FL, FLOOR, RM, ROOM, BLDG, BUILDING
-    # followed by optional number
-    unit_patterns = re.compile(
-        r'^(STE|SUITE|APT|APARTMENT|UNIT|#|FL|FLOOR|RM|ROOM|BLDG|BUILDING)\s*\.?\s*\d*',
-        re.IGNORECASE  # Case-insensitive matching
-    )
-
     for line in lines:
-        # Check if this looks like "City, ST 12345" (city, state, zip)
-        if re.match(r'^.+,\s*[A-Z]{2}\s+\d{5}', line, re.IGNORECASE):
-            city_state_zip_line = line
-        # Check if this is just "City, ST" without zip
-        elif re.match(r'^.+,\s*[A-Z]{2}\s*$', line, re.IGNORECASE):
+        # One regex match tells us which kind of line this is
+        match = _LINE_CLASSIFIER_RE.match(line)
+        kind = match.lastgroup if match else None
+
+        # "City, ST 12345" or "City, ST" (city, state, zip)
+        if kind == 'csz':
             city_state_zip_line = line
-        # Check if this is a unit/suite line
-        elif unit_patterns.match(line):
+        # A unit/suite line
+        elif kind == 'unit':
             unit_line = line
         # Otherwise it's probably the street line (take first one found)
         elif not street_line:
@@ -375,7 +548,7 @@ def parse_address(address_str: str) -> dict:
     if street_line:
         # Extract street number (leading digits, possibly with hyphen like "123-125")
         # Regular expression: ^ = start, (\d+[-\d]*) = digits with optional hyphen+digits
-        match = re.match(r'^(\d+[-\d]*)\s+(.+)$', street_line)
+        match = _STREET_NUM_RE.match(street_line)
         if match:
             result['street_number'] = match.group(1)  # The number
             remainder = match.group(2)                 # Rest of street address
@@ -383,19 +556,21 @@ def parse_address(address_str: str) -> dict:
             # No number found, entire line is the "remainder"
             remainder = street_line
 
-        # Split remainder into words for further parsing
+        # Split remainder into words for further parsing, with a lowercase
+        # copy for the lookups so each word is only lowercased once
         words = remainder.split()
+        lowered = remainder.lower().split()
 
         # Check if last word is a direction (N, S, E, W, NE, etc.)
-        if words and words[-1].lower() in DIRECTIONS:
+        if words and lowered[-1] in DIRECTIONS:
             result['street_direction'] = words[-1].upper()
             words = words[:-1]  # Remove direction from words list
+            lowered = lowered[:-1]
 
         # Check if last word is a street type (St, Ave, Rd, etc.)
-        if words:
-            if words[-1].lower() in STREET_TYPES:
-                result['street_type'] = words[-1]
-                words = words[:-1]  # Remove street type from words list
+        if words and lowered[-1] in STREET_TYPES:
+            result['street_type'] = words[-1]
+            words = words[:-1]  # Remove street type from words list
 
         # Whatever's left is the street name
         if words:
@@ -411,12 +586,7 @@ def parse_address(address_str: str) -> dict:
 
     if city_state_zip_line:
         # Try to match: "City Name, ST 12345" or "City Name, ST 12345-6789"
-        # The – is an en-dash that sometimes appears in ZIP codes
-        match = re.match(
-            r'^(.+?),\s*([A-Z]{2})\s+([\d\-–]+)$',
-            city_state_zip_line,
-            re.IGNORECASE
-        )
+        match = _CITY_ST_ZIP_RE.match(city_state_zip_line)
         if match:
             result['city'] = match.group(1).strip()
             result['state'] = match.group(2).upper()
@@ -424,11 +594,7 @@ def parse_address(address_str: str) -> dict:
             result['zip'] = match.group(3).replace('–', '-')
         else:
             # Try without ZIP code: "City Name, ST"
-            match = re.match(
-                r'^(.+?),\s*([A-Z]{2})$',
-                city_state_zip_line,
-                re.IGNORECASE
-            )
+            match = _CITY_ST_RE.match(city_state_zip_line)
             if match:
                 result['city'] = match.group(1).strip()
                 result['state'] = match.group(2).upper()
@@ -436,113 +602,713 @@ def parse_address(address_str: str) -> dict:
                 # Couldn't parse - just store as city
                 result['city'] = city_state_zip_line
 
-    return result
+    return AddressParts(**result)
 
 
-# =============================================================================
-# MAIN SCRAPER CLASS
-# =============================================================================
+def parse_address(address_str: str) -> dict:
+    """
+    Parse a full address string into its component parts.
 
-class MNBusinessScraper:
+    WHY PARSE ADDRESSES?
+    --------------------
+    Raw addresses like "123 Main St NE\nSte 200\nMinneapolis, MN 55401" are
+    hard to search, filter, and analyze. Breaking them into components allows:
+    1. Search by city, state, or zip
+    2. Filter by street name
+    3. Standardize address formats
+    4. Detect duplicates with slightly different formatting
+
+    EXAMPLES:
+    ---------
+    >>> parse_address("123 Main Street NE\\nMinneapolis, MN 55401")
+    {
+        'street_number': '123',
+        'street_name': 'Main',
+        'street_type': 'Street',
+        'street_direction': 'NE',
+        'unit': '',
+        'city': 'Minneapolis',
+        'state': 'MN',
+        'zip': '55401'
+    }
+
+    >>> parse_address("456 Oak Ave\\nSte 100\\nSt Paul, MN 55102")
+    {
+        'street_number': '456',
+        'street_name': 'Oak',
+        'street_type': 'Ave',
+        'street_direction': '',
+        'unit': 'Ste 100',
+        'city': 'St Paul',
+        'state': 'MN',
+        'zip': '55102'
+    }
+
+    PARAMETERS:
+    -----------
+    address_str : str
+        The full address string to parse. Can be multi-line (\\n separated)
+        or comma-separated.
+
+    RETURNS:
+    --------
+    dict
+        Dictionary with keys:
+        - street_number: The house/building number (e.g., "123")
+        - street_name: The street name without type/direction (e.g., "Main")
+        - street_type: The street type (e.g., "Street", "Ave")
+        - street_direction: Directional suffix (e.g., "NE", "SW")
+        - unit: Suite/apartment/floor (e.g., "Ste 200")
+        - city: City name (e.g., "Minneapolis")
+        - state: Two-letter state code (e.g., "MN")
+        - zip: ZIP code (e.g., "55401" or "55401-1234")
     """
-    Scraper for Minnesota Secretary of State business filings.
+    return parse_address_parts(address_str)._asdict()
 
-    This class handles all aspects of scraping business data:
-    1. Browser management (start/stop Chrome via Playwright)
-    2. Navigation and search
-    3. Data extraction from business detail pages
-    4. Progress tracking for resume capability
-    5. CSV file management
 
-    USAGE:
-    ------
-    # Basic usage with async/await:
-    scraper = MNBusinessScraper(start_number=1000000)
-    await scraper.initialize()  # Start browser
+def address_columns(prefix: str) -> tuple:
+    """
+    Get the record column names for one address, in AddressParts order.
 
-    # Scrape a single business
-    data = await scraper.scrape_business(1000000)
+    EXAMPLE:
+    --------
+    >>> address_columns('principal')[:2]
+    ('principal_street_number', 'principal_street_name')
+    """
+    return tuple(f'{prefix}_{field}' for field in AddressParts._fields)
+
+
+# Column names for each address block in a business record
+PRINCIPAL_ADDRESS_COLUMNS = address_columns('principal')
+REG_OFFICE_ADDRESS_COLUMNS = address_columns('reg_office')
+EXEC_OFFICE_ADDRESS_COLUMNS = address_columns('exec_office')
+APPLICANT_ADDRESS_COLUMNS = address_columns('applicant')
+
+# Details page labels (<dt> text, lowercased) -> our field names.
+# Order matters for labels that only contain one of these (see label_field).
+LABEL_FIELDS = {
+    'business type': 'business_type',
+    'mn statute': 'mn_statute',
+    'home jurisdiction': 'home_jurisdiction',
+    'filing date': 'filing_date',
+    'date of incorporation': 'filing_date',  # Alternative label
+    'status': 'status',
+    'renewal due date': 'renewal_due_date',
+    'mark type': 'mark_type',
+    'number of shares': 'number_of_shares',
+    'chief executive officer': 'chief_executive_officer',
+    'manager': 'manager',
+    'registered agent': 'registered_agent_name',
+    'registered agent(s)': 'registered_agent_name',
+}
 
-    # Run the main loop (scrapes sequentially until max misses)
-    await scraper.run()
 
-    # Always close when done
-    await scraper.close()
+@functools.lru_cache(maxsize=256)
+def label_field(label: str):
+    """
+    Find the record field for a details page label.
 
-    ATTRIBUTES:
+    Most labels are exactly one of the LABEL_FIELDS keys (maybe with a
+    trailing colon), which is a single dict lookup. Other labels fall back
+    to the first key contained in the label (e.g. "Registered Agent Name").
+    The answer is cached, since the same few labels appear on every page.
+
+    PARAMETERS:
     -----------
-    start_number : int
-        The file number to start scraping from
-    headless : bool
-        Whether to run browser without visible window
-    consecutive_misses : int
-        Counter for consecutive failed searches (no results)
-    current_file_number : int
-        The file number currently being processed
-    browser, context, page : Playwright objects
-        Browser automation handles
-    output_dir : Path
-        Directory for output files
-    output_file : Path
-        Path to the main CSV output file
-    progress_file : Path
-        Path to the JSON progress tracking file
-    columns : list
-        List of column names for the CSV file
+    label : str
+        The <dt> text, lowercased and whitespace-normalized
+
+    RETURNS:
+    --------
+    str or None
+        The field name, or None if the label isn't one we keep
     """
+    field = LABEL_FIELDS.get(label) or LABEL_FIELDS.get(label.rstrip(':'))
+    if field:
+        return field
 
-    def __init__(self, start_number: int = None, headless: bool = None):
-        """
-        Initialize the scraper with configuration.
+    for key, field in LABEL_FIELDS.items():
+        if key in label:
+            return field
+    return None
 
-        PARAMETERS:
-        -----------
-        start_number : int, optional
-            The file number to start from. If None, uses config.START_FILE_NUMBER.
-            File numbers are sequential identifiers assigned by MN SOS.
 
-        headless : bool, optional
-            Whether to run the browser without a visible window.
-            - True: Browser runs in background (faster, uses less resources)
-            - False: Browser window is visible (useful for debugging)
-            If None, uses config.HEADLESS setting.
+# =============================================================================
+# HELPER FUNCTIONS - Details Page HTML Parsing
+# =============================================================================
+# Details pages are plain server-rendered HTML, so they are parsed here in
+# Python rather than element by element through the browser. These helpers
+# turn the HTML into the (fields, tables) structure that
+# MNBusinessScraper.build_business_record() reads, whether the HTML came from
+# a live page (read_details_page) or a plain HTTP fetch.
+
+# Tags that start a new line in node_text() (like they do in innerText).
+# Inline tags (<b>, <a>, <span>, ...) don't, so "Foo <b>Bar</b> LLC" stays
+# one line.
+_LINE_BREAK_TAGS = frozenset({
+    'br', 'div', 'p', 'li', 'tr', 'dd', 'dt', 'ul', 'ol', 'table',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+})
+
+
+def node_text(node) -> str:
+    """
+    Get the text of an HTML node, roughly like the browser's innerText.
 
-        EXAMPLE:
-        --------
-        # Start from file 1000000 with visible browser
-        scraper = MNBusinessScraper(start_number=1000000, headless=False)
+    Text split by <br> (e.g. the lines of an address) or by block elements
+    becomes separate lines; text inside inline elements stays on its line.
+    Runs of whitespace are collapsed and blank lines dropped.
+    """
+    pieces = []
+    for child in node.traverse(include_text=True):
+        tag = child.tag
+        if tag == '-text':
+            pieces.append(child.text())
+        elif tag in _LINE_BREAK_TAGS:
+            pieces.append('\n')
+    text = ''.join(pieces)
+    return '\n'.join(' '.join(line.split()) for line in text.split('\n') if line.strip())
+
+
+def next_element(node):
+    """Get the next sibling element of a node, skipping text and comments."""
+    node = node.next
+    while node is not None and node.tag.startswith('-'):
+        node = node.next
+    return node
+
+
+def parse_details_html(html: str) -> dict:
+    """
+    Parse a business details page from its HTML.
 
-        # Use config defaults
-        scraper = MNBusinessScraper()
-        """
-        # Use provided values or fall back to config defaults
-        self.start_number = start_number or config.START_FILE_NUMBER
-        self.headless = headless if headless is not None else config.HEADLESS
+    PARAMETERS:
+    -----------
+    html : str
+        The full HTML of a SearchDetails page
 
-        # Tracking variables
-        self.consecutive_misses = 0       # How many searches in a row found nothing
-        self.current_file_number = self.start_number  # Current position
+    RETURNS:
+    --------
+    dict
+        - title: The page <title> text
+        - heading: The first <h2> text (the business name)
+        - fields: list of (label, value) tuples from <dt>/<dd> pairs,
+          labels lowercased
+        - tables: list of {'headers': [...], 'rows': [[...], ...]} dicts,
+          headers lowercased
+    """
+    tree = LexborHTMLParser(html)
+
+    title = tree.css_first('title')
+    heading = tree.css_first('h2')
+
+    fields = []
+    for dt in tree.css('dt'):
+        label = ' '.join(dt.text(separator=' ', strip=True).split()).lower()
+        dd = next_element(dt)
+        fields.append((label, node_text(dd) if dd is not None else ''))
+
+    tables = []
+    for table in tree.css('table'):
+        tables.append({
+            'headers': [node_text(th).lower() for th in table.css('th')],
+            'rows': [[node_text(td) for td in tr.css('td')]
+                     for tr in table.css('tbody tr')],
+        })
+
+    return {
+        'title': title.text(strip=True) if title is not None else '',
+        'heading': node_text(heading) if heading is not None else '',
+        'fields': fields,
+        'tables': tables,
+    }
 
-        # Playwright browser objects (initialized in initialize())
-        self.browser = None   # The browser instance
-        self.context = None   # Browser context (like an incognito session)
-        self.page = None      # The active page/tab
 
-        # =================================================================
-        # FILE PATH SETUP
-        # =================================================================
-        # Path objects handle cross-platform path differences automatically
-        # (e.g., forward slash vs backslash)
+def parse_search_results_html(html: str) -> tuple:
+    """
+    Parse a file number search results page from its HTML.
 
-        self.output_dir = Path(config.OUTPUT_DIR)
-        self.output_dir.mkdir(exist_ok=True)  # Create if doesn't exist
-        self.output_file = self.output_dir / config.OUTPUT_FILE
-        self.progress_file = Path(config.PROGRESS_FILE)
+    PARAMETERS:
+    -----------
+    html : str
+        The full HTML of the page returned by the search form
 
-        # =================================================================
-        # CSV COLUMN DEFINITIONS
-        # =================================================================
-        # These define all the fields we extract for each business.
+    RETURNS:
+    --------
+    tuple (found, business_name, details_href)
+        - found: True if there is a details link, False if the page says no
+          results, None if it looks like neither (unexpected page)
+        - business_name: The first result's name ('' if none)
+        - details_href: The details link's href as written in the page
+    """
+    tree = LexborHTMLParser(html)
+
+    link = tree.css_first('a[href*="SearchDetails"]')
+    if link is not None:
+        name = tree.css_first('table tbody tr td strong')
+        return True, node_text(name) if name is not None else '', link.attributes.get('href') or ''
+
+    body = tree.body
+    if body is not None and _NO_RESULTS_RE.search(body.text(separator=' ')):
+        return False, '', ''
+
+    return None, '', ''
+
+
+def parse_name_search_results_html(html: str, max_results: int = None,
+                                   keywords: list = None) -> list[dict] | None:
+    """
+    Parse a business name search results page from its HTML.
+
+    The HTML version of read_search_results(), for searches submitted over
+    HTTP (see search_by_name_http).
+
+    PARAMETERS:
+    -----------
+    html : str
+        The full HTML of the page returned by the search form
+    max_results : int, optional
+        Only return this many rows (default: all)
+    keywords : list, optional
+        Only return rows whose name contains one of these words (any case)
+
+    RETURNS:
+    --------
+    list[dict] or None
+        The rows, in the same format as read_search_results() (an empty list
+        if the page says no results), or None if the page has neither a
+        results table nor a "no results" message (unexpected page)
+    """
+    tree = LexborHTMLParser(html)
+
+    table = tree.css_first('table.table')
+    if table is None:
+        body = tree.body
+        if body is not None and _NO_RESULTS_RE.search(body.text(separator=' ')):
+            return []
+        return None
+
+    keyword_re = keywords_pattern(tuple(keywords)) if keywords is not None else None
+    results = []
+    for row in table.css('tbody tr')[:max_results]:
+        cells = row.css('td')
+        if not cells:
+            results.append({'business_name': '', 'guid': None, 'cell_count': 0})
+            continue
+        name = cells[0].css_first('strong')
+        if name is None:
+            name = cells[0]
+        name = node_text(name)
+        if keyword_re is not None and not keyword_re.search(name):
+            continue
+        link = row.css_first('a[href*="filingGuid"]')
+        href = (link.attributes.get('href') or '') if link is not None else ''
+        results.append({
+            'business_name': name,
+            'guid': guid_from_href(href),
+            'cell_count': len(cells),
+        })
+    return results
+
+
+# JavaScript that reads every row of the search results table at once:
+# [number of cells, business name (the <strong> in the first cell, or the
+# whole cell), href of the row's filingGuid link or '']. Called with
+# [limit, pattern]: only the first `limit` rows are read, and with a keyword
+# pattern (see keywords_pattern) only rows whose name matches it are sent
+# back - one case-insensitive regex test per name.
+SEARCH_RESULT_ROWS_JS = """
+(rows, [limit, pattern]) => {
+const keywords = pattern == null ? null : new RegExp(pattern, 'i');
+return (limit == null ? rows : rows.slice(0, limit)).map(row => {
+    const cells = row.querySelectorAll('td');
+    if (!cells.length) return [0, '', ''];
+    const nameEl = cells[0].querySelector('strong') || cells[0];
+    const link = row.querySelector('a[href*="filingGuid"]');
+    return [cells.length, nameEl.innerText.trim(), link ? link.getAttribute('href') : ''];
+}).filter(([, name]) => keywords == null || keywords.test(name));
+}
+"""
+
+# Business names that look like an LLC or corporation, for filtering name
+# search results. One case-insensitive regex search instead of upper-casing
+# the name and checking each term separately. These are substring matches,
+# like the checks they replace ('CORP' also covers 'CORPORATION', and 'INC'
+# covers 'INCORPORATED').
+LLC_CORP_NAME_RE = re.compile(r'LLC|L\.L\.C\.|CORP|INC', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=32)
+def keywords_pattern(keywords: tuple) -> re.Pattern:
+    """
+    Compile keywords into one case-insensitive regex that matches any of them.
+
+    Checking a name is then a single regex search (in C) instead of one
+    `keyword in name` scan per keyword. The same pattern works in the
+    browser's JavaScript (see SEARCH_RESULT_ROWS_JS). Cached, so each
+    keyword list is only compiled once.
+
+    PARAMETERS:
+    -----------
+    keywords : tuple
+        The words to look for (a tuple, so it can be cached)
+
+    RETURNS:
+    --------
+    re.Pattern
+        e.g. keywords_pattern(('LLC', 'CORP')).search('Acme Corp') matches
+    """
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords), re.IGNORECASE)
+
+
+async def block_unneeded_resources(route):
+    """
+    Route handler: abort requests the scraper doesn't need.
+
+    Used with context.route('**/*', block_unneeded_resources) on every
+    browser context (see config.BLOCK_RESOURCES). Requests for
+    BLOCKED_RESOURCE_TYPES or to BLOCKED_HOSTS are aborted; everything
+    else goes through.
+    """
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+        return
+
+    host = urlsplit(request.url).hostname or ''
+    if any(host == blocked or host.endswith('.' + blocked) for blocked in BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def guid_from_href(href: str) -> str | None:
+    """
+    Get the filingGuid from a Details link's href (None if it has none).
+
+    The GUID is everything after the (last) "filingGuid=", up to the next
+    "&" if the link has more query parameters after it (otherwise they'd
+    end up in the GUID). rpartition/partition find both without splitting
+    the href into a list.
+    """
+    _, found, rest = href.rpartition('filingGuid=')
+    return rest.partition('&')[0] if found else None
+
+
+async def _fill_and_submit_name_search(page, search_term: str):
+    """Fill in the business name search form and submit it ("Contains")."""
+    # "Contains" finds names with the term anywhere, not just at the start
+    await page.evaluate('document.getElementById("containsz").checked = true')
+    await page.fill('#BusinessName', search_term)
+    # Wait for the new page to load, so the old results still on screen
+    # aren't mistaken for the answer
+    async with page.expect_navigation(wait_until='domcontentloaded',
+                                      timeout=config.RESULTS_TIMEOUT):
+        await page.locator('button:has-text("Search")').first.click()
+
+
+async def submit_name_search(page, search_term: str):
+    """
+    Submit a business name ("Contains") search and wait for its results.
+
+    After a search the results page still shows the search form, so the
+    next search is submitted straight from it instead of loading the search
+    page again every time. The search page is only loaded when there's no
+    form here (the first search) or submitting from it didn't work.
+
+    PARAMETERS:
+    -----------
+    page : Page
+        The browser page to search on
+    search_term : str
+        The name pattern to search for (e.g. "aa")
+    """
+    if await page.locator('#BusinessName:visible').count():
+        try:
+            await _fill_and_submit_name_search(page, search_term)
+            await wait_for_search_results(page)
+            return
+        except PlaywrightError as e:
+            logger.debug(f"Name search from current page failed for '{search_term}': {e}")
+
+    await page.goto(config.BASE_URL, wait_until='domcontentloaded')
+    await _fill_and_submit_name_search(page, search_term)
+    await wait_for_search_results(page)
+
+
+async def wait_for_search_results(page):
+    """
+    Wait for a business name search to finish after submitting it.
+
+    Continues the moment a results row or the "no results" message shows
+    up, instead of waiting for the network to go quiet (networkidle) and
+    then sleeping. If neither shows up within config.RESULTS_TIMEOUT it
+    just returns - reading the results then finds whatever is there.
+
+    PARAMETERS:
+    -----------
+    page : Page
+        The browser page the search was submitted from
+    """
+    try:
+        await (page.locator(NAME_RESULTS_ROW_SELECTOR)
+               .or_(page.locator(NO_RESULTS_SELECTOR))
+               .first.wait_for(state='attached', timeout=config.RESULTS_TIMEOUT))
+    except PlaywrightTimeout:
+        logger.debug("No name search results or 'no results' message appeared")
+
+
+async def read_search_results(page, max_results: int = None,
+                              keywords: list = None) -> list[dict]:
+    """
+    Read the rows of a business name search results table.
+
+    All rows come back from the browser in one call, instead of several
+    query_selector/inner_text/get_attribute calls for every row. Rows past
+    max_results (and, with keywords, rows whose name doesn't match) are
+    dropped in the browser, so they're never sent back.
+
+    PARAMETERS:
+    -----------
+    page : Page
+        A browser page showing search results
+    max_results : int, optional
+        Only read this many rows (default: all)
+    keywords : list, optional
+        Only return rows whose name contains one of these words (any case)
+
+    RETURNS:
+    --------
+    list[dict]
+        One dict per row with:
+        - business_name: The name shown in the first cell
+        - guid: The filingGuid from the row's Details link (None if no link)
+        - cell_count: How many <td> cells the row has
+    """
+    rows = page.locator('table.table').first.locator('tbody tr')
+    pattern = keywords_pattern(tuple(keywords)).pattern if keywords is not None else None
+    results = []
+    for cell_count, name, href in await rows.evaluate_all(SEARCH_RESULT_ROWS_JS, [max_results, pattern]):
+        results.append({
+            'business_name': name, 'guid': guid_from_href(href), 'cell_count': cell_count,
+        })
+    return results
+
+
+# Page -> captured name search form, for search_by_name_http
+_name_search_forms = weakref.WeakKeyDictionary()
+
+
+async def search_by_name_http(page, search_term: str, max_results: int = None,
+                              keywords: list = None) -> list[dict] | None:
+    """
+    Run a business name ("Contains") search as a plain HTTP request.
+
+    Like MNBusinessScraper.search_file_number_http: the first time for each
+    page, the search form is read from the browser (action URL and all
+    fields, including the anti-forgery token). After that every search is a
+    single request through the page's own HTTP client (same cookies), and
+    the results are parsed in-process - no filling, clicking, or rendering.
+
+    PARAMETERS:
+    -----------
+    page : Page
+        A browser page whose session (and search form) is used
+    search_term : str
+        The name pattern to search for (e.g. "aa")
+    max_results : int, optional
+        Only return this many rows (default: all)
+    keywords : list, optional
+        Only return rows whose name contains one of these words (any case)
+
+    RETURNS:
+    --------
+    list[dict] or None
+        The rows, in the same format as read_search_results(), or None if
+        it didn't work (no form, unexpected response, ...) - the caller then
+        runs the search in the browser
+    """
+    form = _name_search_forms.get(page)
+    try:
+        if form is None:
+            if not page.url.startswith(config.BASE_URL):
+                await page.goto(config.BASE_URL, wait_until='domcontentloaded')
+            form = await page.evaluate(NAME_SEARCH_FORM_JS)
+            if not form:
+                return None
+            _name_search_forms[page] = form
+
+        fields = dict(form['fields'], BusinessName=search_term)
+        request = page.context.request
+        if form['method'] == 'post':
+            response = await request.post(form['action'], form=fields)
+        else:
+            response = await request.get(form['action'], params=fields)
+
+        if not response.ok:
+            # The token may have expired - capture the form again next time
+            _name_search_forms.pop(page, None)
+            return None
+
+        results = parse_name_search_results_html(await response.text(), max_results, keywords)
+
+    except PlaywrightError as e:
+        logger.debug(f"HTTP name search failed for '{search_term}': {e}")
+        _name_search_forms.pop(page, None)
+        return None
+
+    if results is None:
+        _name_search_forms.pop(page, None)
+    return results
+
+
+# =============================================================================
+# MAIN SCRAPER CLASS
+# =============================================================================
+
+class MNBusinessScraper:
+    """
+    Scraper for Minnesota Secretary of State business filings.
+
+    This class handles all aspects of scraping business data:
+    1. Browser management (start/stop Chrome via Playwright)
+    2. Navigation and search
+    3. Data extraction from business detail pages
+    4. Progress tracking for resume capability
+    5. CSV file management
+
+    USAGE:
+    ------
+    # Basic usage with async/await:
+    scraper = MNBusinessScraper(start_number=1000000)
+    await scraper.initialize()  # Start browser
+
+    # Scrape a single business
+    data = await scraper.scrape_business(1000000)
+
+    # Run the main loop (scrapes sequentially until max misses)
+    await scraper.run()
+
+    # Always close when done
+    await scraper.close()
+
+    ATTRIBUTES:
+    -----------
+    start_number : int
+        The file number to start scraping from
+    headless : bool
+        Whether to run browser without visible window
+    consecutive_misses : int
+        Counter for consecutive failed searches (no results)
+    current_file_number : int
+        The file number currently being processed
+    browser, context, page : Playwright objects
+        Browser automation handles
+    page_pool : asyncio.Queue
+        Pages (each in its own context) handed out to concurrent scrapes
+    output_dir : Path
+        Directory for output files
+    output_file : Path
+        Path to the main CSV output file (.csv.gz if COMPRESS_OUTPUT is on)
+    progress_file : Path
+        Path to the JSON progress tracking file
+    storage_state_file : str or None
+        Where the browser session is saved/loaded (config.STORAGE_STATE_FILE
+        by default; parallel workers each get their own)
+    columns : list
+        List of column names for the CSV file
+    """
+
+    def __init__(self, start_number: int = None, headless: bool = None):
+        """
+        Initialize the scraper with configuration.
+
+        PARAMETERS:
+        -----------
+        start_number : int, optional
+            The file number to start from. If None, uses config.START_FILE_NUMBER.
+            File numbers are sequential identifiers assigned by MN SOS.
+
+        headless : bool, optional
+            Whether to run the browser without a visible window.
+            - True: Browser runs in background (faster, uses less resources)
+            - False: Browser window is visible (useful for debugging)
+            If None, uses config.HEADLESS setting.
+
+        EXAMPLE:
+        --------
+        # Start from file 1000000 with visible browser
+        scraper = MNBusinessScraper(start_number=1000000, headless=False)
+
+        # Use config defaults
+        scraper = MNBusinessScraper()
+        """
+        # Use provided values or fall back to config defaults
+        self.start_number = start_number or config.START_FILE_NUMBER
+        self.headless = headless if headless is not None else config.HEADLESS
+
+        # Tracking variables
+        self.consecutive_misses = 0       # How many searches in a row found nothing
+        self.current_file_number = self.start_number  # Current position
+
+        # Last file number written by save_progress() (skips duplicate writes)
+        self._last_saved_progress = None
+
+        # Rows waiting to be written to the CSV (see queue_csv_row())
+        self._csv_buffer = []
+        self._csv_flushed_at = time.monotonic()  # When the buffer was last written
+        # Output file kept open between flushes, and its writer (plain CSV
+        # only - see _flush_csv())
+        self._csv_file = None
+        self._csv_writer = None
+
+        # Limits how many file numbers run() scrapes at the same time
+        self._semaphore = asyncio.Semaphore(config.MAX_CONCURRENCY)
+
+        # Pre-computed jitter values for add_delay(), cycled through with an
+        # index so we don't call the random number generator on every request
+        self._jitters = [random.uniform(0, config.DELAY_JITTER) for _ in range(1024)]
+        self._jitter_index = 0
+
+        # When the next GUID details fetch may start (see wait_for_detail_slot())
+        self._next_detail_at = 0.0
+
+        # Cached "YYYY-MM-DD" for the scraped_at column (see _scrape_date())
+        self._today = ''
+        self._today_expires = 0.0  # Unix timestamp of the next local midnight
+
+        # Playwright browser objects (initialized in initialize())
+        self.browser = None   # The browser instance
+        self.context = None   # Browser context (like an incognito session)
+        self.page = None      # The main page/tab
+        self.page_pool = None  # Pages available for concurrent scrapes
+        self._page_uses = {}   # Page -> scrapes since its context was created
+        self._search_forms = {}  # Page -> captured search form (HTTP_SEARCH)
+
+        # =================================================================
+        # FILE PATH SETUP
+        # =================================================================
+        # Path objects handle cross-platform path differences automatically
+        # (e.g., forward slash vs backslash)
+
+        self.output_dir = Path(config.OUTPUT_DIR)
+        self.output_dir.mkdir(exist_ok=True)  # Create if doesn't exist
+        self.output_file = self.output_dir / config.OUTPUT_FILE
+        self.progress_file = Path(config.PROGRESS_FILE)
+        self.storage_state_file = config.STORAGE_STATE_FILE
+
+        # Optional gzip output: name/address text compresses ~8-10x, and
+        # level 1 costs almost no CPU. Gzip streams can be appended to, so
+        # resuming works the same as with a plain CSV.
+        self.csv_compression = None
+        if config.COMPRESS_OUTPUT:
+            self.output_file = self.output_file.with_suffix('.csv.gz')
+            self.csv_compression = {'method': 'gzip', 'compresslevel': 1}
+
+        # =================================================================
+        # CSV COLUMN DEFINITIONS
+        # =================================================================
+        # These define all the fields we extract for each business.
         # The order here determines the column order in the CSV.
 
         self.columns = [
@@ -629,10 +1395,13 @@ class MNBusinessScraper:
         WHAT THIS DOES:
         ---------------
         1. Starts the Playwright engine
-        2. Launches a Chromium browser (headless or visible based on config)
+        2. Launches a Chromium browser (headless or visible based on config),
+           or connects to a running one if config.BROWSER_CDP_URL is set
         3. Creates a new browser context with a custom user agent
         4. Opens a new page/tab
         5. Sets the default timeout for all operations
+        6. Opens the rest of the page pool (one page per concurrent scrape)
+        7. Warms up every page, and the plain-HTTP client, in parallel
 
         WHY CUSTOM USER AGENT?
         ----------------------
@@ -649,23 +1418,182 @@ class MNBusinessScraper:
         # Start Playwright engine
         playwright = await async_playwright().start()
 
-        # Launch Chromium browser
-        # headless=True means no visible window
-        self.browser = await playwright.chromium.launch(headless=self.headless)
+        if config.BROWSER_CDP_URL:
+            # Attach to a Chromium that is already running (started with
+            # --remote-debugging-port), skipping the cold start. Our contexts
+            # are created in it and removed again by close().
+            self.browser = await playwright.chromium.connect_over_cdp(config.BROWSER_CDP_URL)
+            logger.info(f"Connected to running browser at {config.BROWSER_CDP_URL}")
+        else:
+            # Launch Chromium browser
+            # headless=True means no visible window
+            self.browser = await playwright.chromium.launch(headless=self.headless)
+
+        # Create the main browser context and page
+        self.context, self.page = await self.new_context_page()
+
+        # Page pool: one page per concurrent scrape, each in its own context
+        # so cookies/sessions don't interfere. Contexts are cheap compared to
+        # launching more browsers. The main page is the first pool member.
+        pages = [self.page]
+        for _ in range(config.MAX_CONCURRENCY - 1):
+            _, page = await self.new_context_page()
+            pages.append(page)
+
+        # Open every connection and session up front, all at the same time,
+        # so the first real scrape doesn't pay for DNS and the TLS handshake
+        await asyncio.gather(
+            *(self.warm_up(page) for page in pages),
+            self.warm_up_http(),
+        )
+
+        self.page_pool = asyncio.Queue()
+        for page in pages:
+            self.page_pool.put_nowait(page)
+
+        logger.info("Browser initialized")
 
+    async def new_context_page(self):
+        """
+        Create a new browser context with one page, ready for scraping.
+
+        RETURNS:
+        --------
+        tuple
+            (context, page) - the new BrowserContext and its Page
+        """
         # Create a browser context (like an incognito session)
         # user_agent makes us look like a regular browser
-        self.context = await self.browser.new_context(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        # storage_state loads the cookies saved by the last run's close()
+        storage_state = self.storage_state_file
+        if storage_state and not os.path.exists(storage_state):
+            storage_state = None
+        context = await self.browser.new_context(
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            storage_state=storage_state,
         )
 
+        # Ask for compressed responses on every request from this context
+        await context.set_extra_http_headers({'Accept-Encoding': 'gzip, br'})
+
+        # Skip downloading images, fonts, etc. - we only read text
+        if config.BLOCK_RESOURCES:
+            await context.route('**/*', block_unneeded_resources)
+
         # Open a new page/tab in the context
-        self.page = await self.context.new_page()
+        page = await context.new_page()
 
         # Set default timeout for all page operations (in milliseconds)
-        self.page.set_default_timeout(config.TIMEOUT)
+        page.set_default_timeout(config.TIMEOUT)
 
-        logger.info("Browser initialized")
+        return context, page
+
+    async def _acquire_page(self):
+        """
+        Take a page from the pool, waiting if every page is busy.
+
+        A page whose context has been used config.CONTEXT_ROTATE_EVERY times
+        is swapped for a fresh one first (see _rotate_page). If that fails,
+        the old page is used for another round instead - the page must never
+        get lost, or the pool shrinks until every scrape waits forever.
+        """
+        page = await self.page_pool.get()
+
+        uses = self._page_uses.get(page, 0) + 1
+        if config.CONTEXT_ROTATE_EVERY and uses > config.CONTEXT_ROTATE_EVERY:
+            try:
+                page = await self._rotate_page(page)
+            except asyncio.CancelledError:
+                # Cancelled while rotating: the caller never gets the page,
+                # so put it back ourselves
+                self._release_page(page)
+                raise
+            except Exception as e:
+                logger.warning(f"Browser context rotation failed, keeping the old one: {e}")
+            uses = 1
+        self._page_uses[page] = uses
+
+        return page
+
+    async def _rotate_page(self, page):
+        """
+        Replace a page and its browser context with fresh ones.
+
+        WHY?
+        ----
+        A context collects cookies, cache, and history for as long as it
+        lives. Over a run of many thousands of lookups that keeps growing
+        Chromium's memory, so every so often the context is thrown away and
+        a new (warmed-up) one takes its place.
+
+        PARAMETERS:
+        -----------
+        page : Page
+            The page to replace (taken out of the pool by the caller)
+
+        RETURNS:
+        --------
+        Page
+            The new page
+        """
+        old_context = page.context
+        context, new_page = await self.new_context_page()
+        await self.warm_up(new_page)
+
+        # The main page/context are also used for HTTP details fetches
+        if page is self.page:
+            self.context, self.page = context, new_page
+
+        self._page_uses.pop(page, None)
+        self._search_forms.pop(page, None)
+        try:
+            await old_context.close()
+        except Exception as e:
+            logger.debug(f"Error closing old browser context: {e}")
+
+        logger.debug("Rotated browser context")
+        return new_page
+
+    def _release_page(self, page):
+        """Give a page back to the pool."""
+        self.page_pool.put_nowait(page)
+
+    async def warm_up(self, page=None):
+        """
+        Load the search page once to warm up the browser session.
+
+        The first navigation pays for DNS, the TLS handshake, and session
+        cookies; later navigations in the same context reuse all of that.
+        Any consent banner is dismissed here, once per context, so the search
+        methods never have to check for it.
+
+        A failure here is logged and ignored - the first real search will
+        simply pay the warm-up cost instead.
+        """
+        page = page or self.page
+        try:
+            await page.goto(config.BASE_URL, wait_until='domcontentloaded')
+
+            consent_button = await page.query_selector(CONSENT_SELECTOR)
+            if consent_button:
+                await consent_button.click(timeout=2000)
+        except Exception as e:
+            logger.warning(f"Warm-up navigation failed: {e}")
+
+    async def warm_up_http(self):
+        """
+        Open the plain-HTTP connection used for details pages ahead of time.
+
+        context.request (see scrape_business_by_guid_http) has its own
+        connections, separate from the browser pages, so warming up the pages
+        doesn't help it. Only done when config.HTTP_DETAILS is on.
+        """
+        if not config.HTTP_DETAILS:
+            return
+        try:
+            await self.context.request.head(config.BASE_URL)
+        except Exception as e:
+            logger.warning(f"HTTP warm-up request failed: {e}")
 
     async def close(self):
         """
@@ -682,10 +1610,63 @@ class MNBusinessScraper:
             # ... scraping code ...
         finally:
             await scraper.close()
+
+        When connected to a running browser (config.BROWSER_CDP_URL), this
+        only closes our contexts and disconnects - the browser keeps running
+        for the next run.
+
+        The main context's cookies are saved to self.storage_state_file
+        first, so the next run can skip setting up a new portal session.
+        The output CSV is written out and closed too (see close_csv()).
         """
+        self.close_csv()
+
         if self.browser:
+            await self.save_storage_state()
             await self.browser.close()
-            logger.info("Browser closed")
+            if config.BROWSER_CDP_URL:
+                logger.info("Disconnected from browser")
+            else:
+                logger.info("Browser closed")
+
+    async def save_storage_state(self):
+        """
+        Save the main context's cookies/local storage to
+        self.storage_state_file (if set). new_context_page() loads them
+        into every context it creates.
+
+        The JSON goes to a temporary file (named after this process) that is
+        then renamed over the old one, so a context being created meanwhile
+        never loads a half-written file.
+
+        A failure here is only logged - the next run just starts with a
+        fresh session.
+        """
+        if not self.storage_state_file or not self.context:
+            return
+        state_file = Path(self.storage_state_file)
+        tmp_file = state_file.with_name(f'{state_file.name}.{os.getpid()}.tmp')
+        try:
+            state = await self.context.storage_state()
+            with open(tmp_file, 'w') as f:
+                f.write(json.dumps(state, separators=(',', ':')))
+            os.replace(tmp_file, state_file)
+        except (PlaywrightError, OSError) as e:
+            logger.warning(f"Could not save session state: {e}")
+
+    def _scrape_date(self) -> str:
+        """
+        Get today's date (YYYY-MM-DD) for the scraped_at column.
+
+        Formatting the date for every business is wasted work when thousands
+        are scraped per day, so the string is cached until local midnight.
+        """
+        if time.time() >= self._today_expires:
+            now = datetime.now()
+            self._today = now.strftime('%Y-%m-%d')
+            midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+            self._today_expires = midnight.timestamp()
+        return self._today
 
     # =========================================================================
     # PROGRESS TRACKING METHODS
@@ -735,14 +1716,28 @@ class MNBusinessScraper:
 
         NOTE:
         -----
-        Progress is saved periodically (every 10 file numbers) during scraping,
-        and also when the script is interrupted or completes.
+        Progress is saved periodically (every config.PROGRESS_EVERY file
+        numbers handled) during scraping, and also when the script is interrupted or
+        completes. Saving the same number twice in a row is skipped.
+
+        The file is written to a temporary file first and then renamed over
+        the old one, so a crash mid-write can never leave a half-written
+        (unreadable) progress file behind.
         """
-        with open(self.progress_file, 'w') as f:
-            json.dump({
+        if file_number == self._last_saved_progress:
+            return
+
+        tmp_file = self.progress_file.with_name(self.progress_file.name + '.tmp')
+        with open(tmp_file, 'w') as f:
+            # Compact - the file is read by load_progress(), not people.
+            # json.dumps (not json.dump) so the C encoder does the work.
+            f.write(json.dumps({
                 'last_file_number': file_number,
                 'updated_at': datetime.now().isoformat()
-            }, f, indent=2)  # indent=2 makes the file human-readable
+            }, separators=(',', ':')))
+        os.replace(tmp_file, self.progress_file)  # Atomic rename
+
+        self._last_saved_progress = file_number
 
     # =========================================================================
     # CSV FILE MANAGEMENT METHODS
@@ -756,10 +1751,9 @@ class MNBusinessScraper:
         be appended to this file as they're scraped.
         """
         if not self.output_file.exists():
-            # Create an empty DataFrame with our columns
-            df = pd.DataFrame(columns=self.columns)
-            # Write to CSV (this creates a file with just headers)
-            df.to_csv(self.output_file, index=False)
+            # Write just the header row
+            with self._open_output('w') as f:
+                csv.writer(f).writerow(self.columns)
             logger.info(f"Created output file: {self.output_file}")
 
     def append_to_csv(self, data: dict):
@@ -773,19 +1767,94 @@ class MNBusinessScraper:
 
         NOTE:
         -----
-        This appends one row at a time. It's less efficient than batch writing,
-        but ensures data is saved immediately (no data loss if script crashes).
+        This writes the row immediately. The main loop uses queue_csv_row()
+        instead, which batches rows to avoid reopening the file for each one.
         """
-        # Create a DataFrame with a single row
-        df = pd.DataFrame([data])
-        # Append to CSV (mode='a'), don't write headers again (header=False)
-        df.to_csv(self.output_file, mode='a', header=False, index=False)
+        self._csv_buffer.append(data)
+        self._flush_csv()
+
+    def queue_csv_row(self, data: dict):
+        """
+        Add a business record to the write buffer.
+
+        The buffer is written out once it holds config.CSV_FLUSH_EVERY rows
+        or config.CSV_FLUSH_SECONDS have passed since the last write (so slow
+        stretches don't keep rows in memory for long), and whenever run()
+        saves progress or stops, so a saved progress
+        position never points past rows that are still only in memory.
+
+        PARAMETERS:
+        -----------
+        data : dict
+            Dictionary with keys matching self.columns and values for each field.
+        """
+        self._csv_buffer.append(data)
+        if (len(self._csv_buffer) >= config.CSV_FLUSH_EVERY
+                or time.monotonic() - self._csv_flushed_at >= config.CSV_FLUSH_SECONDS):
+            self._flush_csv()
+
+    def _open_output(self, mode: str):
+        """
+        Open the output CSV for writing ('w') or appending ('a').
+
+        Opens it as gzip when config.COMPRESS_OUTPUT is on; each append then
+        adds a new gzip member, which readers treat as one continuous file.
+        """
+        if self.csv_compression:
+            return gzip.open(self.output_file, mode + 't', compresslevel=1,
+                             encoding='utf-8', newline='')
+        return open(self.output_file, mode, encoding='utf-8', newline='')
+
+    def _flush_csv(self):
+        """
+        Write all buffered rows to the CSV file.
+
+        A plain CSV is opened once (with a 1 MiB buffer) and kept open; each
+        flush is one writerows() plus a flush to the OS, so rows are on disk
+        as far as other programs (and a crash of this one) are concerned.
+        close_csv() syncs and closes it.
+
+        A gzip CSV is still opened and closed for every flush, because a gzip
+        stream can't be read back until it has been closed - each flush adds
+        one complete gzip member.
+        """
+        if not self._csv_buffer:
+            return
+
+        if self.csv_compression:
+            with self._open_output('a') as f:
+                csv.DictWriter(f, fieldnames=self.columns).writerows(self._csv_buffer)
+        else:
+            if self._csv_file is None:
+                self._csv_file = open(self.output_file, 'a', encoding='utf-8',
+                                      newline='', buffering=1 << 20)
+                self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=self.columns)
+            self._csv_writer.writerows(self._csv_buffer)
+            self._csv_file.flush()
+
+        self._csv_buffer.clear()
+        self._csv_flushed_at = time.monotonic()
+
+    def close_csv(self):
+        """
+        Write any buffered rows, then sync and close the output file.
+
+        os.fsync() makes sure the rows have reached the disk itself (not just
+        the OS cache) before the scraper exits.
+        """
+        self._flush_csv()
+        if self._csv_file is not None:
+            os.fsync(self._csv_file.fileno())
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
 
     # =========================================================================
     # SEARCH METHODS
     # =========================================================================
 
-    async def search_by_file_number(self, file_number: int) -> tuple[bool, str]:
+    async def search_by_file_number(self, file_number: int, page=None,
+                                    open_details: bool = True) -> tuple[bool, str]:
         """
         Search for a business by its file number.
 
@@ -796,6 +1865,11 @@ class MNBusinessScraper:
         -----------
         file_number : int
             The MN SOS file number to search for.
+        page : Page, optional
+            The browser page to use (default: the main page, self.page)
+        open_details : bool
+            If False, stop on the results page instead of clicking through
+            to the details page (see fetch_details_from_results)
 
         RETURNS:
         --------
@@ -805,76 +1879,185 @@ class MNBusinessScraper:
 
         HOW IT WORKS:
         -------------
-        1. Navigate to the search page
+        1. Navigate to the search page (skipped if the page is still showing
+           the search form from the last lookup)
         2. Click the "File Number" tab
         3. Enter the file number
         4. Click search
         5. Check for results
         6. If found, click through to the details page
+
+        If config.DIRECT_DETAILS_LOOKUP is on, the details page URL is tried
+        first and the search form is only used when that doesn't work.
         """
+        page = page or self.page
+
+        if config.DIRECT_DETAILS_LOOKUP:
+            found, business_name = await self.open_details_directly(file_number, page)
+            if found:
+                return True, business_name
+
         try:
-            # Navigate to search page
-            # wait_until='networkidle' waits for network to be quiet
-            await self.page.goto(config.BASE_URL, wait_until='networkidle')
-
-            # Click the "File Number" tab to show the file number search field
-            file_number_tab = await self.page.wait_for_selector(
-                'a[href="#fileNumberTab"]',
-                timeout=10000
-            )
-            await file_number_tab.click()
-            await asyncio.sleep(0.3)  # Brief wait for tab animation
+            # Submit the search from the form already on the page if there is
+            # one (e.g. the results page after a miss), otherwise load it
+            if not await self._submit_from_current_page(page, file_number):
+                await self._submit_from_search_page(page, file_number)
+
+            # Wait for results to load: continue the moment either the
+            # "no results" message or a results/details element shows up,
+            # instead of waiting for the network to go quiet (networkidle
+            # needs 500ms of silence, longer with analytics beacons)
+            await (page.locator(NO_RESULTS_SELECTOR)
+                   .or_(page.locator(RESULTS_READY_SELECTOR))
+                   .first.wait_for(timeout=config.RESULTS_TIMEOUT))
+
+            # Find out which one showed up (one call to the browser)
+            outcome = await page.evaluate(SEARCH_OUTCOME_JS)
+            business_name = outcome['name']
+
+            # Click the "Details" link to go to full business page
+            if outcome['details']:
+                if open_details:
+                    await self.open_details_link(page)
+                return True, business_name
+
+            # Check for "no results" message
+            if outcome['noResults']:
+                return False, ''
+
+            # Check if we're already on a details page
+            current_url = page.url
+            if 'SearchDetails' in current_url or 'Details' in current_url:
+                return True, business_name
+
+            return False, ''
+
+        except PlaywrightTimeout:
+            logger.warning(f"Timeout searching for file number {file_number}")
+            return False, ''
+        except Exception as e:
+            logger.error(f"Error searching file number {file_number}: {e}")
+            return False, ''
+
+    async def open_details_link(self, page):
+        """Click the first "Details" link on a results page and wait for it."""
+        await page.locator(DETAILS_LINK_SELECTOR).first.click()
+        # The details page is ready once its label/value list exists
+        await page.wait_for_selector('dt', timeout=config.RESULTS_TIMEOUT)
 
-            # Wait for the file number input field to be visible
-            await self.page.wait_for_selector('#FileNumber:visible', timeout=5000)
+    async def _submit_from_search_page(self, page, file_number: int):
+        """
+        Load the search page and submit a file number search.
+
+        PARAMETERS:
+        -----------
+        page : Page
+            The browser page to use
+        file_number : int
+            The file number to search for
+        """
+        # Navigate to search page
+        # The session is already warm (see warm_up()), so there's no need
+        # to wait for the network to go quiet - waiting for the tab below
+        # is enough.
+        await page.goto(config.BASE_URL, wait_until='domcontentloaded')
+
+        # Click the "File Number" tab to show the file number search field
+        file_number_tab = await page.wait_for_selector(
+            'a[href="#fileNumberTab"]',
+            timeout=10000
+        )
+        await file_number_tab.click()
+
+        # Wait for the file number input field to be visible (this also
+        # covers the tab animation - no fixed sleep needed)
+        await page.wait_for_selector('#FileNumber:visible', timeout=5000)
+
+        # Clear any existing value and enter our file number
+        await page.fill('#FileNumber', str(file_number))
+
+        # Click the search button (within the file number tab)
+        await page.click('#fileNumberTab button[type="submit"]')
+
+    async def _submit_from_current_page(self, page, file_number: int) -> bool:
+        """
+        Submit a file number search using the form on the current page.
+
+        After a search the page still shows the search form (unless we went
+        on to a details page), so the next search can be submitted straight
+        from it, saving a full load of the search page.
+
+        RETURNS:
+        --------
+        bool
+            True if the search was submitted and the results page has loaded,
+            False if there's no usable form here (or it didn't work) and the
+            search page has to be loaded instead
+        """
+        if not await page.locator('#FileNumber:visible').count():
+            return False
 
-            # Clear any existing value and enter our file number
-            await self.page.fill('#FileNumber', str(file_number))
+        try:
+            await page.fill('#FileNumber', str(file_number))
+            # Wait for the new page to load, so the old results still on
+            # screen aren't mistaken for the answer
+            async with page.expect_navigation(wait_until='domcontentloaded',
+                                              timeout=config.RESULTS_TIMEOUT):
+                await page.click('#fileNumberTab button[type="submit"]')
+            return True
+        except PlaywrightError as e:
+            logger.debug(f"Search from current page failed for {file_number}: {e}")
+            return False
+
+    async def open_details_directly(self, file_number: int, page=None) -> tuple[bool, str]:
+        """
+        Try to open a business details page straight from its file number.
 
-            # Click the search button (within the file number tab)
-            await self.page.click('#fileNumberTab button[type="submit"]')
+        This skips the search form entirely (one navigation instead of three
+        plus a form submit). Any failure just returns (False, '') so the caller
+        can fall back to the normal search.
 
-            # Wait for results to load
-            await self.page.wait_for_load_state('networkidle')
-            await asyncio.sleep(0.5)  # Extra wait for dynamic content
+        PARAMETERS:
+        -----------
+        file_number : int
+            The MN SOS file number to look up.
+        page : Page, optional
+            The browser page to use (default: the main page, self.page)
 
-            # Check for "no results" message
-            page_text = await self.page.inner_text('body')
-            if 'no results' in page_text.lower() or 'no businesses found' in page_text.lower():
-                return False, ''
+        RETURNS:
+        --------
+        tuple[bool, str]
+            - found: True if the details page loaded
+            - business_name: The name from the page heading, or empty string
+        """
+        page = page or self.page
 
-            # Try to get the business name from results
-            name_element = await self.page.query_selector('table tbody tr td strong')
-            business_name = ''
-            if name_element:
-                business_name = (await name_element.inner_text()).strip()
+        try:
+            url = f"{config.DETAILS_URL}?fileNumber={file_number}"
+            await page.goto(url, wait_until='domcontentloaded')
 
-            # Click the "Details" link to go to full business page
-            details_link = await self.page.query_selector('a[href*="SearchDetails"]')
-            if details_link:
-                await details_link.click()
-                await self.page.wait_for_load_state('networkidle')
-                return True, business_name
+            # Details pages are built from <dt>/<dd> pairs
+            await page.wait_for_selector('dt', timeout=config.DIRECT_DETAILS_TIMEOUT)
 
-            # Check if we're already on a details page
-            current_url = self.page.url
-            if 'SearchDetails' in current_url or 'Details' in current_url:
-                return True, business_name
+            # Check the title and read the heading from one copy of the HTML
+            # (parsed in Python) instead of three calls into the browser
+            page_data = parse_details_html(await page.content())
+            if 'Details' not in page_data['title']:
+                return False, ''
 
-            return False, ''
+            return True, page_data['heading']
 
         except PlaywrightTimeout:
-            logger.warning(f"Timeout searching for file number {file_number}")
             return False, ''
         except Exception as e:
-            logger.error(f"Error searching file number {file_number}: {e}")
+            logger.debug(f"Direct details lookup failed for {file_number}: {e}")
             return False, ''
 
     # =========================================================================
     # DATA EXTRACTION METHODS
     # =========================================================================
 
-    async def extract_text(self, selector: str, default: str = '') -> str:
+    async def extract_text(self, selector: str, default: str = '', page=None) -> str:
         """
         Extract text from an element on the page.
 
@@ -887,22 +2070,28 @@ class MNBusinessScraper:
             CSS selector for the element (e.g., 'h2', '.class-name', '#id')
         default : str
             Value to return if element isn't found (default: empty string)
+        page : Page, optional
+            The browser page to use (default: the main page, self.page)
 
         RETURNS:
         --------
         str
             The text content of the element, or the default value
         """
+        page = page or self.page
+
         try:
-            element = await self.page.query_selector(selector)
-            if element:
-                text = await element.inner_text()
+            # One call to the browser, instead of query_selector() and then
+            # inner_text() on the element it returns
+            text = await page.evaluate(EXTRACT_TEXT_JS, selector)
+            if text is not None:
                 return text.strip()
         except Exception:
             pass
         return default
 
-    async def extract_business_data(self, file_number: int, business_name: str = '') -> dict:
+    async def extract_business_data(self, file_number: int, business_name: str = '',
+                                    page=None) -> dict:
         """
         Extract all available data from a business details page.
 
@@ -915,6 +2104,8 @@ class MNBusinessScraper:
             The file number (or GUID) of the business
         business_name : str
             The business name (may be pre-populated from search results)
+        page : Page, optional
+            The browser page to use (default: the main page, self.page)
 
         RETURNS:
         --------
@@ -931,261 +2122,186 @@ class MNBusinessScraper:
         - Applicant/Markholder information
         - Filing history
         """
-        # Initialize data dictionary with all fields set to empty
-        data = {
-            'file_number': file_number,
-            'business_name': business_name,
-            'mn_statute': '',
-            'business_type': '',
-            'home_jurisdiction': '',
-            'filing_date': '',
-            'status': '',
-            'renewal_due_date': '',
-            'mark_type': '',
-            'number_of_shares': '',
-            'chief_executive_officer': '',
-            'manager': '',
-            # Principal Place of Business address
-            'principal_street_number': '',
-            'principal_street_name': '',
-            'principal_street_type': '',
-            'principal_street_direction': '',
-            'principal_unit': '',
-            'principal_city': '',
-            'principal_state': '',
-            'principal_zip': '',
-            'principal_address_raw': '',
-            # Registered Office Address
-            'reg_office_street_number': '',
-            'reg_office_street_name': '',
-            'reg_office_street_type': '',
-            'reg_office_street_direction': '',
-            'reg_office_unit': '',
-            'reg_office_city': '',
-            'reg_office_state': '',
-            'reg_office_zip': '',
-            'reg_office_address_raw': '',
-            # Principal Executive Office Address
-            'exec_office_street_number': '',
-            'exec_office_street_name': '',
-            'exec_office_street_type': '',
-            'exec_office_street_direction': '',
-            'exec_office_unit': '',
-            'exec_office_city': '',
-            'exec_office_state': '',
-            'exec_office_zip': '',
-            'exec_office_address_raw': '',
-            # Applicant/Markholder info
-            'applicant_name': '',
-            'applicant_street_number': '',
-            'applicant_street_name': '',
-            'applicant_street_type': '',
-            'applicant_street_direction': '',
-            'applicant_unit': '',
-            'applicant_city': '',
-            'applicant_state': '',
-            'applicant_zip': '',
-            'applicant_address_raw': '',
-            # Additional fields
-            'registered_agent_name': '',
-            'filing_history': '',
-            'scraped_at': datetime.now().strftime('%Y-%m-%d')
-        }
+        page = page or self.page
 
+        fields, tables = [], []
         try:
-            # =================================================================
-            # MAPPING: Website labels -> our field names
-            # =================================================================
-            # This maps the text in <dt> elements to our data fields
-            label_mapping = {
-                'business type': 'business_type',
-                'mn statute': 'mn_statute',
-                'home jurisdiction': 'home_jurisdiction',
-                'filing date': 'filing_date',
-                'date of incorporation': 'filing_date',  # Alternative label
-                'status': 'status',
-                'renewal due date': 'renewal_due_date',
-                'mark type': 'mark_type',
-                'number of shares': 'number_of_shares',
-                'chief executive officer': 'chief_executive_officer',
-                'manager': 'manager',
-                'registered agent': 'registered_agent_name',
-                'registered agent(s)': 'registered_agent_name',
-            }
-
-            # Variables to hold raw addresses for parsing later
-            principal_address_raw = ''
-            reg_office_address_raw = ''
-            exec_office_address_raw = ''
-
-            # =================================================================
-            # EXTRACT DT/DD PAIRS
-            # =================================================================
-            # Get all <dt> elements on the page
-            dts = await self.page.query_selector_all('dt')
-
-            for dt in dts:
-                try:
-                    # Get the label text (lowercase for matching)
-                    label = (await dt.inner_text()).strip().lower()
+            fields, tables = await self.read_details_page(page)
+        except Exception as e:
+            logger.error(f"Error extracting data for file {file_number}: {e}")
 
-                    # Get the corresponding <dd> value
-                    # This JavaScript gets the next sibling element's text
-                    dd_text = await dt.evaluate(
-                        'el => el.nextElementSibling?.innerText || ""'
-                    )
-                    dd_text = dd_text.strip()
-
-                    # Check for Principal Place of Business Address
-                    if 'principal place of business' in label and 'address' in label:
-                        principal_address_raw = dd_text
-                        data['principal_address_raw'] = dd_text
-                        continue
-
-                    # Check for Principal Executive Office Address
-                    if 'principal executive office' in label and 'address' in label:
-                        exec_office_address_raw = dd_text
-                        data['exec_office_address_raw'] = dd_text
-                        continue
-
-                    # Check for Registered Office Address
-                    if 'registered office' in label and 'address' in label:
-                        reg_office_address_raw = dd_text
-                        data['reg_office_address_raw'] = dd_text
-                        continue
-
-                    # Map other standard fields
-                    for key, field in label_mapping.items():
-                        if key in label and dd_text:
-                            # Only set if not already set (first match wins)
-                            if not data[field]:
-                                data[field] = dd_text
-                            break
-
-                except Exception:
-                    # Skip problematic elements and continue
-                    continue
+        return self.build_business_record(file_number, business_name, fields, tables)
+
+    async def read_details_page(self, page) -> tuple[list, list]:
+        """
+        Read the raw label/value pairs and tables from a details page.
 
-            # =================================================================
-            # PARSE ADDRESSES INTO COMPONENTS
-            # =================================================================
-
-            if principal_address_raw:
-                parsed = parse_address(principal_address_raw)
-                data['principal_street_number'] = parsed['street_number']
-                data['principal_street_name'] = parsed['street_name']
-                data['principal_street_type'] = parsed['street_type']
-                data['principal_street_direction'] = parsed['street_direction']
-                data['principal_unit'] = parsed['unit']
-                data['principal_city'] = parsed['city']
-                data['principal_state'] = parsed['state']
-                data['principal_zip'] = parsed['zip']
-
-            if reg_office_address_raw:
-                parsed = parse_address(reg_office_address_raw)
-                data['reg_office_street_number'] = parsed['street_number']
-                data['reg_office_street_name'] = parsed['street_name']
-                data['reg_office_street_type'] = parsed['street_type']
-                data['reg_office_street_direction'] = parsed['street_direction']
-                data['reg_office_unit'] = parsed['unit']
-                data['reg_office_city'] = parsed['city']
-                data['reg_office_state'] = parsed['state']
-                data['reg_office_zip'] = parsed['zip']
-
-            if exec_office_address_raw:
-                parsed = parse_address(exec_office_address_raw)
-                data['exec_office_street_number'] = parsed['street_number']
-                data['exec_office_street_name'] = parsed['street_name']
-                data['exec_office_street_type'] = parsed['street_type']
-                data['exec_office_street_direction'] = parsed['street_direction']
-                data['exec_office_unit'] = parsed['unit']
-                data['exec_office_city'] = parsed['city']
-                data['exec_office_state'] = parsed['state']
-                data['exec_office_zip'] = parsed['zip']
-
-            # =================================================================
-            # EXTRACT APPLICANT/MARKHOLDER FROM TABLE
-            # =================================================================
-
-            tables = await self.page.query_selector_all('table')
-
-            for table in tables:
-                # Get table headers
-                headers = await table.query_selector_all('th')
-                header_texts = [(await h.inner_text()).strip().lower() for h in headers]
-
-                # Check if this is the applicant or markholder table
-                is_applicant_table = any('applicant' in h for h in header_texts)
-                is_markholder_table = any('markholder' in h for h in header_texts)
-
-                if is_applicant_table or is_markholder_table:
-                    rows = await table.query_selector_all('tbody tr')
-                    if rows:
-                        cells = await rows[0].query_selector_all('td')
-                        if len(cells) >= 2:
-                            # First cell: Name
-                            data['applicant_name'] = (await cells[0].inner_text()).strip()
-                            # Second cell: Address
-                            applicant_addr_raw = (await cells[1].inner_text()).strip()
-                            data['applicant_address_raw'] = applicant_addr_raw
-
-                            # Parse the address
-                            parsed = parse_address(applicant_addr_raw)
-                            data['applicant_street_number'] = parsed['street_number']
-                            data['applicant_street_name'] = parsed['street_name']
-                            data['applicant_street_type'] = parsed['street_type']
-                            data['applicant_street_direction'] = parsed['street_direction']
-                            data['applicant_unit'] = parsed['unit']
-                            data['applicant_city'] = parsed['city']
-                            data['applicant_state'] = parsed['state']
-                            data['applicant_zip'] = parsed['zip']
-                    break
-
-            # =================================================================
-            # EXTRACT FILING HISTORY
-            # =================================================================
-
-            filing_history = []
-
-            for table in tables:
-                headers = await table.query_selector_all('th')
-                header_texts = [(await h.inner_text()).strip().lower() for h in headers]
-
-                # Find the filing history table
-                if any('filing' in h for h in header_texts) and \
-                   not any('applicant' in h for h in header_texts):
-                    rows = await table.query_selector_all('tbody tr')
-                    for row in rows:
-                        try:
-                            cells = await row.query_selector_all('td')
-                            if cells:
-                                row_data = []
-                                for cell in cells:
-                                    text = (await cell.inner_text()).strip()
-                                    if text:
-                                        row_data.append(text)
-                                if row_data:
-                                    # Join cell values with pipe separator
-                                    filing_history.append(' | '.join(row_data))
-                        except Exception:
-                            continue
-                    break
-
-            # Join all filing history entries (max 20 to avoid huge strings)
-            if filing_history:
-                data['filing_history'] = ' ;; '.join(filing_history[:20])
-
-            # =================================================================
-            # CONVERT DATES TO ISO FORMAT
-            # =================================================================
-
-            if data.get('filing_date'):
-                data['filing_date'] = convert_date_to_iso(data['filing_date'])
-            if data.get('renewal_due_date'):
-                data['renewal_due_date'] = convert_date_to_iso(data['renewal_due_date'])
+        PARAMETERS:
+        -----------
+        page : Page
+            A browser page showing a business details page
 
-        except Exception as e:
-            logger.error(f"Error extracting data for file {file_number}: {e}")
+        RETURNS:
+        --------
+        tuple[list, list]
+            - fields: list of (label, value) tuples from the <dt>/<dd> pairs,
+              labels lowercased
+            - tables: list of {'headers': [...], 'rows': [[...], ...]} dicts,
+              headers lowercased
+
+        See parse_details_html(), which does the actual parsing.
+        """
+        # One call to the browser for the whole HTML, then parse it here.
+        # Reading each <dt>/<dd>/<td> with query_selector would cost a
+        # round-trip to the Playwright driver per element.
+        html = await page.content()
+        parsed = parse_details_html(html)
+        return parsed['fields'], parsed['tables']
+
+    def build_business_record(self, file_number, business_name: str,
+                              fields: list, tables: list) -> dict:
+        """
+        Build a business record from the raw contents of a details page.
+
+        This is pure Python (no browser calls), so the same logic is used no
+        matter how the page was fetched - see read_details_page() and
+        parse_details_html() for the two sources of fields/tables.
+
+        PARAMETERS:
+        -----------
+        file_number : int or str
+            The file number (or GUID) of the business
+        business_name : str
+            The business name
+        fields : list
+            (label, value) tuples from the <dt>/<dd> pairs, labels lowercased
+        tables : list
+            {'headers': [...], 'rows': [[...], ...]} dicts, headers lowercased
+
+        RETURNS:
+        --------
+        dict
+            Dictionary with all business fields populated (or empty strings)
+        """
+        # Initialize data dictionary with all fields set to empty
+        # self.columns is the single source of truth for the schema, so every
+        # CSV column exists even if the page doesn't have that field.
+        data = dict.fromkeys(self.columns, '')
+        data['file_number'] = file_number
+        data['business_name'] = business_name
+        data['scraped_at'] = self._scrape_date()
+
+        # Variables to hold raw addresses for parsing later
+        principal_address_raw = ''
+        reg_office_address_raw = ''
+        exec_office_address_raw = ''
+
+        # =====================================================================
+        # MAP DT/DD PAIRS TO FIELDS
+        # =====================================================================
+
+        for label, dd_text in fields:
+            # Check for Principal Place of Business Address
+            if 'principal place of business' in label and 'address' in label:
+                principal_address_raw = dd_text
+                data['principal_address_raw'] = dd_text
+                continue
+
+            # Check for Principal Executive Office Address
+            if 'principal executive office' in label and 'address' in label:
+                exec_office_address_raw = dd_text
+                data['exec_office_address_raw'] = dd_text
+                continue
+
+            # Check for Registered Office Address
+            if 'registered office' in label and 'address' in label:
+                reg_office_address_raw = dd_text
+                data['reg_office_address_raw'] = dd_text
+                continue
+
+            # Map other standard fields (see LABEL_FIELDS)
+            field = label_field(label)
+            if field and dd_text and not data[field]:
+                # Only set if not already set (first match wins)
+                data[field] = dd_text
+
+        # =====================================================================
+        # PARSE ADDRESSES INTO COMPONENTS
+        # =====================================================================
+
+        # Offices often share one address (e.g. principal executive office
+        # = registered office), so each distinct address text in this record
+        # is parsed once. Empty addresses are skipped.
+        parsed_addresses = {}
+        for columns, address_raw in (
+                (PRINCIPAL_ADDRESS_COLUMNS, principal_address_raw),
+                (REG_OFFICE_ADDRESS_COLUMNS, reg_office_address_raw),
+                (EXEC_OFFICE_ADDRESS_COLUMNS, exec_office_address_raw)):
+            if address_raw:
+                parts = parsed_addresses.get(address_raw)
+                if parts is None:
+                    parts = parsed_addresses[address_raw] = parse_address_parts(address_raw)
+                data.update(zip(columns, parts))
+
+        # =====================================================================
+        # APPLICANT/MARKHOLDER AND FILING HISTORY FROM TABLES
+        # =====================================================================
+        # One pass over the tables, using each table's headers to decide
+        # which kind of table it is.
+
+        applicant_done = False
+        filing_history = []
+        filing_done = False
+
+        for table in tables:
+            header_texts = table['headers']
+            rows = table['rows']
+
+            has_applicant = any('applicant' in h for h in header_texts)
+
+            # Applicant or markholder table (first one wins)
+            if not applicant_done and (
+                    has_applicant or any('markholder' in h for h in header_texts)):
+                applicant_done = True
+                if rows and len(rows[0]) >= 2:
+                    # First cell: Name
+                    data['applicant_name'] = rows[0][0]
+                    # Second cell: Address
+                    applicant_addr_raw = rows[0][1]
+                    data['applicant_address_raw'] = applicant_addr_raw
+
+                    # Parse the address (unless an office above had the same one)
+                    if applicant_addr_raw:
+                        parts = parsed_addresses.get(applicant_addr_raw)
+                        if parts is None:
+                            parts = parse_address_parts(applicant_addr_raw)
+                        data.update(zip(APPLICANT_ADDRESS_COLUMNS, parts))
+
+            # Filing history table (first one wins)
+            if not filing_done and not has_applicant and \
+               any('filing' in h for h in header_texts):
+                filing_done = True
+                for cells in rows:
+                    row_data = [text for text in cells if text]
+                    if row_data:
+                        # Join cell values with pipe separator
+                        filing_history.append(' | '.join(row_data))
+
+            if applicant_done and filing_done:
+                break
+
+        # Join all filing history entries (max 20 to avoid huge strings)
+        if filing_history:
+            data['filing_history'] = ' ;; '.join(filing_history[:20])
+
+        # =====================================================================
+        # CONVERT DATES TO ISO FORMAT
+        # =====================================================================
+
+        if data.get('filing_date'):
+            data['filing_date'] = convert_date_to_iso(data['filing_date'])
+        if data.get('renewal_due_date'):
+            data['renewal_due_date'] = convert_date_to_iso(data['renewal_due_date'])
 
         return data
 
@@ -1210,26 +2326,54 @@ class MNBusinessScraper:
         dict or None
             Business data dictionary if found, None if not found or error
         """
-        for attempt in range(config.MAX_RETRIES):
-            try:
-                # Search for the business
-                found, business_name = await self.search_by_file_number(file_number)
+        # Read the retry setting once instead of on every attempt
+        max_retries = config.MAX_RETRIES
+        http_details = config.HTTP_DETAILS
+        http_search = config.HTTP_SEARCH
 
-                if not found:
-                    return None
-
-                # Extract data from the details page
-                data = await self.extract_business_data(file_number, business_name)
-                return data
+        # Borrow a page from the pool so concurrent scrapes don't collide
+        page = await self._acquire_page()
+        try:
+            for attempt in range(max_retries):
+                try:
+                    # Fastest: search and fetch details with plain HTTP
+                    if http_search:
+                        result = await self.search_file_number_http(file_number, page)
+                        if result is not None:
+                            return result or None  # False means not found
+
+                    # Search for the business. With HTTP_DETAILS on, stay on
+                    # the results page and fetch the details page without
+                    # the browser; click through only if that doesn't work.
+                    found, business_name = await self.search_by_file_number(
+                        file_number, page, open_details=not http_details
+                    )
 
-            except Exception as e:
-                logger.warning(f"Attempt {attempt + 1} failed for file {file_number}: {e}")
-                if attempt < config.MAX_RETRIES - 1:
-                    # Wait before retrying
-                    await asyncio.sleep(config.RETRY_DELAY)
-                else:
-                    logger.error(f"All retries failed for file {file_number}")
-                    return None
+                    if not found:
+                        return None
+
+                    if http_details and 'Details' not in page.url:
+                        data = await self.fetch_details_from_results(
+                            file_number, business_name, page
+                        )
+                        if data is not None:
+                            return data
+                        await self.open_details_link(page)
+
+                    # Extract data from the details page
+                    data = await self.extract_business_data(file_number, business_name, page)
+                    return data
+
+                except RETRYABLE_ERRORS as e:
+                    logger.warning(f"Attempt {attempt + 1} failed for file {file_number}: {e}")
+                    if attempt < max_retries - 1:
+                        # Wait before retrying (longer after each failure)
+                        await asyncio.sleep(self.retry_delay(attempt))
+                    else:
+                        logger.error(f"All retries failed for file {file_number}")
+                        return None
+        finally:
+            self._release_page(page)
 
         return None
 
@@ -1249,40 +2393,265 @@ class MNBusinessScraper:
         --------
         dict or None
             Business data dictionary if found, None if not found or error
-        """
-        for attempt in range(config.MAX_RETRIES):
-            try:
-                # Navigate directly to the details page using GUID
-                url = f'https://mblsportal.sos.mn.gov/Business/SearchDetails?filingGuid={guid}'
-                await self.page.goto(url, wait_until='networkidle')
-                await asyncio.sleep(0.5)
-
-                # Check if we got a valid page
-                title = await self.page.title()
-                if 'Details' not in title:
-                    return None
 
-                # Get business name from h2 heading
-                business_name = ''
-                h2 = await self.page.query_selector('h2')
-                if h2:
-                    business_name = (await h2.inner_text()).strip()
+        FAST PATH:
+        ----------
+        If config.HTTP_DETAILS is on, the page is first fetched as plain HTTP
+        (no rendering), and the browser is only used if that doesn't work.
 
-                # Extract data (use GUID as file_number for tracking)
-                data = await self.extract_business_data(guid, business_name)
+        RATE LIMIT:
+        -----------
+        Every request waits for wait_for_detail_slot(), so callers running
+        many lookups at once don't need their own delays. Failed attempts are
+        retried with exponential backoff (see retry_delay()).
+        """
+        if config.HTTP_DETAILS:
+            await self.wait_for_detail_slot()
+            data = await self.scrape_business_by_guid_http(guid)
+            if data is not None:
                 return data
 
-            except Exception as e:
-                logger.warning(f"Attempt {attempt + 1} failed for GUID {guid}: {e}")
-                if attempt < config.MAX_RETRIES - 1:
-                    await asyncio.sleep(config.RETRY_DELAY)
-                else:
-                    logger.error(f"All retries failed for GUID {guid}")
-                    return None
+        # Read the retry setting once instead of on every attempt
+        max_retries = config.MAX_RETRIES
+
+        # Borrow a page from the pool so concurrent scrapes don't collide
+        page = await self._acquire_page()
+        try:
+            for attempt in range(max_retries):
+                try:
+                    await self.wait_for_detail_slot()
+                    # Navigate directly to the details page using GUID
+                    url = f'{config.DETAILS_URL}?filingGuid={guid}'
+                    # The details page is server-rendered, so everything we
+                    # read is in the initial HTML - no need to wait for the
+                    # network to go quiet
+                    await page.goto(url, wait_until='domcontentloaded')
+
+                    # Everything (title, business name, fields, tables) comes
+                    # from a single page.content() call, parsed here
+                    page_data = parse_details_html(await page.content())
+
+                    # Check if we got a valid page
+                    if 'Details' not in page_data['title']:
+                        return None
+
+                    # Build the record (use GUID as file_number for tracking);
+                    # the business name is the h2 heading
+                    return self.build_business_record(
+                        guid, page_data['heading'],
+                        page_data['fields'], page_data['tables']
+                    )
+
+                except RETRYABLE_ERRORS as e:
+                    logger.warning(f"Attempt {attempt + 1} failed for GUID {guid}: {e}")
+                    if attempt < max_retries - 1:
+                        await asyncio.sleep(self.retry_delay(attempt))
+                    else:
+                        logger.error(f"All retries failed for GUID {guid}")
+                        return None
+        finally:
+            self._release_page(page)
 
         return None
 
-    async def add_delay(self):
+    async def scrape_business_by_guid_http(self, guid: str) -> dict | None:
+        """
+        Scrape a business by GUID with a plain HTTP request (no browser).
+
+        Details pages are server-rendered, so the HTML can be fetched with the
+        browser context's HTTP client (same cookies and user agent, reused
+        connections) and parsed in-process. This skips rendering, JavaScript,
+        and the per-element browser calls entirely.
+
+        PARAMETERS:
+        -----------
+        guid : str
+            The GUID of the business (from search results URL)
+
+        RETURNS:
+        --------
+        dict or None
+            Business data dictionary, or None if the response doesn't look
+            like a details page (the caller then falls back to the browser)
+        """
+        url = f'{config.DETAILS_URL}?filingGuid={guid}'
+        return await self.fetch_details_http(url, guid, '', self.context.request)
+
+    async def search_file_number_http(self, file_number: int, page):
+        """
+        Search for a file number by submitting the search form over HTTP.
+
+        The first time for each page, the search form is read from the
+        browser (its action URL and all fields, including the anti-forgery
+        token). After that every search is a single HTTP request through
+        the page's own HTTP client (same cookies/session) - no clicking,
+        filling, or rendering - and the details page is fetched the same way.
+
+        PARAMETERS:
+        -----------
+        file_number : int
+            The file number to search for
+        page : Page
+            The pool page whose form and session are used
+
+        RETURNS:
+        --------
+        dict, False, or None
+            - dict: The business data
+            - False: The search said there are no results
+            - None: Couldn't tell (no form, unexpected response, ...) - the
+              caller falls back to the browser search
+        """
+        form = self._search_forms.get(page)
+        try:
+            if form is None:
+                if not page.url.startswith(config.BASE_URL):
+                    await page.goto(config.BASE_URL, wait_until='domcontentloaded')
+                form = await page.evaluate(SEARCH_FORM_JS)
+                if not form:
+                    return None
+                self._search_forms[page] = form
+
+            fields = dict(form['fields'], FileNumber=str(file_number))
+            request = page.context.request
+            if form['method'] == 'post':
+                response = await request.post(form['action'], form=fields)
+            else:
+                response = await request.get(form['action'], params=fields)
+
+            if not response.ok:
+                # The token may have expired - capture the form again next time
+                self._search_forms.pop(page, None)
+                return None
+
+            found, business_name, href = parse_search_results_html(await response.text())
+
+        except PlaywrightError as e:
+            logger.debug(f"HTTP search failed for file {file_number}: {e}")
+            self._search_forms.pop(page, None)
+            return None
+
+        if found is None:
+            self._search_forms.pop(page, None)
+            return None
+        if not found:
+            return False
+
+        return await self.fetch_details_http(
+            urljoin(response.url, href), file_number, business_name, request
+        )
+
+    async def fetch_details_from_results(self, file_number: int, business_name: str,
+                                         page) -> dict | None:
+        """
+        Fetch the details page linked from a search results page over HTTP.
+
+        Only the search form needs the browser. The details page it links to
+        is plain HTML, so it's fetched with the page's own HTTP client (same
+        cookies/session) and parsed in-process. The page itself stays on the
+        results, where the next search can be submitted straight away.
+
+        RETURNS:
+        --------
+        dict or None
+            Business data dictionary, or None if there's no link or the
+            response doesn't look like a details page (the caller then
+            clicks through in the browser instead)
+        """
+        url = await page.evaluate(DETAILS_HREF_JS)
+        if not url:
+            return None
+        return await self.fetch_details_http(url, file_number, business_name,
+                                             page.context.request)
+
+    async def fetch_details_http(self, url: str, record_id, business_name: str,
+                                 request_context) -> dict | None:
+        """
+        Fetch a details page with a plain HTTP request and build the record.
+
+        PARAMETERS:
+        -----------
+        url : str
+            The details page URL
+        record_id : int or str
+            File number (or GUID) stored in the record's file_number column
+        business_name : str
+            Name from the search results ('' to use the page's h2 heading)
+        request_context : APIRequestContext
+            The HTTP client to use (context.request of a browser context)
+
+        RETURNS:
+        --------
+        dict or None
+            Business data dictionary, or None if the fetch failed or the
+            response doesn't look like a details page
+        """
+        try:
+            response = await request_context.get(url)
+            if not response.ok:
+                return None
+
+            page_data = parse_details_html(await response.text())
+
+            # Without the expected markup, let the browser have a go
+            if 'Details' not in page_data['title'] or not page_data['fields']:
+                return None
+
+            return self.build_business_record(
+                record_id, business_name or page_data['heading'],
+                page_data['fields'], page_data['tables']
+            )
+
+        except Exception as e:
+            logger.debug(f"HTTP details fetch failed for {record_id}: {e}")
+            return None
+
+    @staticmethod
+    def retry_delay(attempt: int) -> float:
+        """
+        How long to wait before retrying after a failed attempt.
+
+        The wait doubles after each failure (exponential backoff), starting
+        at config.RETRY_DELAY and capped at config.RETRY_MAX_DELAY, so a
+        struggling server gets more and more breathing room. It is then
+        randomized between half and all of that, so pages that failed at
+        the same moment don't all retry at the same moment too.
+
+        PARAMETERS:
+        -----------
+        attempt : int
+            The attempt that just failed (0 = the first one)
+
+        RETURNS:
+        --------
+        float
+            Seconds to wait
+        """
+        delay = min(config.RETRY_DELAY * 2 ** attempt, config.RETRY_MAX_DELAY)
+        return random.uniform(delay / 2, delay)
+
+    async def wait_for_detail_slot(self):
+        """
+        Wait until the next GUID details fetch is allowed to start.
+
+        Name searches look up many businesses at once. Instead of every
+        lookup sleeping a fixed time afterwards, the lookups share one rate
+        limit: fetches start at most config.DETAIL_RATE times per second,
+        evenly spaced, no matter how many are waiting. When requests are
+        slow anyway, nobody waits at all.
+        """
+        rate = config.DETAIL_RATE
+        if not rate:
+            return
+
+        now = time.monotonic()
+        start_at = max(now, self._next_detail_at)
+        # Reserve this slot before sleeping, so the next caller queues behind it
+        self._next_detail_at = start_at + 1 / rate
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+
+    async def add_delay(self, outcome: str = 'hit'):
         """
         Add a polite delay between requests.
 
@@ -1294,10 +2663,86 @@ class MNBusinessScraper:
 
         The delay includes some randomness (jitter) to make the requests
         look more like human browsing behavior.
+
+        A miss (file number not found) comes back almost instantly and puts
+        next to no load on the server, so it only waits a fraction of the
+        normal delay (config.MISS_DELAY_FACTOR).
+
+        PARAMETERS:
+        -----------
+        outcome : str
+            'hit' if the last request found a business, 'miss' otherwise
+        """
+        base = config.REQUEST_DELAY
+        if outcome == 'miss':
+            base *= config.MISS_DELAY_FACTOR
+
+        # Base delay plus the next pre-computed jitter value
+        jitter = self._jitters[self._jitter_index]
+        self._jitter_index = (self._jitter_index + 1) % len(self._jitters)
+        await asyncio.sleep(base + jitter)
+
+    async def scrape_business_politely(self, file_number: int) -> dict | None:
         """
-        # Base delay plus random jitter
-        delay = config.REQUEST_DELAY + random.uniform(0, config.DELAY_JITTER)
-        await asyncio.sleep(delay)
+        Scrape one file number, respecting the concurrency limit and delay.
+
+        Used by run() to scrape many file numbers at once. At most
+        config.MAX_CONCURRENCY scrapes are in progress at the same time, and
+        each one is followed by the usual polite delay before its slot is
+        given to the next file number.
+
+        PARAMETERS:
+        -----------
+        file_number : int
+            The MN SOS file number to scrape
+
+        RETURNS:
+        --------
+        dict or None
+            Business data dictionary if found, None otherwise
+        """
+        async with self._semaphore:
+            data = await self.scrape_business(file_number)
+            await self.add_delay('hit' if data else 'miss')
+            return data
+
+    async def find_first_filing(self, last_miss: int, hit: int) -> int:
+        """
+        Bisect a skipped gap for the first file number that has a business.
+
+        Used by run() after a gap jump lands on a business. This assumes the
+        gap is empty up to some point and filled after it (new filings are
+        numbered in order), so it takes about log2(gap) lookups instead of
+        one per number. Businesses found here are scraped again when run()
+        rescans from the returned number, so they are not saved here.
+
+        PARAMETERS:
+        -----------
+        last_miss : int
+            A file number known to have no business
+        hit : int
+            A later file number known to have one
+
+        RETURNS:
+        --------
+        int
+            The lowest file number found to have a business
+        """
+        while hit - last_miss > 1:
+            middle = (last_miss + hit) // 2
+            if await self.scrape_business_politely(middle):
+                hit = middle
+            else:
+                last_miss = middle
+        return hit
+
+    @staticmethod
+    async def cancel_tasks(tasks: list):
+        """Cancel scrape tasks and wait for them to finish cancelling."""
+        for task in tasks:
+            task.cancel()
+        # return_exceptions=True: collect CancelledError instead of raising it
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     async def run(self, resume: bool = True):
         """
@@ -1306,8 +2751,9 @@ class MNBusinessScraper:
         This is the entry point for running the scraper. It:
         1. Initializes the browser
         2. Loads progress (if resuming)
-        3. Scrapes businesses sequentially by file number
-        4. Saves progress periodically
+        3. Scrapes businesses by file number, config.SCRAPE_AHEAD at a time
+           (a sliding window - see below)
+        4. Saves progress periodically (every config.PROGRESS_EVERY numbers)
         5. Stops after too many consecutive misses (reached end of numbers)
 
         PARAMETERS:
@@ -1320,7 +2766,29 @@ class MNBusinessScraper:
         --------------------
         The scraper stops when it encounters MAX_CONSECUTIVE_MISSES in a row.
         This indicates we've reached the end of the file number range.
+
+        SLIDING WINDOW:
+        ---------------
+        Scrapes for the next config.SCRAPE_AHEAD file numbers are always
+        running (at most MAX_CONCURRENCY at once, one pool page each). Results
+        are handled strictly in file-number order, and as each one is handled
+        the scrape for the next number is started. So there are no batch
+        boundaries where pages wait for the slowest lookup, and the miss
+        counter works exactly as if numbers had been scraped one at a time.
+
+        GAP JUMPING:
+        ------------
+        With config.GAP_JUMP_AFTER set, a long run of misses makes the next
+        numbers started further and further apart (the step doubles after
+        each miss, up to config.GAP_JUMP_MAX). When a jump lands on a
+        business, find_first_filing() bisects the skipped gap, the window is
+        restarted from the first filing found, and scanning goes back to one
+        number at a time. Any other hit while the step is above 1 restarts
+        the window right after it too, since the scrapes already in the
+        window were started step apart.
         """
+        window = deque()  # (file_number, task) pairs started but not handled
+
         try:
             # Initialize browser and CSV file
             await self.initialize()
@@ -1338,65 +2806,254 @@ class MNBusinessScraper:
                 self.current_file_number = self.start_number
 
             logger.info(f"Starting scrape from file number {self.current_file_number}")
-            logger.info(f"Will stop after {config.MAX_CONSECUTIVE_MISSES} consecutive misses")
-
-            scraped_count = 0
-
-            # Main loop - continue until too many consecutive misses
-            while self.consecutive_misses < config.MAX_CONSECUTIVE_MISSES:
-                file_number = self.current_file_number
+            # Read loop settings into locals once - the loop below runs for
+            # every file number and local lookups are cheaper than config.X
+            max_misses = config.MAX_CONSECUTIVE_MISSES
+            scrape_ahead = config.SCRAPE_AHEAD
+            progress_every = config.PROGRESS_EVERY
+            gap_jump_after = config.GAP_JUMP_AFTER
+            gap_jump_max = config.GAP_JUMP_MAX
 
-                logger.info(f"Scraping file number {file_number}...")
+            logger.info(f"Will stop after {max_misses} consecutive misses")
 
-                # Attempt to scrape this file number
-                data = await self.scrape_business(file_number)
+            scraped_count = 0
+            handled_count = 0  # File numbers handled (for progress saves)
+            next_number = self.current_file_number  # Next one to start
+            step = 1  # How far apart new scrapes are started (gap jumping)
+            previous = self.current_file_number - 1  # Last number handled
+
+            # Fill the window
+            for _ in range(scrape_ahead):
+                window.append((next_number, asyncio.ensure_future(
+                    self.scrape_business_politely(next_number))))
+                next_number += 1
+
+            # Main loop - continue until too many consecutive misses.
+            # Logging in the loop uses logger.info("... %s", value) instead of
+            # f-strings, so messages below the log level are never formatted.
+            while self.consecutive_misses < max_misses:
+                file_number, task = window.popleft()
+
+                # Keep the window full: start the next file number now so it
+                # can take the first page that frees up
+                window.append((next_number, asyncio.ensure_future(
+                    self.scrape_business_politely(next_number))))
+                next_number += step
+
+                data = await task
+                if data and file_number - previous > 1:
+                    # A jump landed on a business: find where the filings
+                    # start in the gap we skipped, then scan from there
+                    first = await self.find_first_filing(previous, file_number)
+                    logger.info("Gap jump hit #%s; first filing in the gap is #%s",
+                                file_number, first)
+                    await self.cancel_tasks([t for _, t in window])
+                    window.clear()
+                    step = 1
+                    self.consecutive_misses = 0
+                    self.current_file_number = first
+                    previous = first - 1
+                    next_number = first
+                    for _ in range(scrape_ahead):
+                        window.append((next_number, asyncio.ensure_future(
+                            self.scrape_business_politely(next_number))))
+                        next_number += 1
+                    continue
 
                 if data:
                     # Found a business - save it!
-                    self.append_to_csv(data)
+                    self.queue_csv_row(data)
                     scraped_count += 1
                     self.consecutive_misses = 0  # Reset miss counter
-                    logger.info(f"[FOUND] {data.get('business_name', 'Unknown')} (#{file_number})")
+                    logger.info("[FOUND] %s (#%s)", data.get('business_name', 'Unknown'), file_number)
+                    if step > 1:
+                        # The rest of the window was started step apart.
+                        # Restart it one number at a time right after this
+                        # business, or the numbers between those scrapes
+                        # would never be looked at
+                        await self.cancel_tasks([t for _, t in window])
+                        window.clear()
+                        next_number = file_number + 1
+                        for _ in range(scrape_ahead):
+                            window.append((next_number, asyncio.ensure_future(
+                                self.scrape_business_politely(next_number))))
+                            next_number += 1
+                    step = 1
                 else:
                     # No business found at this file number
                     self.consecutive_misses += 1
-                    logger.debug(f"[MISS] No result for file number {file_number} "
-                               f"({self.consecutive_misses} consecutive misses)")
-
-                # Save progress every 10 file numbers
-                if file_number % 10 == 0:
+                    logger.debug("[MISS] No result for file number %s "
+                                 "(%d consecutive misses)",
+                                 file_number, self.consecutive_misses)
+                    if gap_jump_after and self.consecutive_misses >= gap_jump_after:
+                        step = min(step * 2, gap_jump_max)
+
+                # Save progress every PROGRESS_EVERY file numbers handled.
+                # Counted, not file_number % PROGRESS_EVERY: while gap
+                # jumping the numbers go up 2, 4, ... 1024 at a time and
+                # could skip every multiple of PROGRESS_EVERY.
+                handled_count += 1
+                if handled_count % progress_every == 0:
+                    self._flush_csv()
                     self.save_progress(file_number)
-                    logger.info(f"Progress: {scraped_count} businesses scraped, at file #{file_number}")
+                    logger.info("Progress: %d businesses scraped, at file #%s",
+                                scraped_count, file_number)
 
                 # Move to next file number
-                self.current_file_number += 1
+                self.current_file_number = file_number + 1
+                previous = file_number
 
-                # Be polite - wait before next request
-                await self.add_delay()
+            # Anything still in the window is past the end; it is cancelled
+            # below, without waiting for it
 
             # Reached stopping condition
-            logger.info(f"Stopping: {config.MAX_CONSECUTIVE_MISSES} consecutive misses reached")
+            logger.info(f"Stopping: {max_misses} consecutive misses reached")
             logger.info(f"Total businesses scraped: {scraped_count}")
+            cache = parse_address_parts.cache_info()
+            logger.debug(f"Address cache: {cache.hits} hits, {cache.misses} parsed")
+            self._flush_csv()
             self.save_progress(self.current_file_number - 1)
 
         except KeyboardInterrupt:
             # User pressed Ctrl+C
             logger.info("Interrupted by user")
+            self._flush_csv()
             self.save_progress(self.current_file_number - 1)
         except Exception as e:
             # Unexpected error
             logger.error(f"Fatal error: {e}")
+            self._flush_csv()
             self.save_progress(self.current_file_number - 1)
             raise
         finally:
+            # Cancel scrapes that are still running (they are past the end,
+            # or we are shutting down) so their pages are back in the pool
+            await self.cancel_tasks([task for _, task in window])
+
             # Always close the browser
             await self.close()
 
 
+    # =========================================================================
+    # DAEMON MODE
+    # =========================================================================
+
+    async def handle_command(self, command: dict) -> dict:
+        """
+        Run one daemon command and build the reply.
+
+        COMMANDS:
+        ---------
+        {"op": "scrape", "file_number": 1000000}
+        {"op": "scrape_guid", "guid": "..."}
+        {"op": "ping"}
+
+        PARAMETERS:
+        -----------
+        command : dict
+            The decoded JSON command from a client
+
+        RETURNS:
+        --------
+        dict
+            {"ok": true, "data": <business dict or null>} on success, or
+            {"ok": false, "error": "..."} for a bad command
+        """
+        op = command.get('op')
+
+        if op == 'ping':
+            return {'ok': True, 'data': None}
+        if op == 'scrape' and isinstance(command.get('file_number'), int):
+            return {'ok': True, 'data': await self.scrape_business(command['file_number'])}
+        if op == 'scrape_guid' and command.get('guid'):
+            return {'ok': True, 'data': await self.scrape_business_by_guid(command['guid'])}
+
+        return {'ok': False, 'error': f"Unknown or incomplete command: {command!r}"}
+
+    async def _handle_client(self, reader, writer):
+        """Read one JSON command line from a client, reply, and disconnect."""
+        try:
+            line = await reader.readline()
+            try:
+                reply = await self.handle_command(json.loads(line))
+            except (ValueError, AttributeError) as e:
+                reply = {'ok': False, 'error': f"Bad request: {e}"}
+            writer.write(json.dumps(reply).encode() + b'\n')
+            await writer.drain()
+        except Exception as e:
+            logger.error(f"Daemon client error: {e}")
+        finally:
+            writer.close()
+
+    async def serve(self, socket_path: str = None):
+        """
+        Keep the browser running and scrape on request (daemon mode).
+
+        Starting Chromium takes a second or two. When the scraper is started
+        many times a day for a handful of lookups, that start-up cost is most
+        of the run. In daemon mode the browser is started once, and clients
+        send one JSON command per connection over a Unix socket:
+
+            echo '{"op": "scrape", "file_number": 1000000}' | nc -U scraper.sock
+
+        The reply is one JSON line, e.g. {"ok": true, "data": {...}}.
+        Stop the daemon with Ctrl+C.
+
+        PARAMETERS:
+        -----------
+        socket_path : str, optional
+            Where to create the socket (default: config.DAEMON_SOCKET)
+        """
+        socket_path = socket_path or config.DAEMON_SOCKET
+
+        # A socket file left over from a previous run would block binding
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+        try:
+            await self.initialize()
+            server = await asyncio.start_unix_server(self._handle_client, path=socket_path)
+            logger.info(f"Daemon listening on {socket_path}")
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.close()
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+
 # =============================================================================
 # COMMAND-LINE INTERFACE
 # =============================================================================
 
+def run_profiled(argv: list, outfile: str) -> int:
+    """
+    Re-run this script under the Scalene profiler.
+
+    The scraper runs in a child process started with
+    'python -m scalene ... mn_scraper.py --- <argv>', so nothing is profiled
+    (and nothing slows down) unless --profile was given.
+
+    PARAMETERS:
+    -----------
+    argv : list
+        Command-line arguments for the child run (without --profile)
+    outfile : str
+        Where Scalene writes its JSON report
+
+    RETURNS:
+    --------
+    int
+        Exit code of the profiled run
+    """
+    cmd = [sys.executable, '-m', 'scalene', *SCALENE_OPTIONS,
+           '--outfile', outfile, os.path.abspath(__file__), '---', *argv]
+    logger.info(f"Profiling with Scalene, report will be written to {outfile}")
+    try:
+        return subprocess.call(cmd)
+    except KeyboardInterrupt:
+        return 130
+
+
 def main():
     """
     Command-line entry point for the scraper.
@@ -1417,6 +3074,15 @@ def main():
 
     # Combine options
     python mn_scraper.py --start 1000000 --visible --no-resume
+
+    # Profile the run with Scalene (pip install scalene), report in profile.json
+    python mn_scraper.py --profile profile.json
+
+    # Keep the browser running and take scrape requests over a Unix socket
+    python mn_scraper.py --daemon
+
+    # Use a Chromium that is already running with --remote-debugging-port
+    python mn_scraper.py --cdp http://localhost:9222
     """
     # Set up argument parser
     parser = argparse.ArgumentParser(description='Minnesota Business Scraper')
@@ -1435,15 +3101,54 @@ def main():
         action='store_true',
         help='Run browser in visible mode (not headless)'
     )
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const='profile.json',
+        metavar='OUTFILE',
+        help='Run under the Scalene profiler and write a JSON report '
+             '(default: profile.json)'
+    )
+    parser.add_argument(
+        '--cdp',
+        metavar='URL',
+        help='Connect to an already running Chromium (e.g. '
+             'http://localhost:9222) instead of launching a new one'
+    )
+    parser.add_argument(
+        '--daemon',
+        nargs='?',
+        const=config.DAEMON_SOCKET,
+        metavar='SOCKET',
+        help='Keep the browser running and serve scrape requests on a Unix '
+             f'socket (default: {config.DAEMON_SOCKET})'
+    )
 
     args = parser.parse_args()
 
+    if args.cdp:
+        config.BROWSER_CDP_URL = args.cdp
+
+    if args.profile:
+        # Pass every other argument through to the profiled child run
+        child_argv = [a for a in sys.argv[1:]
+                      if a != '--profile' and a != args.profile
+                      and not a.startswith('--profile=')]
+        sys.exit(run_profiled(child_argv, args.profile))
+
     # Create scraper with command-line options
     scraper = MNBusinessScraper(
         start_number=args.start,
         headless=not args.visible  # Invert: --visible means headless=False
     )
 
+    if args.daemon:
+        try:
+            asyncio.run(scraper.serve(args.daemon))
+        except KeyboardInterrupt:
+            logger.info("Daemon stopped")
+        return
+
     # Run the async scraper
     # asyncio.run() handles creating and running the event loop
     asyncio.run(scraper.run(resume=not args.no_resume))
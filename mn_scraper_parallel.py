@@ -8,10 +8,15 @@ range of file numbers to speed up data collection.
 
 import argparse
 import asyncio
+import csv
 import json
+import multiprocessing
 import sys
 import os
+import time
+from collections import deque
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -23,6 +28,21 @@ from mn_scraper import MNBusinessScraper
 import config
 
 
+def save_worker_progress(progress_file: Path, progress: dict):
+    """
+    Write a worker's progress file atomically.
+
+    The JSON goes to a temporary file that is then renamed over the old one,
+    so a crash mid-write can't leave a half-written progress file behind.
+    """
+    tmp_file = progress_file.with_name(progress_file.name + '.tmp')
+    with open(tmp_file, 'w') as f:
+        # json.dumps builds the string with the C encoder in one go
+        # (json.dump streams it through the pure-Python encoder)
+        f.write(json.dumps(progress, separators=(',', ':')))
+    os.replace(tmp_file, progress_file)
+
+
 async def scrape_range(worker_id: int, start: int, end: int, headless: bool = True):
     """
     Scrape a specific range of file numbers.
@@ -49,70 +69,205 @@ async def scrape_range(worker_id: int, start: int, end: int, headless: bool = Tr
                 if saved_pos >= start and saved_pos < end:
                     current_start = saved_pos + 1
                     print(f"[Worker {worker_id}] Resuming from file #{current_start}")
+                elif saved_pos >= end:
+                    # The whole range was finished (progress is saved at the end)
+                    print(f"[Worker {worker_id}] Range {start:,}-{end:,} already completed")
+                    return progress.get('found_count', 0)
         except:
             pass
 
     print(f"[Worker {worker_id}] Scraping range {current_start:,} - {end:,}")
 
     scraper = MNBusinessScraper(headless=headless)
+    # Every worker process saves and loads its own browser session, instead
+    # of all of them sharing (and overwriting) one file
+    if config.STORAGE_STATE_FILE:
+        state_file = Path(config.STORAGE_STATE_FILE)
+        scraper.storage_state_file = str(
+            state_file.with_name(f'{state_file.stem}_worker_{worker_id}{state_file.suffix}'))
+
+    # Open the worker CSV once for the whole range, with a large write buffer.
+    # Rows are collected in pending_rows and written config.CSV_FLUSH_EVERY
+    # at a time, or after config.CSV_FLUSH_SECONDS (and before each progress
+    # save), instead of building a DataFrame and reopening the file for
+    # every business.
+    # A new (or empty) file gets the header row - append mode starts at the
+    # end of the file, so tell() is 0 only if there is nothing in it yet.
+    csv_file = open(output_file, 'a', encoding='utf-8', newline='', buffering=1 << 20)
+    writer = csv.DictWriter(csv_file, fieldnames=scraper.columns)
+    if csv_file.tell() == 0:
+        writer.writeheader()
+    pending_rows = []
+    last_flush = time.monotonic()
+
+    def write_rows(rows):
+        writer.writerows(rows)
+        csv_file.flush()
+
+    async def flush_rows():
+        # The batch is encoded and written in a worker thread, so scrapes
+        # that are in flight keep running while the disk write happens.
+        # Awaiting it keeps batches in order and lets callers rely on the
+        # rows being written when this returns.
+        nonlocal last_flush
+        if pending_rows:
+            rows = pending_rows.copy()
+            pending_rows.clear()
+            await asyncio.to_thread(write_rows, rows)
+        last_flush = time.monotonic()
+
+    # Scrapes for the next config.SCRAPE_AHEAD file numbers are kept running
+    # (at most config.MAX_CONCURRENCY at once, each on its own pool page, with
+    # the rate-limit delay inside each slot - see scrape_business_politely),
+    # and their results are handled in file-number order, so the progress
+    # file still means "everything up to here is done".
+    # With config.GAP_JUMP_AFTER set, long runs of misses are skipped over
+    # the same way MNBusinessScraper.run() does it (see "GAP JUMPING" there).
+    window = deque()  # (file_number, task) pairs started but not handled
+    next_number = current_start  # Next file number to start
+    step = 1  # How far apart new scrapes are started (gap jumping)
+    gap_jump_after = config.GAP_JUMP_AFTER
+    gap_jump_max = config.GAP_JUMP_MAX
+
+    def start_next():
+        nonlocal next_number
+        if next_number <= end:
+            window.append((next_number, asyncio.ensure_future(
+                scraper.scrape_business_politely(next_number))))
+            # Never jump past the end of the range: the last scrape is
+            # always `end` itself, so a business in a gap at the end of the
+            # range is still found (and the gap bisected) like anywhere else
+            next_number = min(next_number + step, end) if next_number < end else end + 1
+
+    def restart_window(first):
+        # Start scraping one number at a time again from `first`
+        nonlocal next_number
+        window.clear()
+        next_number = first
+        for _ in range(config.SCRAPE_AHEAD):
+            start_next()
+
+    consecutive_misses = 0
+    found_count = 0
+    progress_seconds = config.PROGRESS_SAVE_SECONDS
+    last_progress_save = time.monotonic()
+
+    async def save_progress(file_number):
+        nonlocal last_progress_save
+        await flush_rows()
+        save_worker_progress(progress_file, {
+            'worker_id': worker_id,
+            'start': start,
+            'end': end,
+            'last_file_number': file_number,
+            'found_count': found_count,
+            'updated_at': datetime.now().isoformat()
+        })
+        last_progress_save = time.monotonic()
 
     try:
         await scraper.initialize()
 
-        consecutive_misses = 0
-        found_count = 0
+        for _ in range(config.SCRAPE_AHEAD):
+            start_next()
+        previous = current_start - 1  # Last file number handled
+
+        while window:
+            file_number, task = window.popleft()
+            start_next()
 
-        for file_number in range(current_start, end + 1):
             try:
-                data = await scraper.scrape_business(file_number)
+                data = await task
+
+                if data and step > 1 and file_number - previous > 1:
+                    # A jump landed on a business: find where the filings
+                    # start in the skipped gap and scan again from there.
+                    # (step > 1: only a jump leaves a gap worth bisecting -
+                    # a number that failed below is not a gap.)
+                    first = await scraper.find_first_filing(previous, file_number)
+                    print(f"[Worker {worker_id}] Gap jump hit #{file_number:,}, "
+                          f"rescanning from #{first:,}")
+                    await scraper.cancel_tasks([t for _, t in window])
+                    step = 1
+                    consecutive_misses = 0
+                    previous = first - 1
+                    restart_window(first)
+                    continue
+                previous = file_number
 
                 if data:
                     consecutive_misses = 0
+                    if step > 1:
+                        # The rest of the window was started step apart -
+                        # rescan one by one from here so nothing in between
+                        # is skipped
+                        await scraper.cancel_tasks([t for _, t in window])
+                        step = 1
+                        restart_window(file_number + 1)
                     found_count += 1
 
                     # Save to worker-specific CSV
-                    import pandas as pd
-                    df = pd.DataFrame([data])
-
-                    if not output_file.exists():
-                        df.to_csv(output_file, index=False)
-                    else:
-                        df.to_csv(output_file, mode='a', header=False, index=False)
+                    pending_rows.append(data)
+                    if (len(pending_rows) >= config.CSV_FLUSH_EVERY
+                            or time.monotonic() - last_flush >= config.CSV_FLUSH_SECONDS):
+                        await flush_rows()
 
                     if found_count % 10 == 0:
                         print(f"[Worker {worker_id}] {found_count} found, at #{file_number:,}")
                 else:
                     consecutive_misses += 1
+                    if gap_jump_after and consecutive_misses >= gap_jump_after:
+                        step = min(step * 2, gap_jump_max)
 
-                # Save progress every 10 file numbers
-                if file_number % 10 == 0:
-                    with open(progress_file, 'w') as f:
-                        json.dump({
-                            'worker_id': worker_id,
-                            'start': start,
-                            'end': end,
-                            'last_file_number': file_number,
-                            'found_count': found_count,
-                            'updated_at': datetime.now().isoformat()
-                        }, f, indent=2)
-
-                # Rate limiting
-                delay = config.REQUEST_DELAY + (hash(file_number) % 100) / 100 * config.DELAY_JITTER
-                await asyncio.sleep(delay)
+                # Save progress every PROGRESS_SAVE_SECONDS (rows first, so
+                # the progress file never points past rows still in memory).
+                # Going by time rather than every 10 file numbers keeps
+                # miss-heavy stretches from rewriting the file constantly;
+                # a restart repeats at most a few seconds of work.
+                if time.monotonic() - last_progress_save >= progress_seconds:
+                    await save_progress(file_number)
 
             except Exception as e:
+                # Skip this number and carry on with the next one. It still
+                # counts as handled, so the next business isn't mistaken for
+                # a gap jump hit (whose bisection would hit this error again)
                 print(f"[Worker {worker_id}] Error at #{file_number}: {e}")
+                previous = file_number
                 await asyncio.sleep(5)
                 continue
 
+        # start_next() always ends with `end` itself, so the whole range has
+        # been handled once the window is empty
+        await save_progress(end)
         print(f"[Worker {worker_id}] COMPLETED - Found {found_count} businesses in range {start:,}-{end:,}")
 
     finally:
+        # Stop scrapes still running (e.g. after Ctrl+C) before closing
+        await scraper.cancel_tasks([task for _, task in window])
+        await flush_rows()
+        os.fsync(csv_file.fileno())
+        csv_file.close()
         await scraper.close()
 
     return found_count
 
 
+def _worker_entry(worker_id: int, start: int, end: int, headless: bool = True):
+    """
+    Run one worker's scrape_range in this (worker) process.
+
+    Top-level so ProcessPoolExecutor can start it in a new process, where it
+    gets its own event loop and browser.
+
+    With config.PIN_WORKERS on (Linux only), the process is first pinned to
+    one CPU so the scheduler doesn't move it between cores.
+    """
+    if config.PIN_WORKERS and hasattr(os, 'sched_setaffinity'):
+        cpus = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, {cpus[worker_id % len(cpus)]})
+    return asyncio.run(scrape_range(worker_id, start, end, headless))
+
+
 async def run_parallel(num_workers: int, total_start: int, total_end: int, headless: bool = True):
     """
     Run multiple scrapers in parallel.
@@ -145,14 +300,21 @@ async def run_parallel(num_workers: int, total_start: int, total_end: int, headl
     print("=" * 60)
     print()
 
-    # Launch all workers
-    tasks = [
-        scrape_range(worker_id, start, end, headless)
-        for worker_id, start, end in ranges
-    ]
-
-    # Run all workers concurrently
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # Launch all workers, each in its own process. Running them as
+    # coroutines in this process would make them share one Python
+    # interpreter (the GIL) for all the HTML parsing and record building.
+    # 'spawn' starts clean processes on every platform (no forked Playwright
+    # state).
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(max_workers=num_workers,
+                             mp_context=multiprocessing.get_context('spawn')) as pool:
+        tasks = [
+            loop.run_in_executor(pool, _worker_entry, worker_id, start, end, headless)
+            for worker_id, start, end in ranges
+        ]
+
+        # Wait for all workers to finish
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
     # Summary
     print("\n" + "=" * 60)
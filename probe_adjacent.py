@@ -17,15 +17,14 @@ async def probe_adjacent():
     # Let's probe nearby numbers
 
     base = 1349132200021
-    test_numbers = []
 
-    # Try +/- 1000 around the base
-    for offset in range(-50, 51, 5):
-        test_numbers.append(base + offset)
+    # A set from the start, since several of the candidates below overlap
+    # Try +/- 50 around the base
+    test_numbers = set(range(base - 50, base + 51, 5))
 
     # Also try incrementing/decrementing different digit positions
     # Maybe the last digits are the sequence
-    test_numbers.extend([
+    test_numbers.update([
         1349132200001,
         1349132200010,
         1349132200020,
@@ -43,15 +42,15 @@ async def probe_adjacent():
     # But the format might not be that simple
 
     # Try format: 13491322 + 5-digit sequence
-    for seq in [1, 10, 100, 1000, 10000]:
-        test_numbers.append(13491322 * 100000 + seq)
+    test_numbers.update(13491322 * 100000 + seq for seq in [1, 10, 100, 1000, 10000])
 
-    # Try varying the digit before "22"
-    for prefix in range(0, 10):
-        test_numbers.append(int(f"134913{prefix}200021"))
+    # Try varying the digit before "22" (134913?200021): that digit is the
+    # millions place, so this is plain arithmetic instead of building and
+    # parsing a string
+    test_numbers.update(1349130200021 + prefix * 1_000_000 for prefix in range(10))
 
-    # Remove duplicates and sort
-    test_numbers = sorted(set(test_numbers))
+    # Probe in order
+    test_numbers = sorted(test_numbers)
 
     try:
         await scraper.initialize()
@@ -61,9 +60,15 @@ async def probe_adjacent():
 
         results = []
 
-        for file_num in test_numbers:
-            data = await scraper.scrape_business(file_num)
+        # Probe several numbers at once: scrape_business_politely allows
+        # config.MAX_CONCURRENCY scrapes at a time (one pool page each) and
+        # waits the usual polite delay in each slot. Results are printed in
+        # order once they are all in.
+        found = await asyncio.gather(
+            *(scraper.scrape_business_politely(file_num) for file_num in test_numbers)
+        )
 
+        for file_num, data in zip(test_numbers, found):
             if data:
                 filing_date = data.get('filing_date', 'Unknown')
                 business_type = data.get('business_type', 'Unknown')
@@ -81,8 +86,6 @@ async def probe_adjacent():
             else:
                 print(f"[MISS]  #{file_num}")
 
-            await asyncio.sleep(1)
-
         print("\n" + "=" * 80)
         print("ANALYSIS:")
         print("=" * 80)
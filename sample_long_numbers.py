@@ -2,16 +2,21 @@
 """Sample random long file numbers to find 2019+ businesses."""
 
 import asyncio
-import random
 import sys
+import numpy as np
 sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 sys.path.insert(0, '.')
 
 from mn_scraper import MNBusinessScraper
 
 
-async def sample_long_numbers(num_samples=100):
-    """Randomly sample long file numbers to find businesses and their filing dates."""
+async def sample_long_numbers(num_samples=100, seed=None):
+    """
+    Randomly sample long file numbers to find businesses and their filing dates.
+
+    Pass a seed to get the same sample of file numbers again (handy when
+    comparing two runs).
+    """
     scraper = MNBusinessScraper(headless=True)
 
     # Known valid long numbers:
@@ -30,13 +35,18 @@ async def sample_long_numbers(num_samples=100):
         (1340000000000, 1360000000000, "13-digit around 1349T"),
     ]
 
-    all_samples = []
+    # NumPy draws each range's samples in one call (numpy comes with pandas)
+    rng = np.random.default_rng(seed)
+    per_range = num_samples // len(ranges)
+    range_samples = []
     for rmin, rmax, desc in ranges:
-        samples = [random.randint(rmin, rmax) for _ in range(num_samples // len(ranges))]
-        all_samples.extend(samples)
+        samples = rng.integers(rmin, rmax, size=per_range, endpoint=True)
+        range_samples.append(samples)
         print(f"Generated {len(samples)} samples for {desc}")
 
-    random.shuffle(all_samples)
+    all_samples = np.concatenate(range_samples)
+    rng.shuffle(all_samples)
+    all_samples = all_samples.tolist()  # Plain Python ints for the scraper
 
     try:
         await scraper.initialize()
@@ -112,4 +122,5 @@ async def sample_long_numbers(num_samples=100):
 
 if __name__ == '__main__':
     samples = int(sys.argv[1]) if len(sys.argv) > 1 else 50
-    asyncio.run(sample_long_numbers(samples))
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    asyncio.run(sample_long_numbers(samples, seed))
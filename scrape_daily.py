@@ -7,6 +7,7 @@ Designed to run daily via GitHub Actions cron job.
 """
 
 import asyncio
+import csv
 import sys
 import json
 from datetime import datetime, timedelta
@@ -14,12 +15,13 @@ from pathlib import Path
 
 sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
-import pandas as pd
-from playwright.async_api import async_playwright
-
 # Add current directory to path
 sys.path.insert(0, str(Path(__file__).parent))
-from mn_scraper import MNBusinessScraper, convert_date_to_iso
+from mn_scraper import (
+    MNBusinessScraper, convert_date_to_iso, read_search_results, LLC_CORP_NAME_RE,
+    submit_name_search, search_by_name_http,
+)
+import config
 
 
 async def search_recent_filings(page, search_term: str, max_results: int = 500):
@@ -29,55 +31,26 @@ async def search_recent_filings(page, search_term: str, max_results: int = 500):
     results = []
 
     try:
-        await page.goto("https://mblsportal.sos.mn.gov/Business/Search", timeout=30000)
-        await page.wait_for_load_state("networkidle")
-
-        # Select "Contains" for broader search
-        await page.evaluate('document.getElementById("containsz").checked = true')
-
-        # Enter search term
-        await page.fill('#BusinessName', search_term)
-
-        # Submit search
-        search_btn = page.locator('button:has-text("Search")').first
-        await search_btn.click()
-        await page.wait_for_load_state("networkidle")
-        await asyncio.sleep(2)
-
-        # Check for results table
-        table = await page.query_selector('table.table')
-        if not table:
-            return results
-
-        # Get all result rows (skip header)
-        rows = await table.query_selector_all('tbody tr')
-
-        for row in rows[:max_results]:
-            try:
-                cells = await row.query_selector_all('td')
-                if len(cells) >= 1:
-                    name_cell = cells[0]
-                    name_elem = await name_cell.query_selector('strong')
-                    if name_elem:
-                        name = (await name_elem.inner_text()).strip()
-                    else:
-                        name = (await name_cell.inner_text()).strip()
-
-                    # Get GUID from Details link
-                    details_link = await row.query_selector('a[href*="filingGuid"]')
-                    guid = None
-                    if details_link:
-                        href = await details_link.get_attribute('href')
-                        if 'filingGuid=' in href:
-                            guid = href.split('filingGuid=')[-1]
-
-                    if guid and any(term in name.upper() for term in ['LLC', 'L.L.C.', 'CORPORATION', 'CORP', 'INC']):
-                        results.append({
-                            'business_name': name,
-                            'guid': guid
-                        })
-            except Exception:
-                continue
+        # Try the search as a plain HTTP request first (config.HTTP_SEARCH)
+        rows = None
+        if config.HTTP_SEARCH:
+            rows = await search_by_name_http(page, search_term, max_results)
+
+        if rows is None:
+            # Submit a "Contains" search and wait for the results
+            await submit_name_search(page, search_term)
+
+            # Read all result rows in one call (no table = no rows)
+            rows = await read_search_results(page, max_results)
+
+        for row in rows:
+            name = row['business_name']
+            guid = row['guid']  # GUID from Details link
+            if guid and LLC_CORP_NAME_RE.search(name):
+                results.append({
+                    'business_name': name,
+                    'guid': guid
+                })
 
         return results
 
@@ -86,6 +59,24 @@ async def search_recent_filings(page, search_term: str, max_results: int = 500):
         return results
 
 
+async def new_search_page(scraper):
+    """
+    Open a page in its own browser context for one name search.
+
+    The context is created in the scraper's own browser (same settings as
+    its page pool), so no second browser is needed. Each concurrent search
+    gets its own context, so their cookies and search forms don't interfere
+    with each other.
+    """
+    _, page = await scraper.new_context_page()
+    await page.add_init_script("""
+        Object.defineProperty(navigator, 'webdriver', {
+            get: () => undefined
+        });
+    """)
+    return page
+
+
 async def scrape_daily_filings():
     """
     Scrape recent LLC and Corporation filings.
@@ -103,8 +94,10 @@ async def scrape_daily_filings():
     existing_guids = set()
     if output_file.exists():
         try:
-            existing_df = pd.read_csv(output_file)
-            existing_guids = set(existing_df['file_number'].astype(str).tolist())
+            # Only the file_number column is needed, so stream the rows
+            # instead of loading the whole history into a DataFrame
+            with open(output_file, encoding='utf-8', newline='') as f:
+                existing_guids = {row['file_number'] for row in csv.DictReader(f)}
             print(f"Loaded {len(existing_guids)} existing records")
         except Exception:
             pass
@@ -117,97 +110,93 @@ async def scrape_daily_filings():
         'Corp',
     ]
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=True,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--no-sandbox',
-                '--disable-dev-shm-usage',
-            ]
-        )
-        context = await browser.new_context(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            viewport={'width': 1920, 'height': 1080},
-        )
-        page = await context.new_page()
-        await page.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-        """)
-
-        scraper = MNBusinessScraper(headless=True)
-        await scraper.initialize()
-
-        new_records = []
-        guids_processed = set()
+    # One browser for everything: the scraper's. The name searches run in
+    # extra contexts of that browser instead of a second Chromium.
+    scraper = MNBusinessScraper(headless=True)
+    await scraper.initialize()
 
-        try:
-            for search_term in search_terms:
-                print(f"\nSearching: '{search_term}'...")
-                results = await search_recent_filings(page, search_term, max_results=200)
-                print(f"  Found {len(results)} LLC/Corp results")
-
-                for r in results:
-                    guid = r['guid']
-
-                    # Skip if already processed or existing
-                    if guid in guids_processed or guid in existing_guids:
-                        continue
-
-                    guids_processed.add(guid)
-
-                    try:
-                        data = await scraper.scrape_business_by_guid(guid)
-                        if data:
-                            if not data.get('business_name'):
-                                data['business_name'] = r['business_name']
-
-                            # Check if it's recent (last 30 days preferred, but accept current year)
-                            filing_date = data.get('filing_date', '')
-                            filing_year = filing_date[:4] if filing_date else ''
-
-                            if filing_year == current_year:
-                                print(f"    [NEW] {data['business_name']} - {filing_date}")
-                                new_records.append(data)
-
-                        await asyncio.sleep(0.5)
-                    except Exception as e:
-                        print(f"    Error: {e}")
-                        continue
-
-                await asyncio.sleep(2)  # Rate limit between searches
-
-            # Save new records
-            if new_records:
-                new_df = pd.DataFrame(new_records)
-
-                if output_file.exists():
-                    # Append to existing
-                    existing_df = pd.read_csv(output_file)
-                    combined_df = pd.concat([existing_df, new_df], ignore_index=True)
-                    combined_df.drop_duplicates(subset=['file_number'], keep='last', inplace=True)
-                    combined_df.to_csv(output_file, index=False)
-                    print(f"\nAdded {len(new_records)} new records. Total: {len(combined_df)}")
-                else:
-                    new_df.to_csv(output_file, index=False)
-                    print(f"\nSaved {len(new_records)} new records")
-
-            # Update progress
-            with open(progress_file, 'w') as f:
-                json.dump({
-                    'last_run': today.isoformat(),
-                    'records_found': len(new_records),
-                    'total_processed': len(guids_processed),
-                }, f, indent=2)
-
-            print(f"\nDaily scrape complete. Found {len(new_records)} new filings.")
-
-        finally:
-            await scraper.close()
-            await context.close()
-            await browser.close()
+    # One page per search term, so the searches can run at the same time
+    pages = await asyncio.gather(*(new_search_page(scraper) for _ in search_terms))
+
+    new_records = []
+
+    try:
+        # Run all the searches at once - each one mostly waits on the
+        # portal (page loads, search results), so together they take about
+        # as long as the slowest one instead of the sum of all of them
+        print(f"\nSearching: {', '.join(repr(term) for term in search_terms)}...")
+        results_per_term = await asyncio.gather(*(
+            search_recent_filings(page, search_term, max_results=200)
+            for page, search_term in zip(pages, search_terms)
+        ))
+
+        # Every GUID found, in search order (a business found by more
+        # than one search term is only scraped once), minus the ones
+        # already saved in earlier runs
+        all_results = {}
+        for search_term, results in zip(search_terms, results_per_term):
+            print(f"\n'{search_term}': found {len(results)} LLC/Corp results")
+            for r in results:
+                all_results.setdefault(r['guid'], r)
+        todo = [guid for guid in all_results if guid not in existing_guids]
+        guids_processed = set(todo)
+        print(f"\n{len(todo)} new businesses to look up")
+
+        # Look them up several at a time (one scraper pool page each)
+        semaphore = asyncio.Semaphore(config.MAX_CONCURRENCY)
+
+        async def scrape_guid(guid):
+            async with semaphore:
+                try:
+                    # Rate limited by the scraper (config.DETAIL_RATE)
+                    return await scraper.scrape_business_by_guid(guid)
+                except Exception as e:
+                    print(f"    Error: {e}")
+                    return None
+
+        scraped = await asyncio.gather(*(scrape_guid(guid) for guid in todo))
+
+        for guid, data in zip(todo, scraped):
+            if not data:
+                continue
+            if not data.get('business_name'):
+                data['business_name'] = all_results[guid]['business_name']
+
+            # Check if it's recent (last 30 days preferred, but accept current year)
+            filing_date = data.get('filing_date', '')
+            filing_year = filing_date[:4] if filing_date else ''
+
+            if filing_year == current_year:
+                print(f"    [NEW] {data['business_name']} - {filing_date}")
+                new_records.append(data)
+
+        # Save new records. The file is only appended to: new_records
+        # never contains a GUID from existing_guids, so there is nothing
+        # to de-duplicate and no need to read and rewrite the whole
+        # history (compact_daily_filings.py tidies it up if needed).
+        if new_records:
+            with open(output_file, 'a', encoding='utf-8', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=scraper.columns)
+                if f.tell() == 0:
+                    writer.writeheader()
+                writer.writerows(new_records)
+            print(f"\nAdded {len(new_records)} new records. "
+                  f"Total: {len(existing_guids) + len(new_records)}")
+
+        # Update progress
+        with open(progress_file, 'w') as f:
+            f.write(json.dumps({
+                'last_run': today.isoformat(),
+                'records_found': len(new_records),
+                'total_processed': len(guids_processed),
+            }, separators=(',', ':')))
+
+        print(f"\nDaily scrape complete. Found {len(new_records)} new filings.")
+
+    finally:
+        for page in pages:
+            await page.context.close()
+        await scraper.close()
 
     return new_records
 
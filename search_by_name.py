@@ -5,19 +5,24 @@ Iterates through name patterns (a, aa, aaa, b, bb, etc.)
 """
 
 import asyncio
+import csv
 import sys
 import json
+import string
 from datetime import datetime
 from pathlib import Path
 
 sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
-import pandas as pd
 from playwright.async_api import async_playwright
 
 # Import the scraper for data extraction
 sys.path.insert(0, str(Path(__file__).parent))
-from mn_scraper import MNBusinessScraper, convert_date_to_iso
+import config
+from mn_scraper import (
+    MNBusinessScraper, convert_date_to_iso, read_search_results, LLC_CORP_NAME_RE,
+    block_unneeded_resources, submit_name_search, search_by_name_http,
+)
 
 
 async def search_by_name(search_term: str, page, max_results: int = 100):
@@ -27,56 +32,26 @@ async def search_by_name(search_term: str, page, max_results: int = 100):
     results = []
 
     try:
-        # Navigate to search page
-        await page.goto("https://mblsportal.sos.mn.gov/Business/Search", timeout=30000)
-        await page.wait_for_load_state("networkidle")
-
-        # Select "Contains" for broader search
-        await page.evaluate('document.getElementById("containsz").checked = true')
-
-        # Enter search term
-        await page.fill('#BusinessName', search_term)
-
-        # Submit search - use text selector for Search button
-        search_btn = page.locator('button:has-text("Search")').first
-        await search_btn.click()
-        await page.wait_for_load_state("networkidle")
-        await asyncio.sleep(2)
-
-        # Check for results table
-        table = await page.query_selector('table.table')
-        if not table:
-            return results
-
-        # Get all result rows
-        rows = await table.query_selector_all('tbody tr')
-
-        for row in rows[:max_results]:
-            try:
-                cells = await row.query_selector_all('td')
-                if len(cells) >= 2:
-                    # Get business name and file number
-                    name_cell = cells[0]
-                    name_elem = await name_cell.query_selector('strong')
-                    if name_elem:
-                        name = (await name_elem.inner_text()).strip()
-                    else:
-                        name = (await name_cell.inner_text()).strip()
-
-                    # Get file number from Details link (can be SearchDetails or BusinessDetails)
-                    details_link = await row.query_selector('a[href*="filingGuid"]')
-                    file_number = None
-                    if details_link:
-                        href = await details_link.get_attribute('href')
-                        if 'filingGuid=' in href:
-                            file_number = href.split('filingGuid=')[-1]
-
-                    results.append({
-                        'business_name': name,
-                        'file_number': file_number
-                    })
-            except Exception as e:
-                continue
+        # Try the search as a plain HTTP request first (config.HTTP_SEARCH)
+        rows = None
+        if config.HTTP_SEARCH:
+            rows = await search_by_name_http(page, search_term, max_results)
+
+        if rows is None:
+            # Submit a "Contains" search (from the form already on the page
+            # when there is one) and wait for the results
+            await submit_name_search(page, search_term)
+
+            # Read all result rows in one call (no table = no rows)
+            rows = await read_search_results(page, max_results)
+
+        for row in rows:
+            if row['cell_count'] >= 2:
+                # Business name and file number (GUID from the Details link)
+                results.append({
+                    'business_name': row['business_name'],
+                    'file_number': row['guid']
+                })
 
         return results
 
@@ -110,6 +85,8 @@ async def explore_name_search():
             user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             viewport={'width': 1920, 'height': 1080},
         )
+        if config.BLOCK_RESOURCES:
+            await context.route('**/*', block_unneeded_resources)
         page = await context.new_page()
 
         # Remove webdriver flag
@@ -158,17 +135,43 @@ async def scrape_llc_by_name_patterns():
     output_dir = Path('output')
     output_dir.mkdir(exist_ok=True)
     output_file = output_dir / 'businesses_llc_search.csv'
-    progress_file = Path('progress_llc_search.json')
+    progress_file = Path('progress_llc_search.json')   # Summary, written at the end
+    progress_log = Path('progress_llc_search.jsonl')   # One line per pattern
 
     # Load progress
     completed_patterns = set()
+    # GUIDs already scraped: "Contains" patterns overlap a lot (a name like
+    # "AABERG TRADING LLC" matches aa, ab, be, er, ...), so each business is
+    # only fetched the first time it shows up
+    seen_guids = set()
     if progress_file.exists():
         with open(progress_file) as f:
             progress = json.load(f)
             completed_patterns = set(progress.get('completed_patterns', []))
+            seen_guids = set(progress.get('seen_guids', []))
+
+    # Then replay the progress log (newer than the summary)
+    if progress_log.exists():
+        with open(progress_log, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # e.g. a line cut short by a crash
+                completed_patterns.add(entry['pattern'])
+                seen_guids.update(entry.get('guids', []))
+
+    # Also the GUIDs already saved (in case the progress file is outdated);
+    # scrape_business_by_guid stores the GUID as the file_number
+    if output_file.exists():
+        try:
+            with open(output_file, encoding='utf-8', newline='') as f:
+                seen_guids.update(row['file_number'] for row in csv.DictReader(f)
+                                  if row.get('file_number'))
+        except Exception:
+            pass
 
     # Generate patterns: a, b, c, ..., aa, ab, ..., aaa, etc.
-    import string
     patterns = []
 
     # Single letters
@@ -196,6 +199,8 @@ async def scrape_llc_by_name_patterns():
             user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             viewport={'width': 1920, 'height': 1080},
         )
+        if config.BLOCK_RESOURCES:
+            await context.route('**/*', block_unneeded_resources)
         page = await context.new_page()
 
         # Remove webdriver flag
@@ -209,7 +214,88 @@ async def scrape_llc_by_name_patterns():
         scraper = MNBusinessScraper(headless=True)
         await scraper.initialize()
 
-        all_results = []
+        # Rows are appended to the output CSV as they're scraped, instead of
+        # keeping every record in a list and rewriting the whole file every
+        # 50 records. tell() is 0 only for a new/empty file (header needed).
+        # With the large write buffer, rows reach the disk when a pattern is
+        # done (the flush before its progress line).
+        csv_file = open(output_file, 'a', encoding='utf-8', newline='', buffering=1 << 20)
+        writer = csv.DictWriter(csv_file, fieldnames=scraper.columns)
+        if csv_file.tell() == 0:
+            writer.writeheader()
+        found_count = 0
+
+        # Progress is appended to the log, one short line per pattern,
+        # instead of rewriting every pattern and GUID each time
+        log_file = open(progress_log, 'a', encoding='utf-8')
+        pattern_guids = {}  # Pattern -> GUIDs scraped for it (not logged yet)
+
+        # Searching (the page) and fetching details (the scraper's page pool)
+        # run at the same time: the pattern loop queues each new business,
+        # and config.MAX_CONCURRENCY consumers - one per pool page - fetch
+        # them. A pattern counts as completed once all of its businesses are.
+        guid_queue = asyncio.Queue(maxsize=1000)
+        pending = {}           # Pattern -> businesses queued but not done
+        queued_guids = set()   # GUIDs waiting in the queue or being fetched
+
+        def save_progress(pattern):
+            """Log a completed pattern (rows first, so it never gets ahead of the CSV)."""
+            completed_patterns.add(pattern)
+            csv_file.flush()
+            # Compact, with the C encoder (json.dumps, no indent)
+            log_file.write(json.dumps({
+                'pattern': pattern,
+                'guids': pattern_guids.pop(pattern, []),
+                'found': found_count,
+                'ts': datetime.now().isoformat()
+            }, separators=(',', ':')) + '\n')
+            log_file.flush()
+
+        def finish_one(pattern):
+            """Count one of a pattern's businesses as done."""
+            pending[pattern] -= 1
+            if pending[pattern] == 0:
+                del pending[pattern]
+                save_progress(pattern)
+
+        async def fetch_details():
+            """Consumer: fetch queued businesses until cancelled."""
+            nonlocal found_count
+            while True:
+                pattern, r = await guid_queue.get()
+                guid = r['file_number']
+                try:
+                    data = await scraper.scrape_business_by_guid(guid)
+                    if data:
+                        seen_guids.add(guid)
+                        pattern_guids.setdefault(pattern, []).append(guid)
+                        # Use business name from search if not extracted
+                        if not data.get('business_name'):
+                            data['business_name'] = r['business_name']
+                        # Check if it's recent (2024 or 2025)
+                        filing_year = data.get('filing_date', '')[:4]
+                        if filing_year in ['2024', '2025', '2026']:
+                            print(f"    [RECENT] {data['business_name']} - {data['filing_date']}")
+                        writer.writerow(data)
+                        found_count += 1
+                    # No sleep here: the scraper spaces out detail fetches
+                    # itself (config.DETAIL_RATE)
+                except asyncio.CancelledError:
+                    # Shutting down mid-fetch (Ctrl+C or a search error).
+                    # This business isn't done, so its pattern must not be
+                    # logged as completed - resuming searches it again.
+                    guid_queue.task_done()
+                    raise
+                except Exception:
+                    pass  # Skip this business
+                # Done (saved, not found, or failed) - a failed GUID can be
+                # tried again by a later pattern
+                queued_guids.discard(guid)
+                finish_one(pattern)
+                guid_queue.task_done()
+
+        consumers = [asyncio.create_task(fetch_details())
+                     for _ in range(config.MAX_CONCURRENCY)]
 
         try:
             for pattern in patterns:
@@ -221,51 +307,48 @@ async def scrape_llc_by_name_patterns():
 
                 # Filter for LLCs and Corporations only
                 llc_corp_results = [r for r in results if r['file_number'] and
-                                   any(term in r['business_name'].upper() for term in ['LLC', 'L.L.C.', 'CORPORATION', 'CORP', 'INC'])]
-
-                print(f"  Found {len(results)} total, {len(llc_corp_results)} LLCs/Corps")
-
-                # Get details for LLC/Corp results using GUID method
-                for r in llc_corp_results[:20]:  # Limit to avoid overload
-                    try:
-                        data = await scraper.scrape_business_by_guid(r['file_number'])
-                        if data:
-                            # Use business name from search if not extracted
-                            if not data.get('business_name'):
-                                data['business_name'] = r['business_name']
-                            # Check if it's recent (2024 or 2025)
-                            filing_year = data.get('filing_date', '')[:4]
-                            if filing_year in ['2024', '2025', '2026']:
-                                print(f"    [RECENT] {data['business_name']} - {data['filing_date']}")
-                            all_results.append(data)
-                        await asyncio.sleep(0.5)
-                    except Exception as e:
-                        continue
-
-                # Save progress
-                completed_patterns.add(pattern)
-                with open(progress_file, 'w') as f:
-                    json.dump({
-                        'completed_patterns': list(completed_patterns),
-                        'total_found': len(all_results),
-                        'updated_at': datetime.now().isoformat()
-                    }, f, indent=2)
-
-                # Save results periodically
-                if all_results and len(all_results) % 50 == 0:
-                    df = pd.DataFrame(all_results)
-                    df.to_csv(output_file, index=False)
-                    print(f"  Saved {len(all_results)} records")
+                                   LLC_CORP_NAME_RE.search(r['business_name'])]
+                # ... that haven't been scraped (or queued) for another pattern
+                new_results = [r for r in llc_corp_results
+                               if r['file_number'] not in seen_guids
+                               and r['file_number'] not in queued_guids]
+
+                print(f"  Found {len(results)} total, {len(llc_corp_results)} LLCs/Corps, "
+                      f"{len(new_results)} new")
+
+                # Queue details for LLC/Corp results (fetched by GUID)
+                new_results = new_results[:20]  # Limit to avoid overload
+                if new_results:
+                    # Set before queuing, so the count can't reach 0 early
+                    pending[pattern] = len(new_results)
+                else:
+                    save_progress(pattern)
+                for r in new_results:
+                    queued_guids.add(r['file_number'])
+                    await guid_queue.put((pattern, r))
 
                 await asyncio.sleep(1)
 
-            # Final save
-            if all_results:
-                df = pd.DataFrame(all_results)
-                df.to_csv(output_file, index=False)
-                print(f"\nFinal save: {len(all_results)} records to {output_file}")
+            # Wait for the last queued businesses
+            await guid_queue.join()
+
+            print(f"\nSaved {found_count} records to {output_file}")
 
         finally:
+            await scraper.cancel_tasks(consumers)
+            csv_file.close()
+            log_file.close()
+
+            # Summary of the whole run, written once
+            with open(progress_file, 'w') as f:
+                # Compact, with the C encoder (json.dumps, no indent)
+                f.write(json.dumps({
+                    'completed_patterns': list(completed_patterns),
+                    'seen_guids': list(seen_guids),
+                    'total_found': found_count,
+                    'updated_at': datetime.now().isoformat()
+                }, separators=(',', ':')))
+
             await scraper.close()
             await context.close()
             await browser.close()
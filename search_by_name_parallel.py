@@ -11,7 +11,7 @@ PURPOSE:
 
 HOW IT WORKS:
     1. Generates 676 two-letter search patterns (aa through zz)
-    2. Divides patterns among multiple "worker" processes
+    2. Divides patterns among multiple "workers" (tasks sharing one browser)
     3. Each worker searches the website for businesses matching its patterns
     4. Filters results by target years (e.g., 2023, 2024) and business types
     5. Saves matching businesses to CSV files
@@ -31,9 +31,11 @@ OUTPUT FILES:
     - output/businesses_alpha_worker_0.csv  (Worker 0's results)
     - output/businesses_alpha_worker_1.csv  (Worker 1's results)
     - ... (one file per worker)
-    - progress_alpha_worker_0.json  (Worker 0's progress/resume info)
-    - progress_alpha_worker_1.json  (Worker 1's progress/resume info)
-    - ... (one file per worker)
+    - progress_alpha_worker_0.jsonl (Worker 0's progress log: one line
+                                     per completed pattern, for resuming)
+    - progress_alpha_worker_0.json  (Worker 0's progress summary, written
+                                     when the worker stops)
+    - ... (one of each per worker)
 
 RESUME CAPABILITY:
     The script automatically saves progress. If interrupted, simply run
@@ -50,12 +52,15 @@ DATE: January 2026
 
 import argparse          # For parsing command-line arguments (--workers, --years, etc.)
 import asyncio           # For running multiple tasks concurrently (async/await)
+import csv               # For appending rows to the worker CSV
+import itertools         # For generating letter patterns lazily
 import json              # For reading/writing JSON files (progress tracking)
 import logging           # For logging messages to files and console
-import os                # For file system operations
+import os                # For atomic file renames
 import string            # For generating letter patterns (a-z)
 import subprocess        # For running git commands
 import sys               # For system-level operations
+import threading         # For keeping auto-saves from overlapping
 from datetime import datetime  # For timestamps
 from pathlib import Path       # For cross-platform file path handling
 
@@ -63,11 +68,23 @@ from pathlib import Path       # For cross-platform file path handling
 sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
 import pandas as pd      # For handling CSV files and data manipulation
-from playwright.async_api import async_playwright  # Browser automation library
+
+# pandas can hand CSV parsing to pyarrow's multithreaded reader, which is much
+# faster on the big worker files. pyarrow is optional - without it we fall
+# back to pandas' own C parser.
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
 
 # Import our custom scraper class (from mn_scraper.py in same folder)
 sys.path.insert(0, str(Path(__file__).parent))
-from mn_scraper import MNBusinessScraper
+import config
+from mn_scraper import (
+    MNBusinessScraper, read_search_results, submit_name_search,
+    search_by_name_http,
+)
 
 # =============================================================================
 # LOGGING SETUP - Records what the scraper does to files and console
@@ -134,11 +151,39 @@ AUTO_SAVE_INTERVAL = 4 * 60 * 60
 # Global variable to track when we last saved
 last_save_time = None
 
+# Only one auto-save may run at a time. Cancelling auto_save_task() doesn't
+# stop a save already running in its thread, so without this the final save
+# could run alongside it - both write data/businesses.csv(.tmp) and run git.
+auto_save_lock = threading.Lock()
+
 
 # =============================================================================
 # HELPER FUNCTIONS - Small utility functions used throughout the script
 # =============================================================================
 
+def pattern_stream(start_idx: int = 0):
+    """
+    Yield the two-letter search patterns 'aa' to 'zz' one at a time.
+
+    itertools.product() makes the letter pairs lazily (in C), so nothing
+    is built up front - handy for taking a slice of the patterns without
+    making the whole list.
+
+    Args:
+        start_idx (int): Skip this many patterns first (default: 0)
+
+    Returns:
+        generator: 'aa', 'ab', ... (from position start_idx)
+
+    Example:
+        >>> list(pattern_stream(674))
+        ['zy', 'zz']
+    """
+    # string.ascii_lowercase = 'abcdefghijklmnopqrstuvwxyz'
+    pairs = itertools.product(string.ascii_lowercase, repeat=2)
+    return (first + second for first, second in itertools.islice(pairs, start_idx, None))
+
+
 def generate_patterns():
     """
     Generate all two-letter search patterns from 'aa' to 'zz'.
@@ -157,12 +202,7 @@ def generate_patterns():
         >>> patterns[:5]
         ['aa', 'ab', 'ac', 'ad', 'ae']
     """
-    patterns = []
-    # string.ascii_lowercase = 'abcdefghijklmnopqrstuvwxyz'
-    for first_letter in string.ascii_lowercase:      # a, b, c, ... z
-        for second_letter in string.ascii_lowercase:  # a, b, c, ... z
-            patterns.append(first_letter + second_letter)
-    return patterns
+    return list(pattern_stream())
 
 
 def run_auto_save():
@@ -178,7 +218,15 @@ def run_auto_save():
     6. Commits and pushes changes to GitHub
 
     This runs automatically every 4 hours and when scraping completes.
+    If another save is still running (e.g. the 4-hour one when the final
+    save starts), this waits for it to finish first (see auto_save_lock).
     """
+    with auto_save_lock:
+        _run_auto_save()
+
+
+def _run_auto_save():
+    """Do the work of run_auto_save() (call that instead - it takes the lock)."""
     global last_save_time
 
     logger.info("=" * 60)
@@ -192,10 +240,26 @@ def run_auto_save():
     data_dir.mkdir(exist_ok=True)         # Create data folder if it doesn't exist
 
     # -------------------------------------------------------------------------
-    # STEP 1: Read all worker CSV files
+    # STEP 1: Read the existing data and all worker CSV files
     # -------------------------------------------------------------------------
-    dfs = []  # List to hold DataFrames from each worker
+    # Everything is read as text (dtype=str): no type guessing (which is what
+    # low_memory=False was working around), and file numbers/ZIP codes stay
+    # exactly as written. CSV_ENGINE uses pyarrow's reader when it's
+    # installed. The existing data goes first, so worker rows win when the
+    # duplicates are dropped below.
+    dfs = []  # List to hold DataFrames (existing data, then each worker)
 
+    existing_file = data_dir / 'businesses.csv'
+    if existing_file.exists():
+        try:
+            existing = pd.read_csv(existing_file, dtype=str, engine=CSV_ENGINE)
+            dfs.append(existing)
+            logger.info(f"Existing records in data/: {len(existing)}")
+        except Exception as e:
+            logger.error(f"Error loading existing data: {e}")
+
+    worker_files = 0
+    worker_rows = 0
     # Check workers 0-19 (we support up to 20 workers)
     for worker_id in range(20):
         worker_file = output_dir / f'businesses_alpha_worker_{worker_id}.csv'
@@ -203,54 +267,44 @@ def run_auto_save():
         if worker_file.exists():
             try:
                 # Read the CSV file into a pandas DataFrame
-                df = pd.read_csv(worker_file, low_memory=False)
+                df = pd.read_csv(worker_file, dtype=str, engine=CSV_ENGINE)
                 dfs.append(df)
+                worker_files += 1
+                worker_rows += len(df)
                 logger.info(f"  Worker {worker_id}: {len(df)} records")
             except Exception as e:
                 logger.error(f"  Worker {worker_id}: Error reading file - {e}")
 
     # If no worker files found, nothing to save
-    if not dfs:
+    if not worker_files:
         logger.warning("No worker data found to save!")
         return
 
     # -------------------------------------------------------------------------
-    # STEP 2: Combine all worker data and remove duplicates
+    # STEP 2: Combine everything and remove duplicates - once
     # -------------------------------------------------------------------------
-    # pd.concat joins all DataFrames into one big DataFrame
+    # One concat and one drop_duplicates over existing + worker data, instead
+    # of deduplicating the workers and then concatenating/deduplicating again
+    # (which built the full table twice)
     merged = pd.concat(dfs, ignore_index=True)
+    del dfs
 
     # Remove duplicate businesses (keep the most recent entry for each)
     if 'file_number' in merged.columns:
         merged = merged.drop_duplicates(subset=['file_number'], keep='last')
 
-    logger.info(f"Total unique records from workers: {len(merged)}")
-
-    # -------------------------------------------------------------------------
-    # STEP 3: Merge with existing data (if any)
-    # -------------------------------------------------------------------------
-    existing_file = data_dir / 'businesses.csv'
-
-    if existing_file.exists():
-        try:
-            # Load existing data
-            existing = pd.read_csv(existing_file, low_memory=False)
-            logger.info(f"Existing records in data/: {len(existing)}")
-
-            # Combine new data with existing data
-            merged = pd.concat([existing, merged], ignore_index=True)
-
-            # Remove duplicates again (in case new data overlaps with existing)
-            merged = merged.drop_duplicates(subset=['file_number'], keep='last')
-            logger.info(f"Combined unique records: {len(merged)}")
-
-        except Exception as e:
-            logger.error(f"Error loading existing data: {e}")
+    logger.info(f"Combined unique records: {len(merged)} ({worker_rows} rows from workers)")
 
     # -------------------------------------------------------------------------
     # STEP 4: Save the merged data
     # -------------------------------------------------------------------------
-    merged.to_csv(data_dir / 'businesses.csv', index=False)
+    # Written to a temporary file and renamed over the old one, so a crash
+    # mid-write (or git/the dashboard reading it meanwhile) never sees a
+    # half-written file - the next auto-save starts from this file, so a
+    # truncated copy would lose records for good
+    tmp_file = existing_file.with_name(existing_file.name + '.tmp')
+    merged.to_csv(tmp_file, index=False)
+    os.replace(tmp_file, existing_file)
     logger.info(f"Saved {len(merged)} records to data/businesses.csv")
 
     # -------------------------------------------------------------------------
@@ -280,18 +334,20 @@ def run_auto_save():
     # -------------------------------------------------------------------------
     # STEP 6: Commit and push to GitHub
     # -------------------------------------------------------------------------
+    # The git commands run in the repo directory (cwd=repo_dir) instead of
+    # os.chdir() - this function runs in a thread while the workers keep
+    # going, and changing the whole process's directory would move their
+    # relative paths too
     try:
-        original_dir = os.getcwd()  # Remember current directory
-        os.chdir(repo_dir)          # Change to repo directory
-
         # Stage the data folder for commit
-        subprocess.run(['git', 'add', 'data/'], capture_output=True)
+        subprocess.run(['git', 'add', 'data/'], capture_output=True, cwd=repo_dir)
 
         # Check if there are changes to commit
         result = subprocess.run(
             ['git', 'status', '--porcelain', 'data/'],
             capture_output=True,
-            text=True
+            text=True,
+            cwd=repo_dir
         )
 
         if result.stdout.strip():  # If there are changes
@@ -300,10 +356,12 @@ def run_auto_save():
             commit_msg = f"Auto-save: {len(merged)} records ({timestamp})"
 
             # Commit the changes
-            subprocess.run(['git', 'commit', '-m', commit_msg], capture_output=True)
+            subprocess.run(['git', 'commit', '-m', commit_msg], capture_output=True,
+                           cwd=repo_dir)
 
             # Push to GitHub
-            push_result = subprocess.run(['git', 'push'], capture_output=True, text=True)
+            push_result = subprocess.run(['git', 'push'], capture_output=True, text=True,
+                                         cwd=repo_dir)
 
             if push_result.returncode == 0:
                 logger.info("Successfully pushed to GitHub")
@@ -312,8 +370,6 @@ def run_auto_save():
         else:
             logger.info("No changes to commit")
 
-        os.chdir(original_dir)  # Return to original directory
-
     except Exception as e:
         logger.error(f"Git operation failed: {e}")
 
@@ -333,6 +389,11 @@ async def auto_save_task():
 
     The 'await asyncio.sleep()' allows other tasks to run while
     this one is sleeping (that's the magic of async programming!).
+
+    The save itself (reading/writing CSVs with pandas, git commit and push)
+    is ordinary blocking code, so it runs in a separate thread with
+    asyncio.to_thread(). Otherwise every worker's browser page would freeze
+    for the seconds-to-minutes it takes.
     """
     global last_save_time
     last_save_time = datetime.now()
@@ -342,8 +403,8 @@ async def auto_save_task():
         await asyncio.sleep(AUTO_SAVE_INTERVAL)
 
         try:
-            # Wake up and save progress
-            run_auto_save()
+            # Wake up and save progress (in a thread - see above)
+            await asyncio.to_thread(run_auto_save)
         except Exception as e:
             logger.error(f"Auto-save error: {e}")
 
@@ -379,88 +440,47 @@ async def search_by_name(search_term: str, page, max_results: int = 500):
 
     try:
         # ---------------------------------------------------------------------
-        # Navigate to the search page
+        # Try the search as a plain HTTP request first (config.HTTP_SEARCH)
         # ---------------------------------------------------------------------
-        await page.goto(
-            "https://mblsportal.sos.mn.gov/Business/Search",
-            timeout=30000  # Wait up to 30 seconds for page to load
-        )
-        # Wait for page to fully load (no more network requests)
-        await page.wait_for_load_state("networkidle")
-
-        # ---------------------------------------------------------------------
-        # Configure search options
-        # ---------------------------------------------------------------------
-        # Select "Contains" option for broader search
-        # This finds businesses where the name CONTAINS our search term
-        # (vs "Starts with" which would only find names STARTING with the term)
-        await page.evaluate('document.getElementById("containsz").checked = true')
-
-        # Enter the search term into the business name field
-        await page.fill('#BusinessName', search_term)
-
-        # ---------------------------------------------------------------------
-        # Submit the search
-        # ---------------------------------------------------------------------
-        # Find and click the Search button
-        search_btn = page.locator('button:has-text("Search")').first
-        await search_btn.click()
-
-        # Wait for search results to load
-        await page.wait_for_load_state("networkidle")
-        await asyncio.sleep(1.5)  # Extra wait for JavaScript to finish
-
-        # ---------------------------------------------------------------------
-        # Extract results from the page
-        # ---------------------------------------------------------------------
-        # Look for the results table
-        table = await page.query_selector('table.table')
-        if not table:
-            # No table means no results found
-            return results
-
-        # Get all rows from the table body (skip header row)
-        rows = await table.query_selector_all('tbody tr')
-
-        # Process each row (up to max_results)
-        for row in rows[:max_results]:
-            try:
-                # Get all cells in this row
-                cells = await row.query_selector_all('td')
-
-                if len(cells) >= 1:
-                    # Get the business name from the first cell
-                    name_cell = cells[0]
-                    name_elem = await name_cell.query_selector('strong')
-
-                    if name_elem:
-                        name = (await name_elem.inner_text()).strip()
-                    else:
-                        name = (await name_cell.inner_text()).strip()
-
-                    # Get the unique business ID (GUID) from the Details link
-                    details_link = await row.query_selector('a[href*="filingGuid"]')
-                    guid = None
-
-                    if details_link:
-                        href = await details_link.get_attribute('href')
-                        if 'filingGuid=' in href:
-                            # Extract GUID from URL like "...?filingGuid=abc-123-def"
-                            guid = href.split('filingGuid=')[-1]
-
-                    # Only keep results that:
-                    # 1. Have a valid GUID
-                    # 2. Have a name containing our target keywords
-                    name_upper = name.upper()
-                    if guid and any(kw in name_upper for kw in BUSINESS_TYPE_KEYWORDS):
-                        results.append({
-                            'business_name': name,
-                            'guid': guid
-                        })
-
-            except Exception:
-                # Skip any rows that cause errors
-                continue
+        # One request with the page's cookies, no filling/clicking/rendering.
+        # None means it didn't work, and the browser does the search instead.
+        rows = None
+        if config.HTTP_SEARCH:
+            rows = await search_by_name_http(page, search_term, max_results,
+                                             BUSINESS_TYPE_KEYWORDS)
+
+        if rows is None:
+            # -----------------------------------------------------------------
+            # Submit the search
+            # -----------------------------------------------------------------
+            # Select the "Contains" option for broader search - this finds
+            # businesses where the name CONTAINS our search term (vs "Starts
+            # with" which would only find names STARTING with the term).
+            # After the first search the results page still has the search
+            # form, so later searches are submitted from it without loading
+            # the search page again. Then wait for the first result row or
+            # the "no results" message (no fixed sleep).
+            await submit_name_search(page, search_term)
+
+            # -----------------------------------------------------------------
+            # Extract results from the page
+            # -----------------------------------------------------------------
+            # Read all result rows (up to max_results) in one call to the browser.
+            # No results table simply means no rows. The keyword filter runs
+            # in the browser too, so non-matching rows are never sent back.
+            rows = await read_search_results(page, max_results, BUSINESS_TYPE_KEYWORDS)
+
+        for row in rows:
+            name = row['business_name']
+            guid = row['guid']  # Unique business ID from the Details link
+
+            # Only keep results that have a valid GUID (the rows were
+            # already filtered to names containing our target keywords)
+            if guid:
+                results.append({
+                    'business_name': name,
+                    'guid': guid
+                })
 
         return results
 
@@ -473,7 +493,7 @@ async def search_by_name(search_term: str, page, max_results: int = 500):
 # WORKER FUNCTION - The main scraping logic for each worker
 # =============================================================================
 
-async def worker_scrape(worker_id: int, patterns: list, headless: bool = True):
+async def worker_scrape(worker_id: int, patterns: list, scraper: MNBusinessScraper, context):
     """
     Worker function that scrapes a subset of search patterns.
 
@@ -484,7 +504,10 @@ async def worker_scrape(worker_id: int, patterns: list, headless: bool = True):
     Args:
         worker_id (int): Unique identifier for this worker (0, 1, 2, etc.)
         patterns (list): List of search patterns for this worker to process
-        headless (bool): If True, run browser invisibly. If False, show browser.
+        scraper (MNBusinessScraper): The shared scraper (its browser and page
+            pool fetch the business details for every worker)
+        context: The shared browser context this worker opens its search
+            pages (tabs) in
 
     Returns:
         int: Number of businesses found and saved by this worker
@@ -499,9 +522,12 @@ async def worker_scrape(worker_id: int, patterns: list, headless: bool = True):
     output_dir = Path('output')
     output_dir.mkdir(exist_ok=True)  # Create output folder if needed
 
-    # Each worker has its own output CSV and progress JSON file
+    # Each worker has its own output CSV and progress files: an append-only
+    # log with one line per completed pattern (written as it goes), and a
+    # summary JSON (written once, when the worker stops)
     output_file = output_dir / f'businesses_alpha_worker_{worker_id}.csv'
     progress_file = Path(f'progress_alpha_worker_{worker_id}.json')
+    progress_log = Path(f'progress_alpha_worker_{worker_id}.jsonl')
 
     # -------------------------------------------------------------------------
     # Load previous progress (for resume capability)
@@ -518,6 +544,17 @@ async def worker_scrape(worker_id: int, patterns: list, headless: bool = True):
         except Exception:
             pass  # If can't load progress, start fresh
 
+    # Then replay the progress log (newer than the summary)
+    if progress_log.exists():
+        with open(progress_log, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # e.g. a line cut short by a crash
+                completed_patterns.add(entry['pattern'])
+                processed_guids.update(entry.get('guids', []))
+
     # Also load GUIDs from output file (in case progress file is outdated)
     if output_file.exists():
         try:
@@ -539,28 +576,16 @@ async def worker_scrape(worker_id: int, patterns: list, headless: bool = True):
         return 0
 
     # -------------------------------------------------------------------------
-    # Initialize the browser
+    # Open this worker's search pages
     # -------------------------------------------------------------------------
-    async with async_playwright() as p:
-        # Launch Chrome browser
-        browser = await p.chromium.launch(
-            headless=headless,  # True = invisible, False = visible window
-            args=[
-                # Make browser less detectable as automated
-                '--disable-blink-features=AutomationControlled',
-                '--no-sandbox',
-                '--disable-dev-shm-usage',
-            ]
-        )
-
-        # Create a browser context (like an incognito window)
-        context = await browser.new_context(
-            # Pretend to be a regular Chrome browser
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            viewport={'width': 1920, 'height': 1080},
-        )
-
-        # Create a new page (tab) in the browser
+    # All workers share one browser and one search context (see run_parallel),
+    # so a worker only opens pages (tabs). A pool of pages lets several
+    # patterns be searched at once (config.NAME_SEARCH_CONCURRENCY): a search
+    # borrows an idle page from the queue and puts it back when it's done.
+    search_concurrency = config.NAME_SEARCH_CONCURRENCY
+    pages = asyncio.Queue()
+    worker_pages = []
+    for _ in range(search_concurrency):
         page = await context.new_page()
 
         # Hide the fact that we're using automated browser
@@ -569,115 +594,196 @@ async def worker_scrape(worker_id: int, patterns: list, headless: bool = True):
                 get: () => undefined
             });
         """)
+        pages.put_nowait(page)
+        worker_pages.append(page)
+
+    # Open the worker CSV once for the whole run. Append mode starts at
+    # the end of the file, so tell() is 0 only for a new/empty file -
+    # that's when the header row is needed. This replaces an exists()
+    # check and a one-row DataFrame for every saved business. The large
+    # write buffer means rows reach the disk when a pattern finishes (the
+    # flush before its progress line), not a small write every few rows.
+    csv_file = open(output_file, 'a', encoding='utf-8', newline='', buffering=1 << 20)
+    writer = csv.DictWriter(csv_file, fieldnames=scraper.columns)
+    if csv_file.tell() == 0:
+        writer.writeheader()
+
+    # Saved rows waiting to be written. They go out in one writerows() call
+    # when a pattern finishes (right before its progress line), instead of
+    # a writerow() per business. Holding them any longer would mean holding
+    # back the progress lines too, so a crash would redo more patterns.
+    pending_rows = []
+
+    def write_pending_rows():
+        """Write out the waiting rows and push them to the disk."""
+        writer.writerows(pending_rows)
+        pending_rows.clear()
+        csv_file.flush()
+
+    # The progress log is also kept open and only ever appended to
+    log_file = open(progress_log, 'a', encoding='utf-8')
 
-        # Initialize our custom scraper for getting business details
-        scraper = MNBusinessScraper(headless=headless)
-        await scraper.initialize()
+    # -------------------------------------------------------------------------
+    # Main scraping loop
+    # -------------------------------------------------------------------------
+    found_count = 0   # Number of businesses saved
+    recent_count = 0  # Number of businesses from target years
 
-        # -------------------------------------------------------------------------
-        # Main scraping loop
-        # -------------------------------------------------------------------------
-        found_count = 0   # Number of businesses saved
-        recent_count = 0  # Number of businesses from target years
+    # GUIDs being scraped right now by another pattern, so two patterns
+    # running at the same time don't fetch the same business twice
+    in_progress_guids = set()
 
-        try:
-            # Process each remaining pattern
-            for pattern in remaining_patterns:
-                logger.info(f"[Worker {worker_id}] Searching: '{pattern}'...")
+    # At most search_concurrency patterns are in flight at once
+    semaphore = asyncio.Semaphore(search_concurrency)
 
-                # Search for businesses matching this pattern
-                try:
-                    results = await search_by_name(pattern, page, max_results=500)
-                except Exception as e:
-                    logger.error(f"[Worker {worker_id}] Search error for '{pattern}': {e}")
-                    await asyncio.sleep(5)  # Wait before retrying
-                    continue
-
-                # Filter out businesses we've already processed
-                new_results = [r for r in results if r['guid'] not in processed_guids]
-                logger.info(f"[Worker {worker_id}] '{pattern}': {len(results)} results, {len(new_results)} new")
-
-                # Get detailed info for each new business
-                for r in new_results:
-                    guid = r['guid']
-
-                    try:
-                        # Fetch full business details from the website
-                        data = await scraper.scrape_business_by_guid(guid)
-
-                        if data:
-                            # Use name from search if not in details
-                            if not data.get('business_name'):
-                                data['business_name'] = r['business_name']
-
-                            # Extract filing year from date (e.g., "2023-01-15" -> "2023")
-                            filing_date = data.get('filing_date', '')
-                            filing_year = filing_date[:4] if filing_date else ''
-
-                            # Get the business type
-                            business_type = data.get('business_type', '')
-
-                            # Check if this business matches our criteria:
-                            # 1. Filed in one of our target years
-                            # 2. Is one of our target business types
-                            if filing_year in TARGET_YEARS and business_type in TARGET_BUSINESS_TYPES:
-                                recent_count += 1
-                                logger.info(f"[Worker {worker_id}] [SAVED {filing_year}] {data['business_name']} ({business_type})")
-
-                                # Save to CSV file
-                                df = pd.DataFrame([data])
-                                if not output_file.exists():
-                                    # First record - include header
-                                    df.to_csv(output_file, index=False)
-                                else:
-                                    # Append without header
-                                    df.to_csv(output_file, mode='a', header=False, index=False)
-
-                                found_count += 1
-
-                            elif filing_year in TARGET_YEARS:
-                                # Business is from target year but wrong type - log for debugging
-                                logger.debug(f"[Worker {worker_id}] [SKIP] {data['business_name']} (type: {business_type})")
-
-                            # Remember we processed this business
-                            processed_guids.add(guid)
-
-                        # Small delay to be nice to the server
-                        await asyncio.sleep(0.3)
-
-                    except Exception as e:
-                        logger.error(f"[Worker {worker_id}] Error scraping {guid}: {e}")
-                        continue
-
-                # -----------------------------------------------------------------
-                # Save progress after each pattern (for resume capability)
-                # -----------------------------------------------------------------
-                completed_patterns.add(pattern)
-
-                with open(progress_file, 'w') as f:
-                    json.dump({
-                        'worker_id': worker_id,
-                        'completed_patterns': list(completed_patterns),
-                        # Only keep last 10,000 GUIDs to limit file size
-                        'processed_guids': list(processed_guids)[-10000:],
-                        'found_count': found_count,
-                        'recent_count': recent_count,
-                        'updated_at': datetime.now().isoformat()
-                    }, f, indent=2)
-
-                # Small delay between patterns (rate limiting)
-                await asyncio.sleep(1)
-
-            logger.info(f"[Worker {worker_id}] COMPLETED - Found {found_count} businesses ({recent_count} from {TARGET_YEARS})")
+    # ...and at most config.MAX_CONCURRENCY business lookups (one scraper
+    # pool page each) across all of this worker's patterns
+    detail_semaphore = asyncio.Semaphore(config.MAX_CONCURRENCY)
 
-        except Exception as e:
-            logger.error(f"[Worker {worker_id}] Fatal error: {e}")
+    async def fetch_details(r):
+        """
+        Fetch one search result's business details.
+
+        Lookups used to run one after another with a sleep in between, so
+        the worker spent most of its time waiting on single requests. Now a
+        pattern's lookups run concurrently, limited by detail_semaphore and
+        the scraper's shared rate limit (config.DETAIL_RATE), which also
+        takes care of being polite to the server.
+
+        Returns:
+            tuple: (r, data) - data is None if the lookup failed
+        """
+        async with detail_semaphore:
+            try:
+                return r, await scraper.scrape_business_by_guid(r['guid'])
+            except Exception as e:
+                logger.error(f"[Worker {worker_id}] Error scraping {r['guid']}: {e}")
+                return r, None
+
+    async def run_pattern(pattern):
+        """Search one pattern, scrape its new businesses, save progress."""
+        nonlocal found_count, recent_count
+
+        async with semaphore:
+            logger.info(f"[Worker {worker_id}] Searching: '{pattern}'...")
+
+            # Search for businesses matching this pattern on an idle page
+            page = await pages.get()
+            try:
+                results = await search_by_name(pattern, page, max_results=500)
+            except Exception as e:
+                logger.error(f"[Worker {worker_id}] Search error for '{pattern}': {e}")
+                await asyncio.sleep(5)  # Wait before the next pattern
+                return
+            finally:
+                pages.put_nowait(page)
+
+            # Filter out businesses we've already processed (or that
+            # another pattern is processing right now)
+            new_results = [r for r in results if r['guid'] not in processed_guids
+                           and r['guid'] not in in_progress_guids]
+            in_progress_guids.update(r['guid'] for r in new_results)
+            pattern_guids = []  # GUIDs processed for this pattern
+            logger.info(f"[Worker {worker_id}] '{pattern}': {len(results)} results, {len(new_results)} new")
+
+            # Get detailed info for each new business - several at once
+            # (see fetch_details), handling each one as soon as it's back
+            for next_done in asyncio.as_completed([fetch_details(r) for r in new_results]):
+                r, data = await next_done
+                guid = r['guid']
+                in_progress_guids.discard(guid)
+
+                if data:
+                    # Use name from search if not in details
+                    if not data.get('business_name'):
+                        data['business_name'] = r['business_name']
+
+                    # Extract filing year from date (e.g., "2023-01-15" -> "2023")
+                    filing_date = data.get('filing_date', '')
+                    filing_year = filing_date[:4] if filing_date else ''
+
+                    # Get the business type
+                    business_type = data.get('business_type', '')
+
+                    # Check if this business matches our criteria:
+                    # 1. Filed in one of our target years
+                    # 2. Is one of our target business types
+                    if filing_year in TARGET_YEARS and business_type in TARGET_BUSINESS_TYPES:
+                        recent_count += 1
+                        logger.info(f"[Worker {worker_id}] [SAVED {filing_year}] {data['business_name']} ({business_type})")
+
+                        # Save to CSV file (written when the pattern is done)
+                        pending_rows.append(data)
+
+                        found_count += 1
+
+                    elif filing_year in TARGET_YEARS:
+                        # Business is from target year but wrong type - log for debugging
+                        logger.debug(f"[Worker {worker_id}] [SKIP] {data['business_name']} (type: {business_type})")
+
+                    # Remember we processed this business
+                    processed_guids.add(guid)
+                    pattern_guids.append(guid)
+
+            # -------------------------------------------------------------
+            # Save progress after each pattern (for resume capability)
+            # -------------------------------------------------------------
+            # Patterns can finish out of order, but completed_patterns is
+            # a set, so resuming still skips exactly the finished ones
+            completed_patterns.add(pattern)
+
+            # Rows first, so the progress log never gets ahead of the CSV
+            # (this also writes rows other patterns have waiting - harmless)
+            write_pending_rows()
+            # One short line per pattern, instead of rewriting every
+            # completed pattern and GUID each time
+            log_file.write(json.dumps({
+                'pattern': pattern,
+                'guids': pattern_guids,
+                'found': found_count,
+                'recent': recent_count,
+                'ts': datetime.now().isoformat()
+            }, separators=(',', ':')) + '\n')
+            log_file.flush()
+
+            # Small delay between patterns (rate limiting)
+            await asyncio.sleep(1)
+
+    try:
+        # Process the remaining patterns, search_concurrency at a time
+        await asyncio.gather(*(run_pattern(pattern) for pattern in remaining_patterns))
 
-        finally:
-            # Always clean up browser resources
-            await scraper.close()
-            await context.close()
-            await browser.close()
+        logger.info(f"[Worker {worker_id}] COMPLETED - Found {found_count} businesses ({recent_count} from {TARGET_YEARS})")
+
+    except Exception as e:
+        logger.error(f"[Worker {worker_id}] Fatal error: {e}")
+
+    finally:
+        # Always close the CSV/progress files (and this worker's pages).
+        # Rows of unfinished patterns are kept too - resuming reads their
+        # GUIDs back from the CSV.
+        write_pending_rows()
+        csv_file.close()
+        log_file.close()
+
+        # Summary for the dashboard (and older versions of this script).
+        # Written compactly with json.dumps: without indent the C encoder
+        # builds the whole string (up to 10,000 GUIDs) at once, instead
+        # of the pure-Python pretty-printer
+        with open(progress_file, 'w') as f:
+            f.write(json.dumps({
+                'worker_id': worker_id,
+                'completed_patterns': list(completed_patterns),
+                # Only keep last 10,000 GUIDs to limit file size
+                'processed_guids': list(processed_guids)[-10000:],
+                'found_count': found_count,
+                'recent_count': recent_count,
+                'updated_at': datetime.now().isoformat()
+            }, separators=(',', ':')))
+
+        # The browser and context are shared - only close this worker's pages
+        for page in worker_pages:
+            await page.close()
 
     return found_count
 
@@ -747,12 +853,25 @@ async def run_parallel(num_workers: int, headless: bool = True):
     print("=" * 70)
     print()
 
+    # -------------------------------------------------------------------------
+    # Start one browser for all workers
+    # -------------------------------------------------------------------------
+    # Every worker uses the same browser (instead of two each - one for
+    # searching, one in its own scraper - which cost a Chromium start-up and
+    # a few hundred MB apiece). The scraper's page pool fetches business
+    # details for all workers, and the workers open their search pages in
+    # one shared context.
+    scraper = MNBusinessScraper(headless=headless)
+    await scraper.initialize()
+    context, first_page = await scraper.new_context_page()
+    await first_page.close()  # Workers open their own pages
+
     # -------------------------------------------------------------------------
     # Launch all workers
     # -------------------------------------------------------------------------
     # Create a task for each worker
     tasks = [
-        worker_scrape(i, worker_patterns[i], headless)
+        worker_scrape(i, worker_patterns[i], scraper, context)
         for i in range(num_workers)
     ]
 
@@ -766,6 +885,10 @@ async def run_parallel(num_workers: int, headless: bool = True):
         # Cancel auto-save task when workers finish
         save_task.cancel()
 
+        # Close the shared browser
+        await context.close()
+        await scraper.close()
+
         # Run one final save
         print("\nScraping complete. Running final save...")
         run_auto_save()
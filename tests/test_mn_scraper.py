@@ -38,7 +38,12 @@ import pandas as pd
 # This allows running tests from any directory
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from mn_scraper import convert_date_to_iso, parse_address, MNBusinessScraper
+from mn_scraper import (
+    convert_date_to_iso, parse_address, parse_address_parts, address_columns,
+    parse_details_html, parse_search_results_html, parse_name_search_results_html,
+    label_field, guid_from_href, AddressParts,
+    MNBusinessScraper, LLC_CORP_NAME_RE
+)
 
 
 # =============================================================================
@@ -65,6 +70,11 @@ class TestConvertDateToISO:
         assert convert_date_to_iso("1/5/2024") == "2024-01-05"
         assert convert_date_to_iso("3/15/2023") == "2023-03-15"
 
+    def test_impossible_date_returns_original(self):
+        """Test that MM/DD/YYYY values that aren't real dates are left alone."""
+        assert convert_date_to_iso("02/30/2024") == "02/30/2024"
+        assert convert_date_to_iso("13/01/2024") == "13/01/2024"
+
     def test_empty_input(self):
         """Test that empty input returns empty string."""
         assert convert_date_to_iso("") == ""
@@ -186,6 +196,225 @@ class TestParseAddress:
         assert result['street_number'] == "123-125"
         assert result['street_name'] == "Twin"
 
+    def test_parse_address_parts_matches_dict(self):
+        """Test that the tuple form holds the same values as the dict form."""
+        address = "789 Broadway Blvd\nSte 200\nRochester, MN 55901"
+        parts = parse_address_parts(address)
+        assert isinstance(parts, AddressParts)
+        assert parts._asdict() == parse_address(address)
+
+    def test_address_columns_zip_into_record(self):
+        """Test that address parts line up with the prefixed record columns."""
+        record = dict(zip(
+            address_columns('principal'),
+            parse_address_parts("456 Oak Ave NE\nSt Paul, MN 55102")
+        ))
+        assert record['principal_street_number'] == "456"
+        assert record['principal_street_direction'] == "NE"
+        assert record['principal_zip'] == "55102"
+
+
+# =============================================================================
+# DETAILS PAGE PARSING TESTS
+# =============================================================================
+
+# A trimmed-down business details page, shaped like the MN SOS markup
+SAMPLE_DETAILS_HTML = """
+<html>
+<head><title>Business Record Details</title></head>
+<body>
+  <h2>  North Star Widgets LLC </h2>
+  <dl>
+    <dt>Business Type</dt>
+    <dd>Limited Liability Company (Domestic)</dd>
+    <dt>MN Statute</dt>
+    <dd>322C</dd>
+    <dt>Filing Date</dt>
+    <dd>01/15/2024</dd>
+    <dt>Status</dt>
+    <dd>Active / In Good Standing</dd>
+    <dt>Registered Office Address</dt>
+    <dd>123 Main St NE<br>Ste 200<br>Minneapolis,  MN 55401<br>USA</dd>
+  </dl>
+  <table>
+    <thead><tr><th>Filing History</th><th>Filing Date</th></tr></thead>
+    <tbody>
+      <tr><td>Original Filing - LLC</td><td>01/15/2024</td></tr>
+      <tr><td>Annual Renewal</td><td></td></tr>
+    </tbody>
+  </table>
+</body>
+</html>
+"""
+
+
+class TestDetailsPageParsing:
+    """
+    Tests for parse_details_html() and build_business_record().
+
+    These cover the parsing used for every details page, whether its HTML
+    came from the browser or from a plain HTTP fetch.
+    """
+
+    @pytest.fixture
+    def scraper(self, tmp_path, monkeypatch):
+        import config
+        monkeypatch.setattr(config, 'OUTPUT_DIR', str(tmp_path))
+        return MNBusinessScraper()
+
+    def test_parse_details_html(self):
+        """Test that labels, values, and tables are read from the HTML."""
+        page_data = parse_details_html(SAMPLE_DETAILS_HTML)
+        assert page_data['title'] == "Business Record Details"
+        assert page_data['heading'] == "North Star Widgets LLC"
+        assert ('business type', 'Limited Liability Company (Domestic)') in page_data['fields']
+        assert ('registered office address',
+                '123 Main St NE\nSte 200\nMinneapolis, MN 55401\nUSA') in page_data['fields']
+        assert page_data['tables'][0]['headers'] == ['filing history', 'filing date']
+        assert page_data['tables'][0]['rows'][1] == ['Annual Renewal', '']
+
+    def test_parse_details_html_inline_markup(self):
+        """Test that inline tags don't split a value into lines (only <br> does)."""
+        html = """<html><body><h2>North <b>Star</b> Widgets LLC</h2><dl>
+            <dt>Registered Agent(s)</dt><dd>Jane <span>Q.</span> <b>Doe</b></dd>
+            <dt>Principal Executive Office Address</dt>
+            <dd><a href="#">500 Oak Ave</a><br>St. Paul, <abbr>MN</abbr> 55101</dd>
+        </dl></body></html>"""
+        page_data = parse_details_html(html)
+        assert page_data['heading'] == "North Star Widgets LLC"
+        assert ('registered agent(s)', 'Jane Q. Doe') in page_data['fields']
+        assert ('principal executive office address',
+                '500 Oak Ave\nSt. Paul, MN 55101') in page_data['fields']
+
+    def test_read_details_page_uses_page_html(self, scraper):
+        """Test that a live page is read with a single content() call."""
+        import asyncio
+
+        class FakePage:
+            calls = 0
+
+            async def content(self):
+                self.calls += 1
+                return SAMPLE_DETAILS_HTML
+
+        page = FakePage()
+        fields, tables = asyncio.run(scraper.read_details_page(page))
+        assert page.calls == 1
+        assert ('mn statute', '322C') in fields
+        assert tables[0]['headers'] == ['filing history', 'filing date']
+
+    def test_fetch_details_from_results_over_http(self, scraper):
+        """Test that a results page's details link is fetched without the browser."""
+        import asyncio
+
+        class FakeResponse:
+            ok = True
+
+            async def text(self):
+                return SAMPLE_DETAILS_HTML
+
+        class FakeRequest:
+            urls = []
+
+            async def get(self, url):
+                self.urls.append(url)
+                return FakeResponse()
+
+        class FakePage:
+            context = type('Context', (), {'request': FakeRequest()})()
+
+            async def evaluate(self, js):
+                return 'https://example.test/Business/SearchDetails?filingGuid=abc'
+
+        page = FakePage()
+        data = asyncio.run(scraper.fetch_details_from_results(1234, 'From Results', page))
+        assert page.context.request.urls == [
+            'https://example.test/Business/SearchDetails?filingGuid=abc'
+        ]
+        assert data['file_number'] == 1234
+        assert data['business_name'] == 'From Results'
+        assert data['mn_statute'] == '322C'
+
+    def test_build_business_record(self, scraper):
+        """Test that parsed page contents map onto the CSV columns."""
+        page_data = parse_details_html(SAMPLE_DETAILS_HTML)
+        data = scraper.build_business_record(
+            'abc-guid', page_data['heading'], page_data['fields'], page_data['tables']
+        )
+        assert list(data) == scraper.columns
+        assert data['business_name'] == "North Star Widgets LLC"
+        assert data['mn_statute'] == "322C"
+        assert data['filing_date'] == "2024-01-15"
+        assert data['reg_office_street_number'] == "123"
+        assert data['reg_office_street_direction'] == "NE"
+        assert data['reg_office_unit'] == "Ste 200"
+        assert data['reg_office_zip'] == "55401"
+        assert data['filing_history'] == (
+            "Original Filing - LLC | 01/15/2024 ;; Annual Renewal"
+        )
+
+    def test_label_field(self):
+        """Test exact, colon-suffixed, partial, and unknown labels."""
+        assert label_field('business type') == 'business_type'
+        assert label_field('mn statute:') == 'mn_statute'
+        assert label_field('registered agent(s)') == 'registered_agent_name'
+        assert label_field('original filing date') == 'filing_date'
+        assert label_field('file number') is None
+
+    def test_llc_corp_name_filter(self):
+        """Test the LLC/corporation name filter used on name search results."""
+        for name in ('North Star LLC', 'Acme l.l.c.', 'Widget Corporation',
+                     'Gopher Corp.', 'Lakes Inc', 'Twin Cities Incorporated'):
+            assert LLC_CORP_NAME_RE.search(name), name
+        assert not LLC_CORP_NAME_RE.search("Joe's Bakery")
+
+    def test_parse_search_results_html(self):
+        """Test reading hits, misses, and unexpected pages from search HTML."""
+        hit = """<html><body><table><tbody><tr>
+            <td><strong>North Star Widgets LLC</strong></td>
+            <td><a href="/Business/SearchDetails?filingGuid=abc">Details</a></td>
+        </tr></tbody></table></body></html>"""
+        assert parse_search_results_html(hit) == (
+            True, "North Star Widgets LLC", "/Business/SearchDetails?filingGuid=abc"
+        )
+
+        miss = "<html><body><p>No results found.</p></body></html>"
+        assert parse_search_results_html(miss) == (False, '', '')
+
+        error = "<html><body><h1>Server Error</h1></body></html>"
+        assert parse_search_results_html(error) == (None, '', '')
+
+    def test_parse_name_search_results_html(self):
+        """Test reading name search rows, limits, misses, and unexpected pages."""
+        page = """<html><body><table class="table"><tbody>
+            <tr><td><strong>North Star LLC</strong></td><td>Active</td>
+                <td><a href="/Business/SearchDetails?filingGuid=abc-123">Details</a></td></tr>
+            <tr><td>Gopher  Corp</td><td>Inactive</td></tr>
+            <tr><td><strong>Third Inc</strong></td><td>Active</td>
+                <td><a href="/Business/SearchDetails?filingGuid=def-456">Details</a></td></tr>
+        </tbody></table></body></html>"""
+        assert parse_name_search_results_html(page, max_results=2) == [
+            {'business_name': 'North Star LLC', 'guid': 'abc-123', 'cell_count': 3},
+            {'business_name': 'Gopher Corp', 'guid': None, 'cell_count': 2},
+        ]
+        assert len(parse_name_search_results_html(page)) == 3
+        assert [row['business_name'] for row in
+                parse_name_search_results_html(page, keywords=['CORP', 'INC'])] == [
+            'Gopher Corp', 'Third Inc',
+        ]
+
+        miss = "<html><body><p>No results found.</p></body></html>"
+        assert parse_name_search_results_html(miss) == []
+
+        error = "<html><body><h1>Server Error</h1></body></html>"
+        assert parse_name_search_results_html(error) is None
+
+    def test_guid_from_href(self):
+        """Test that the GUID stops at the next query parameter."""
+        assert guid_from_href('/Business/SearchDetails?filingGuid=abc-123') == 'abc-123'
+        assert guid_from_href('/Business/SearchDetails?filingGuid=abc-123&x=1') == 'abc-123'
+        assert guid_from_href('/Business/SearchDetails') is None
+
 
 # =============================================================================
 # SCRAPER CLASS TESTS
@@ -258,6 +487,22 @@ class TestMNBusinessScraper:
         loaded = scraper.load_progress()
         assert loaded == 2500
 
+    def test_save_progress_is_atomic_and_skips_repeats(self, mock_config):
+        """Test that progress is renamed into place and not rewritten needlessly."""
+        scraper = MNBusinessScraper()
+        scraper.save_progress(3000)
+
+        tmp_file = Path(str(scraper.progress_file) + '.tmp')
+        assert not tmp_file.exists()
+
+        # Same number again: the file shouldn't be touched
+        scraper.progress_file.write_text('{"last_file_number": 1}')
+        scraper.save_progress(3000)
+        assert scraper.load_progress() == 1
+
+        scraper.save_progress(3001)
+        assert scraper.load_progress() == 3001
+
     def test_load_progress_no_file(self, mock_config):
         """Test loading progress when no file exists."""
         scraper = MNBusinessScraper(start_number=1000)
@@ -287,6 +532,471 @@ class TestMNBusinessScraper:
         assert df.iloc[0]['file_number'] == 12345
         assert df.iloc[0]['business_name'] == 'Test Business LLC'
 
+    def test_queue_csv_row_writes_in_batches(self, mock_config, monkeypatch):
+        """Test that queued rows are only written once the buffer fills up."""
+        import config
+        monkeypatch.setattr(config, 'CSV_FLUSH_EVERY', 3)
+
+        scraper = MNBusinessScraper()
+        scraper.init_csv()
+
+        scraper.queue_csv_row({'file_number': 1, 'business_name': 'One'})
+        scraper.queue_csv_row({'file_number': 2, 'business_name': 'Two'})
+        assert len(pd.read_csv(scraper.output_file)) == 0
+
+        scraper.queue_csv_row({'file_number': 3, 'business_name': 'Three'})
+        df = pd.read_csv(scraper.output_file)
+        assert list(df['file_number']) == [1, 2, 3]
+
+    def test_queue_csv_row_flushes_after_timeout(self, mock_config, monkeypatch):
+        """Test that a queued row is written once CSV_FLUSH_SECONDS have passed."""
+        import config
+        monkeypatch.setattr(config, 'CSV_FLUSH_EVERY', 100)
+        monkeypatch.setattr(config, 'CSV_FLUSH_SECONDS', 0)
+
+        scraper = MNBusinessScraper()
+        scraper.init_csv()
+        scraper.queue_csv_row({'file_number': 1, 'business_name': 'One'})
+        assert list(pd.read_csv(scraper.output_file)['file_number']) == [1]
+        scraper.close_csv()
+
+    def test_csv_file_stays_open_between_flushes(self, mock_config):
+        """Test that the output file is opened once and closed by close_csv()."""
+        scraper = MNBusinessScraper()
+        scraper.init_csv()
+
+        scraper.append_to_csv({'file_number': 1, 'business_name': 'One'})
+        handle = scraper._csv_file
+        scraper.append_to_csv({'file_number': 2, 'business_name': 'Two'})
+        assert scraper._csv_file is handle
+        # Flushed rows are readable while the file is still open
+        assert list(pd.read_csv(scraper.output_file)['file_number']) == [1, 2]
+
+        scraper.queue_csv_row({'file_number': 3, 'business_name': 'Three'})
+        scraper.close_csv()
+        assert handle.closed
+        assert list(pd.read_csv(scraper.output_file)['file_number']) == [1, 2, 3]
+
+    def test_append_to_compressed_csv(self, mock_config, monkeypatch):
+        """Test that gzip output can be created, appended to, and read back."""
+        import config
+        monkeypatch.setattr(config, 'COMPRESS_OUTPUT', True)
+
+        scraper = MNBusinessScraper()
+        assert scraper.output_file.name == 'test_businesses.csv.gz'
+        scraper.init_csv()
+        scraper.append_to_csv({'file_number': 1, 'business_name': 'First LLC'})
+        scraper.append_to_csv({'file_number': 2, 'business_name': 'Second LLC'})
+
+        df = pd.read_csv(scraper.output_file)
+        assert list(df['business_name']) == ['First LLC', 'Second LLC']
+
+    def test_scrape_date_is_today_and_cached(self, mock_config):
+        """Test that the scraped_at date is today's date and is cached."""
+        from datetime import datetime
+
+        scraper = MNBusinessScraper()
+        today = scraper._scrape_date()
+        assert today == datetime.now().strftime('%Y-%m-%d')
+
+        # Second call should reuse the cached value until midnight
+        expires = scraper._today_expires
+        assert scraper._scrape_date() == today
+        assert scraper._today_expires == expires
+
+    def test_add_delay_is_shorter_after_a_miss(self, mock_config, monkeypatch):
+        """Test that misses only wait a fraction of the normal delay."""
+        import asyncio
+        import config
+        import mn_scraper
+        monkeypatch.setattr(config, 'REQUEST_DELAY', 1.0)
+        monkeypatch.setattr(config, 'MISS_DELAY_FACTOR', 0.2)
+
+        scraper = MNBusinessScraper()
+        scraper._jitters = [0.0]
+
+        slept = []
+
+        async def fake_sleep(seconds):
+            slept.append(seconds)
+
+        monkeypatch.setattr(mn_scraper.asyncio, 'sleep', fake_sleep)
+        asyncio.run(scraper.add_delay('hit'))
+        asyncio.run(scraper.add_delay('miss'))
+        assert slept == [1.0, 0.2]
+
+    def test_search_outcome_read_in_one_call(self, monkeypatch):
+        """Test that a search's hit/miss is decided by one evaluate() call."""
+        import asyncio
+        import config
+        monkeypatch.setattr(config, 'DIRECT_DETAILS_LOOKUP', False)
+
+        class FakeLocator:
+            first = property(lambda self: self)
+
+            def or_(self, other):
+                return self
+
+            async def wait_for(self, timeout=None):
+                pass
+
+        class FakePage:
+            url = 'https://mblsportal.sos.mn.gov/Business/BusinessSearch'
+
+            def __init__(self, outcome):
+                self.outcome = outcome
+                self.evaluations = 0
+
+            def locator(self, selector):
+                return FakeLocator()
+
+            async def evaluate(self, js):
+                self.evaluations += 1
+                return self.outcome
+
+        async def submitted(page, file_number):
+            return True
+
+        scraper = MNBusinessScraper()
+        monkeypatch.setattr(scraper, '_submit_from_current_page', submitted)
+
+        hit = FakePage({'details': True, 'name': 'North Star LLC', 'noResults': False})
+        miss = FakePage({'details': False, 'name': '', 'noResults': True})
+        assert asyncio.run(scraper.search_by_file_number(1, hit, open_details=False)) == (
+            True, 'North Star LLC'
+        )
+        assert asyncio.run(scraper.search_by_file_number(2, miss)) == (False, '')
+        assert hit.evaluations == miss.evaluations == 1
+
+    def test_unneeded_resources_are_blocked(self):
+        """Test that images/beacons are aborted but documents and scripts load."""
+        import asyncio
+
+        from mn_scraper import block_unneeded_resources
+
+        class FakeRoute:
+            def __init__(self, resource_type, url='https://mblsportal.sos.mn.gov/'):
+                self.request = type('Request', (), {
+                    'resource_type': resource_type, 'url': url,
+                })()
+                self.outcome = None
+
+            async def abort(self):
+                self.outcome = 'abort'
+
+            async def continue_(self):
+                self.outcome = 'continue'
+
+        outcomes = {}
+        for resource_type in ('image', 'stylesheet', 'other', 'document', 'script', 'xhr'):
+            route = FakeRoute(resource_type)
+            asyncio.run(block_unneeded_resources(route))
+            outcomes[resource_type] = route.outcome
+
+        analytics = FakeRoute('script', 'https://www.google-analytics.com/analytics.js')
+        asyncio.run(block_unneeded_resources(analytics))
+        outcomes['analytics'] = analytics.outcome
+
+        assert outcomes == {
+            'image': 'abort', 'stylesheet': 'abort', 'other': 'abort',
+            'document': 'continue', 'script': 'continue', 'xhr': 'continue',
+            'analytics': 'abort',
+        }
+
+    def test_session_state_is_saved_and_reused(self, tmp_path, monkeypatch):
+        """Test that close() saves cookies and new contexts load them."""
+        import asyncio
+        import config
+        state_file = str(tmp_path / 'storage_state.json')
+        monkeypatch.setattr(config, 'STORAGE_STATE_FILE', state_file)
+        monkeypatch.setattr(config, 'BLOCK_RESOURCES', False)
+
+        class FakeContext:
+            async def set_extra_http_headers(self, headers):
+                pass
+
+            async def new_page(self):
+                return type('Page', (), {'set_default_timeout': lambda self, ms: None})()
+
+            async def storage_state(self, path=None):
+                return {'cookies': []}
+
+        class FakeBrowser:
+            def __init__(self):
+                self.storage_states = []
+
+            async def new_context(self, **kwargs):
+                self.storage_states.append(kwargs['storage_state'])
+                return FakeContext()
+
+            async def close(self):
+                pass
+
+        async def two_runs():
+            scraper = MNBusinessScraper()
+            scraper.browser = FakeBrowser()
+            scraper.context, _ = await scraper.new_context_page()
+            await scraper.close()
+            await scraper.new_context_page()
+            return scraper.browser.storage_states
+
+        # First context: nothing saved yet. After close(), the file is used.
+        assert asyncio.run(two_runs()) == [None, state_file]
+        # Written via a temporary file that was renamed into place
+        assert json.loads(Path(state_file).read_text()) == {'cookies': []}
+        assert [p.name for p in tmp_path.iterdir()] == ['storage_state.json']
+
+    def test_page_context_is_rotated(self, mock_config, monkeypatch):
+        """Test that a pool page gets a fresh context after enough uses."""
+        import asyncio
+        import config
+        monkeypatch.setattr(config, 'CONTEXT_ROTATE_EVERY', 2)
+
+        class FakeContext:
+            closed = False
+
+            async def close(self):
+                self.closed = True
+
+        class FakePage:
+            def __init__(self):
+                self.context = FakeContext()
+
+        scraper = MNBusinessScraper()
+        old_page, new_page = FakePage(), FakePage()
+
+        async def fake_new_context_page():
+            return new_page.context, new_page
+
+        async def noop(page=None):
+            pass
+
+        monkeypatch.setattr(scraper, 'new_context_page', fake_new_context_page)
+        monkeypatch.setattr(scraper, 'warm_up', noop)
+
+        async def use_pool():
+            scraper.page_pool = asyncio.Queue()
+            scraper.page_pool.put_nowait(old_page)
+            used = []
+            for _ in range(3):
+                page = await scraper._acquire_page()
+                used.append(page)
+                scraper._release_page(page)
+            return used
+
+        assert asyncio.run(use_pool()) == [old_page, old_page, new_page]
+        assert old_page.context.closed
+
+    def test_failed_context_rotation_keeps_page(self, mock_config, monkeypatch):
+        """Test that a page whose rotation fails goes back into the pool."""
+        import asyncio
+        import config
+        from playwright.async_api import Error as PlaywrightError
+        monkeypatch.setattr(config, 'CONTEXT_ROTATE_EVERY', 1)
+
+        scraper = MNBusinessScraper()
+        page = object()
+
+        async def failing_rotate(old_page):
+            raise PlaywrightError("Target page, context or browser has been closed")
+
+        monkeypatch.setattr(scraper, '_rotate_page', failing_rotate)
+
+        async def use_pool():
+            scraper.page_pool = asyncio.Queue()
+            scraper.page_pool.put_nowait(page)
+            used = []
+            for _ in range(3):
+                used.append(await scraper._acquire_page())
+                scraper._release_page(used[-1])
+            return used, scraper.page_pool.qsize()
+
+        assert asyncio.run(asyncio.wait_for(use_pool(), timeout=5)) == ([page] * 3, 1)
+
+    def test_daemon_answers_scrape_commands(self, mock_config, monkeypatch, tmp_path):
+        """Test one request/reply round-trip over the daemon socket."""
+        import asyncio
+        scraper = MNBusinessScraper()
+        socket_path = str(tmp_path / 'scraper.sock')
+
+        async def fake_scrape(file_number):
+            return {'file_number': file_number} if file_number == 1000 else None
+
+        async def noop():
+            pass
+
+        monkeypatch.setattr(scraper, 'initialize', noop)
+        monkeypatch.setattr(scraper, 'close', noop)
+        monkeypatch.setattr(scraper, 'scrape_business', fake_scrape)
+
+        async def ask(line):
+            reader, writer = await asyncio.open_unix_connection(socket_path)
+            writer.write(line)
+            reply = json.loads(await reader.readline())
+            writer.close()
+            return reply
+
+        async def talk_to_daemon():
+            server = asyncio.ensure_future(scraper.serve(socket_path))
+            while not os.path.exists(socket_path):
+                await asyncio.sleep(0.01)
+            replies = [
+                await ask(b'{"op": "scrape", "file_number": 1000}\n'),
+                await ask(b'{"op": "scrape", "file_number": 1001}\n'),
+                await ask(b'not json\n'),
+            ]
+            server.cancel()
+            await asyncio.gather(server, return_exceptions=True)
+            return replies
+
+        found, missing, bad = asyncio.run(talk_to_daemon())
+        assert found == {'ok': True, 'data': {'file_number': 1000}}
+        assert missing == {'ok': True, 'data': None}
+        assert bad['ok'] is False
+        assert not os.path.exists(socket_path)
+
+    def test_run_stops_after_consecutive_misses(self, mock_config, monkeypatch):
+        """Test the main loop with a fake scrape (no browser)."""
+        import asyncio
+        import config
+        monkeypatch.setattr(config, 'MAX_CONSECUTIVE_MISSES', 3)
+        monkeypatch.setattr(config, 'SCRAPE_AHEAD', 4)
+        monkeypatch.setattr(config, 'REQUEST_DELAY', 0)
+        monkeypatch.setattr(config, 'DELAY_JITTER', 0)
+
+        scraper = MNBusinessScraper(start_number=1000)
+        # 1009 is scraped ahead of time but is past the end - must not be saved
+        found = {1000, 1001, 1003, 1009}
+
+        async def fake_scrape(file_number):
+            if file_number > 1006:
+                # Past the end: must be cancelled, not waited for
+                await asyncio.sleep(60)
+            if file_number in found:
+                return {'file_number': file_number, 'business_name': f'Biz {file_number}'}
+            return None
+
+        async def noop():
+            pass
+
+        monkeypatch.setattr(scraper, 'initialize', noop)
+        monkeypatch.setattr(scraper, 'close', noop)
+        monkeypatch.setattr(scraper, 'scrape_business', fake_scrape)
+
+        asyncio.run(asyncio.wait_for(scraper.run(resume=False), timeout=5))
+
+        # 1004, 1005, 1006 are the three misses in a row
+        df = pd.read_csv(scraper.output_file)
+        assert list(df['file_number']) == [1000, 1001, 1003]
+        assert scraper.load_progress() == 1006
+
+    def test_run_gap_jumping(self, mock_config, monkeypatch):
+        """Test that misses widen the step and a jump hit is bisected."""
+        import asyncio
+        import config
+        monkeypatch.setattr(config, 'MAX_CONSECUTIVE_MISSES', 10)
+        monkeypatch.setattr(config, 'SCRAPE_AHEAD', 1)
+        monkeypatch.setattr(config, 'GAP_JUMP_AFTER', 2)
+        monkeypatch.setattr(config, 'GAP_JUMP_MAX', 8)
+        monkeypatch.setattr(config, 'REQUEST_DELAY', 0)
+        monkeypatch.setattr(config, 'DELAY_JITTER', 0)
+
+        scraper = MNBusinessScraper(start_number=1000)
+        found = {1000, 1040, 1041, 1042}
+        probed = []
+
+        async def fake_scrape(file_number):
+            probed.append(file_number)
+            if file_number in found:
+                return {'file_number': file_number, 'business_name': f'Biz {file_number}'}
+            return None
+
+        async def noop():
+            pass
+
+        monkeypatch.setattr(scraper, 'initialize', noop)
+        monkeypatch.setattr(scraper, 'close', noop)
+        monkeypatch.setattr(scraper, 'scrape_business', fake_scrape)
+
+        asyncio.run(asyncio.wait_for(scraper.run(resume=False), timeout=5))
+
+        # Steps 1, 1, 2, 4, 8, 8, ... until 1042 hits; the gap after 1034 is
+        # bisected (1038, 1040, 1039) and scanning restarts at 1040
+        assert probed[:11] == [1000, 1001, 1002, 1003, 1004, 1006, 1010,
+                               1018, 1026, 1034, 1042]
+        assert {1038, 1039} <= set(probed)
+        assert 1020 not in probed
+        df = pd.read_csv(scraper.output_file)
+        assert list(df['file_number']) == [1000, 1040, 1041, 1042]
+
+    def test_run_gap_jumping_scrape_ahead(self, mock_config, monkeypatch):
+        """Test that a hit while jumping rescans one by one with a full window."""
+        import asyncio
+        import config
+        monkeypatch.setattr(config, 'MAX_CONSECUTIVE_MISSES', 10)
+        monkeypatch.setattr(config, 'SCRAPE_AHEAD', 3)
+        monkeypatch.setattr(config, 'GAP_JUMP_AFTER', 2)
+        monkeypatch.setattr(config, 'GAP_JUMP_MAX', 8)
+        monkeypatch.setattr(config, 'REQUEST_DELAY', 0)
+        monkeypatch.setattr(config, 'DELAY_JITTER', 0)
+
+        scraper = MNBusinessScraper(start_number=1000)
+        # Two misses start the jumps while 1003/1004 are already in the
+        # window, so 1006 and 1008 are started 2 apart before 1004 hits
+        found = {1000, 1004, 1005, 1006, 1007, 1009, 1010}
+        probed = []
+
+        async def fake_scrape(file_number):
+            probed.append(file_number)
+            if file_number in found:
+                return {'file_number': file_number, 'business_name': f'Biz {file_number}'}
+            return None
+
+        async def noop():
+            pass
+
+        monkeypatch.setattr(scraper, 'initialize', noop)
+        monkeypatch.setattr(scraper, 'close', noop)
+        monkeypatch.setattr(scraper, 'scrape_business', fake_scrape)
+
+        asyncio.run(asyncio.wait_for(scraper.run(resume=False), timeout=5))
+
+        assert set(range(1000, 1011)) <= set(probed)
+        df = pd.read_csv(scraper.output_file)
+        assert list(df['file_number']) == sorted(found)
+
+    def test_run_saves_progress_while_gap_jumping(self, mock_config, monkeypatch):
+        """Test that progress is saved by numbers handled, not multiples of PROGRESS_EVERY."""
+        import asyncio
+        import config
+        monkeypatch.setattr(config, 'MAX_CONSECUTIVE_MISSES', 10)
+        monkeypatch.setattr(config, 'SCRAPE_AHEAD', 1)
+        monkeypatch.setattr(config, 'GAP_JUMP_AFTER', 1)
+        monkeypatch.setattr(config, 'GAP_JUMP_MAX', 2)
+        monkeypatch.setattr(config, 'PROGRESS_EVERY', 4)
+        monkeypatch.setattr(config, 'REQUEST_DELAY', 0)
+        monkeypatch.setattr(config, 'DELAY_JITTER', 0)
+
+        scraper = MNBusinessScraper(start_number=1001)
+        saved = []
+
+        async def fake_scrape(file_number):
+            return None
+
+        async def noop():
+            pass
+
+        monkeypatch.setattr(scraper, 'initialize', noop)
+        monkeypatch.setattr(scraper, 'close', noop)
+        monkeypatch.setattr(scraper, 'scrape_business', fake_scrape)
+        monkeypatch.setattr(scraper, 'save_progress', saved.append)
+
+        asyncio.run(asyncio.wait_for(scraper.run(resume=False), timeout=5))
+
+        # 1001, 1002, then odd numbers only - none is a multiple of 4, but
+        # every 4th number handled is still saved (plus the final save)
+        assert saved == [1005, 1013, 1017]
+
     def test_columns_defined(self, mock_config):
         """Test that all expected columns are defined."""
         scraper = MNBusinessScraper()
@@ -301,6 +1011,296 @@ class TestMNBusinessScraper:
         assert 'scraped_at' in scraper.columns
 
 
+# =============================================================================
+# PARALLEL SCRAPER TESTS
+# =============================================================================
+
+def test_scrape_range_gap_jumping(tmp_path, monkeypatch):
+    """Test that gap jumps don't skip numbers or jump past the range's end."""
+    import asyncio
+    import json
+    import config
+    import mn_scraper_parallel
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(config, 'SCRAPE_AHEAD', 3)
+    monkeypatch.setattr(config, 'GAP_JUMP_AFTER', 2)
+    monkeypatch.setattr(config, 'GAP_JUMP_MAX', 8)
+    monkeypatch.setattr(config, 'REQUEST_DELAY', 0)
+    monkeypatch.setattr(config, 'DELAY_JITTER', 0)
+
+    # A hit while the window holds jumped scrapes (1004), and businesses
+    # in a gap that the jumps would overshoot at the end of the range
+    found = {1000, 1004, 1005, 1006, 1007, 1009, 1010, 1028, 1029, 1030}
+
+    class FakeScraper(MNBusinessScraper):
+        async def initialize(self):
+            pass
+
+        async def close(self):
+            pass
+
+        async def scrape_business(self, file_number):
+            if file_number in found:
+                return {'file_number': file_number, 'business_name': f'Biz {file_number}'}
+            return None
+
+    monkeypatch.setattr(mn_scraper_parallel, 'MNBusinessScraper', FakeScraper)
+
+    assert asyncio.run(asyncio.wait_for(
+        mn_scraper_parallel.scrape_range(0, 1000, 1030), timeout=5)) == len(found)
+    df = pd.read_csv(tmp_path / 'output' / 'businesses_worker_0.csv')
+    assert sorted(df['file_number']) == sorted(found)
+    with open(tmp_path / 'progress_worker_0.json') as f:
+        assert json.load(f)['last_file_number'] == 1030
+
+
+def test_scrape_range_error_keeps_later_hits(tmp_path, monkeypatch):
+    """Test that one failing file number doesn't drop the businesses after it."""
+    import asyncio
+    import config
+    import mn_scraper_parallel
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(config, 'SCRAPE_AHEAD', 3)
+    monkeypatch.setattr(config, 'GAP_JUMP_AFTER', 0)
+    monkeypatch.setattr(config, 'REQUEST_DELAY', 0)
+    monkeypatch.setattr(config, 'DELAY_JITTER', 0)
+
+    probed = []
+
+    class FakeScraper(MNBusinessScraper):
+        async def initialize(self):
+            pass
+
+        async def close(self):
+            pass
+
+        async def scrape_business(self, file_number):
+            probed.append(file_number)
+            if file_number == 1002:
+                raise ValueError("unexpected page")
+            return {'file_number': file_number, 'business_name': f'Biz {file_number}'}
+
+    # Skip the 5 second pause after the error
+    real_sleep = asyncio.sleep
+
+    async def no_wait(delay, *args):
+        await real_sleep(0)
+
+    monkeypatch.setattr(mn_scraper_parallel, 'MNBusinessScraper', FakeScraper)
+    monkeypatch.setattr(asyncio, 'sleep', no_wait)
+
+    assert asyncio.run(asyncio.wait_for(
+        mn_scraper_parallel.scrape_range(0, 1000, 1005), timeout=5)) == 5
+    df = pd.read_csv(tmp_path / 'output' / 'businesses_worker_0.csv')
+    assert sorted(df['file_number']) == [1000, 1001, 1003, 1004, 1005]
+    # No bisection: #1002 was only tried once
+    assert probed.count(1002) == 1
+
+
+# =============================================================================
+# PLAYWRIGHT PATCH TESTS
+# =============================================================================
+
+def test_disable_playwright_stack_capture(monkeypatch):
+    """Test that the stack-capture switch only affects Playwright's module."""
+    import traceback
+    from playwright._impl import _connection
+    from mn_scraper import disable_playwright_stack_capture
+
+    # monkeypatch restores the real module reference after the test
+    monkeypatch.setattr(_connection, 'traceback', traceback)
+
+    assert disable_playwright_stack_capture() is True
+    assert list(_connection.traceback.extract_stack(limit=10)) == []
+    assert len(traceback.extract_stack(limit=10)) > 0
+
+
+def test_read_search_results_in_one_call():
+    """Test that search result rows are read with a single evaluate_all()."""
+    import asyncio
+    from mn_scraper import read_search_results
+
+    class FakeLocator:
+        calls = 0
+
+        @property
+        def first(self):
+            return self
+
+        def locator(self, selector):
+            return self
+
+        async def evaluate_all(self, js, arg):
+            # The row limit is applied in the browser, like the real script
+            limit, pattern = arg
+            assert pattern is None
+            FakeLocator.calls += 1
+            return [
+                [3, 'North Star LLC', '/Business/SearchDetails?filingGuid=abc-123'],
+                [3, 'No Link Inc', ''],
+                [3, 'Third Corp', '/Business/SearchDetails?filingGuid=def-456'],
+            ][:limit]
+
+    class FakePage:
+        def locator(self, selector):
+            return FakeLocator()
+
+    rows = asyncio.run(read_search_results(FakePage(), max_results=2))
+    assert FakeLocator.calls == 1
+    assert rows == [
+        {'business_name': 'North Star LLC', 'guid': 'abc-123', 'cell_count': 3},
+        {'business_name': 'No Link Inc', 'guid': None, 'cell_count': 3},
+    ]
+
+
+def test_keywords_pattern():
+    """Test that the keyword regex matches any keyword, in any case, literally."""
+    from mn_scraper import keywords_pattern
+
+    pattern = keywords_pattern(('LLC', 'L.L.C.', 'NON-PROFIT'))
+    assert pattern.search('North Star llc')
+    assert pattern.search('Acme L.L.C.')
+    assert pattern.search('Helping Hands Non-Profit')
+    assert not pattern.search('Acme LXLXCX')  # '.' is not a wildcard
+    assert keywords_pattern(('LLC', 'L.L.C.', 'NON-PROFIT')) is pattern  # cached
+
+
+def test_extract_text_in_one_call():
+    """Test that extract_text() reads an element's text with one evaluate()."""
+    import asyncio
+
+    class FakePage:
+        calls = []
+
+        async def evaluate(self, js, selector):
+            FakePage.calls.append(selector)
+            return '  North Star LLC \n' if selector == 'h2' else None
+
+    scraper = MNBusinessScraper.__new__(MNBusinessScraper)
+    page = FakePage()
+    assert asyncio.run(scraper.extract_text('h2', page=page)) == 'North Star LLC'
+    assert asyncio.run(scraper.extract_text('h3', 'none', page=page)) == 'none'
+    assert FakePage.calls == ['h2', 'h3']
+
+
+def test_submit_name_search_reuses_form_on_page():
+    """Test that a name search only loads the search page when there's no form."""
+    import asyncio
+    import contextlib
+    from mn_scraper import submit_name_search
+
+    class FakePage:
+        def __init__(self, has_form):
+            self.has_form = has_form
+            self.calls = []
+
+        def locator(self, selector):
+            page = self
+
+            class Locator:
+                first = None
+
+                async def count(self):
+                    return 1 if page.has_form else 0
+
+                async def click(self):
+                    page.calls.append('click')
+
+                async def wait_for(self, state=None, timeout=None):
+                    pass
+
+                def or_(self, other):
+                    return self
+
+            locator = Locator()
+            locator.first = locator
+            return locator
+
+        async def goto(self, url, wait_until=None):
+            self.calls.append('goto')
+            self.has_form = True
+
+        async def evaluate(self, js):
+            pass
+
+        async def fill(self, selector, value):
+            self.calls.append(f'fill {value}')
+
+        @contextlib.asynccontextmanager
+        async def expect_navigation(self, wait_until=None, timeout=None):
+            yield
+
+    results_page = FakePage(has_form=True)
+    asyncio.run(submit_name_search(results_page, 'ab'))
+    assert results_page.calls == ['fill ab', 'click']
+
+    blank_page = FakePage(has_form=False)
+    asyncio.run(submit_name_search(blank_page, 'aa'))
+    assert blank_page.calls == ['goto', 'fill aa', 'click']
+
+
+def test_wait_for_search_results_tolerates_timeout():
+    """Test that the name search wait uses a locator and doesn't raise on timeout."""
+    import asyncio
+    from playwright.async_api import TimeoutError as PlaywrightTimeout
+    from mn_scraper import wait_for_search_results
+
+    waits = []
+
+    class FakeLocator:
+        def __init__(self, selector):
+            self.selector = selector
+
+        def or_(self, other):
+            return FakeLocator(f"{self.selector} | {other.selector}")
+
+        @property
+        def first(self):
+            return self
+
+        async def wait_for(self, state=None, timeout=None):
+            waits.append(self.selector)
+            raise PlaywrightTimeout("nothing showed up")
+
+    class FakePage:
+        def locator(self, selector):
+            return FakeLocator(selector)
+
+    asyncio.run(wait_for_search_results(FakePage()))
+    assert waits == ['table.table tbody tr | text=/no results|no businesses found/i']
+
+
+def test_retry_delay_backs_off(monkeypatch):
+    """Test that retry waits double after each failure, up to the cap."""
+    import config
+    monkeypatch.setattr(config, 'RETRY_DELAY', 2)
+    monkeypatch.setattr(config, 'RETRY_MAX_DELAY', 10)
+
+    assert 1 <= MNBusinessScraper.retry_delay(0) <= 2
+    assert 4 <= MNBusinessScraper.retry_delay(2) <= 8
+    assert 5 <= MNBusinessScraper.retry_delay(5) <= 10
+
+
+def test_wait_for_detail_slot_spaces_out_fetches(tmp_path, monkeypatch):
+    """Test that concurrent detail fetches start at most DETAIL_RATE per second."""
+    import asyncio
+    import time
+    import config
+    monkeypatch.setattr(config, 'OUTPUT_DIR', str(tmp_path))
+    monkeypatch.setattr(config, 'DETAIL_RATE', 50)
+    scraper = MNBusinessScraper()
+
+    async def start_times():
+        async def fetch():
+            await scraper.wait_for_detail_slot()
+            return time.monotonic()
+        return sorted(await asyncio.gather(*(fetch() for _ in range(4))))
+
+    times = asyncio.run(start_times())
+    # 4 fetches at 50/s: the last starts ~3 x 20ms after the first
+    assert times[-1] - times[0] >= 0.05
+
+
 # =============================================================================
 # EDGE CASE TESTS
 # =============================================================================